@@ -752,18 +752,12 @@ class TaskListViewPermissionTest(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, str(self.task1))
         
-def test_filter_by_invalid_due_date(self):
-    self.client.login(username='task_list_admin', password='password123')
-    response = self.client.get(self.task_list_url, {'due_date': 'invalid'})
-    self.assertEqual(response.status_code, 200)
-    self.assertEqual(len(response.context['tasks']), 3)  # Filter ignores invalid date
-        
-    def test_task_str_rendering(self):
+    def test_filter_by_invalid_due_date(self):
         self.client.login(username='task_list_admin', password='password123')
-        response = self.client.get(self.task_list_url)
+        response = self.client.get(self.task_list_url, {'due_date': 'invalid'})
         self.assertEqual(response.status_code, 200)
-        self.assertContains(response, str(self.task1))
-        
+        self.assertEqual(len(response.context['tasks']), 3)  # Filter ignores invalid date
+
 class TaskDetailViewTest(TestCase):
 
     @classmethod
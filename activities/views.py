@@ -5,11 +5,10 @@ from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.db.models import Q, Sum, Count, F, DecimalField
 from django.db.models.functions import Coalesce
-from django.http import HttpResponse, HttpResponseForbidden
+from django.http import HttpResponseForbidden
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse, reverse_lazy
 from django.utils import timezone
-from django.utils.timezone import localtime
 from django.views import View
 from django.views.generic import (
     ListView,
@@ -19,8 +18,10 @@ from django.views.generic import (
     DeleteView,
 )
 
-import openpyxl
 
+from core.exports import (
+    EXPORT_CHUNK_SIZE, EXPORT_DATETIME_FORMAT, user_name_lookup, xlsx_export_response,
+)
 from crm_entities.models import Account, Contact, Lead
 from sales_pipeline.models import Deal
 from sales_territories.models import Territory
@@ -114,7 +115,7 @@ class TaskListView(BaseActivityView, ListView):
             'related_to_account',
             'related_to_contact',
             'related_to_lead',
-            'related_to_deal',
+            'related_to_deal__account',
         )
 
     def get_context_data(self, **kwargs):
@@ -146,7 +147,7 @@ class TaskDetailView(BaseActivityView, DetailView):
             'related_to_account',
             'related_to_contact',
             'related_to_lead',
-            'related_to_deal',
+            'related_to_deal__account',
         )
         return self._filter_queryset_by_role(user, queryset)
 
@@ -313,7 +314,7 @@ class CallListView(BaseActivityView, ListView):
             'related_to_account',
             'related_to_contact',
             'related_to_lead',
-            'related_to_deal',
+            'related_to_deal__account',
         )
 
     def get_context_data(self, **kwargs):
@@ -345,7 +346,7 @@ class CallDetailView(BaseActivityView, DetailView):
             'related_to_account',
             'related_to_contact',
             'related_to_lead',
-            'related_to_deal',
+            'related_to_deal__account',
         )
         return self._filter_queryset_by_role(user, queryset)
 
@@ -512,7 +513,7 @@ class MeetingListView(BaseActivityView, ListView):
             'related_to_account',
             'related_to_contact',
             'related_to_lead',
-            'related_to_deal',
+            'related_to_deal__account',
         )
 
     def get_context_data(self, **kwargs):
@@ -544,7 +545,7 @@ class MeetingDetailView(BaseActivityView, DetailView):
             'related_to_account',
             'related_to_contact',
             'related_to_lead',
-            'related_to_deal',
+            'related_to_deal__account',
         )
         return self._filter_queryset_by_role(user, queryset)
 
@@ -677,10 +678,8 @@ def task_export_view(request):
 
     user = request.user
     base_queryset = Task.objects.all()
-    filter_params = request.GET.copy()
-    for param in ['sort', 'dir', 'page']:
-        filter_params.pop(param, None)
-    filterset = TaskFilter(filter_params, queryset=base_queryset)
+    # Sort/dir/page aren't filter fields; the FilterSet ignores them
+    filterset = TaskFilter(request.GET, queryset=base_queryset)
     queryset = filterset.qs
     sort_by_param = request.GET.get('sort', 'due_date')
     direction_param = request.GET.get('dir', 'asc')
@@ -708,12 +707,20 @@ def task_export_view(request):
         'related_to_account',
         'related_to_contact',
         'related_to_lead',
-        'related_to_deal',
+        'related_to_deal__account',
+    ).only(
+        # Just the columns written below
+        'subject', 'status', 'priority', 'due_date', 'description', 'created_at', 'updated_at',
+        'related_to_account', 'related_to_account__name',
+        'related_to_contact', 'related_to_contact__first_name', 'related_to_contact__last_name',
+        'related_to_lead', 'related_to_lead__first_name', 'related_to_lead__last_name',
+        # Deal.__str__ reads deal_id, name and account.name
+        'related_to_deal', 'related_to_deal__deal_id', 'related_to_deal__name',
+        'related_to_deal__account', 'related_to_deal__account__name',
+        'assigned_to', 'assigned_to__first_name', 'assigned_to__last_name', 'assigned_to__username',
+        'created_by', 'created_by__first_name', 'created_by__last_name', 'created_by__username',
     )
 
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "Tasks"
     headers = [
         "ID",
         "Subject",
@@ -730,61 +737,51 @@ def task_export_view(request):
         "Created At",
         "Updated At",
     ]
-    ws.append(headers)
-    for task in queryset:
-        assigned_to_name = (
-            task.assigned_to.get_full_name() or
-            task.assigned_to.username if task.assigned_to else ""
-        )
-        created_by_name = (
-            task.created_by.get_full_name() or
-            task.created_by.username if task.created_by else ""
-        )
-        created_at_formatted = (
-            localtime(task.created_at).strftime('%Y-%m-%d %H:%M:%S')
-            if task.created_at else ""
-        )
-        updated_at_formatted = (
-            localtime(task.updated_at).strftime('%Y-%m-%d %H:%M:%S')
-            if task.updated_at else ""
-        )
-        related_account = (
-            task.related_to_account.name if task.related_to_account else ""
-        )
-        related_contact = (
-            task.related_to_contact.full_name
-            if task.related_to_contact else ""
-        )
-        related_lead = (
-            task.related_to_lead.full_name if task.related_to_lead else ""
-        )
-        related_deal = str(task.related_to_deal) if task.related_to_deal else ""
-        row = [
-            task.pk,
-            task.subject or "",
-            task.get_status_display(),
-            task.get_priority_display(),
-            task.due_date,
-            related_account,
-            related_contact,
-            related_lead,
-            related_deal,
-            task.description or "",
-            assigned_to_name,
-            created_by_name,
-            created_at_formatted,
-            updated_at_formatted,
-        ]
-        ws.append(row)
-
-    response = HttpResponse(
-        content_type=(
-            'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-        ),
-    )
-    response['Content-Disposition'] = 'attachment; filename="tasks_export.xlsx"'
-    wb.save(response)
-    return response
+    tz = timezone.get_current_timezone()
+    name_of = user_name_lookup()
+
+    def rows():
+        for task in queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            assigned_to_name = name_of(task.assigned_to)
+            created_by_name = name_of(task.created_by)
+            created_at_formatted = (
+                task.created_at.astimezone(tz).strftime(EXPORT_DATETIME_FORMAT)
+                if task.created_at else ""
+            )
+            updated_at_formatted = (
+                task.updated_at.astimezone(tz).strftime(EXPORT_DATETIME_FORMAT)
+                if task.updated_at else ""
+            )
+            related_account = (
+                task.related_to_account.name if task.related_to_account else ""
+            )
+            related_contact = (
+                task.related_to_contact.full_name
+                if task.related_to_contact else ""
+            )
+            related_lead = (
+                task.related_to_lead.full_name if task.related_to_lead else ""
+            )
+            related_deal = str(task.related_to_deal) if task.related_to_deal else ""
+            row = [
+                task.pk,
+                task.subject or "",
+                task.get_status_display(),
+                task.get_priority_display(),
+                task.due_date,
+                related_account,
+                related_contact,
+                related_lead,
+                related_deal,
+                task.description or "",
+                assigned_to_name,
+                created_by_name,
+                created_at_formatted,
+                updated_at_formatted,
+            ]
+            yield row
+
+    return xlsx_export_response("Tasks", headers, rows(), 'tasks_export.xlsx', date_columns=(4,))
 
 
 @login_required
@@ -794,10 +791,8 @@ def call_export_view(request):
 
     user = request.user
     base_queryset = Call.objects.all()
-    filter_params = request.GET.copy()
-    for param in ['sort', 'dir', 'page']:
-        filter_params.pop(param, None)
-    filterset = CallFilter(filter_params, queryset=base_queryset)
+    # Sort/dir/page aren't filter fields; the FilterSet ignores them
+    filterset = CallFilter(request.GET, queryset=base_queryset)
     queryset = filterset.qs
     sort_by_param = request.GET.get('sort', '-call_time')
     direction_param = request.GET.get('dir', 'desc')
@@ -825,12 +820,21 @@ def call_export_view(request):
         'related_to_account',
         'related_to_contact',
         'related_to_lead',
-        'related_to_deal',
+        'related_to_deal__account',
+    ).only(
+        # Just the columns written below
+        'subject', 'call_time', 'duration_minutes', 'direction', 'status', 'notes',
+        'created_at', 'updated_at',
+        'related_to_account', 'related_to_account__name',
+        'related_to_contact', 'related_to_contact__first_name', 'related_to_contact__last_name',
+        'related_to_lead', 'related_to_lead__first_name', 'related_to_lead__last_name',
+        # Deal.__str__ reads deal_id, name and account.name
+        'related_to_deal', 'related_to_deal__deal_id', 'related_to_deal__name',
+        'related_to_deal__account', 'related_to_deal__account__name',
+        'assigned_to', 'assigned_to__first_name', 'assigned_to__last_name', 'assigned_to__username',
+        'created_by', 'created_by__first_name', 'created_by__last_name', 'created_by__username',
     )
 
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "Calls"
     headers = [
         "ID",
         "Subject",
@@ -848,66 +852,56 @@ def call_export_view(request):
         "Created At",
         "Updated At",
     ]
-    ws.append(headers)
-    for call in queryset:
-        assigned_to_name = (
-            call.assigned_to.get_full_name() or
-            call.assigned_to.username if call.assigned_to else ""
-        )
-        created_by_name = (
-            call.created_by.get_full_name() or
-            call.created_by.username if call.created_by else ""
-        )
-        created_at_formatted = (
-            localtime(call.created_at).strftime('%Y-%m-%d %H:%M:%S')
-            if call.created_at else ""
-        )
-        updated_at_formatted = (
-            localtime(call.updated_at).strftime('%Y-%m-%d %H:%M:%S')
-            if call.updated_at else ""
-        )
-        call_time_formatted = (
-            localtime(call.call_time).strftime('%Y-%m-%d %H:%M:%S')
-            if call.call_time else ""
-        )
-        related_account = (
-            call.related_to_account.name if call.related_to_account else ""
-        )
-        related_contact = (
-            call.related_to_contact.full_name
-            if call.related_to_contact else ""
-        )
-        related_lead = (
-            call.related_to_lead.full_name if call.related_to_lead else ""
-        )
-        related_deal = str(call.related_to_deal) if call.related_to_deal else ""
-        row = [
-            call.pk,
-            call.subject or "",
-            call_time_formatted,
-            call.duration_minutes,
-            call.get_direction_display(),
-            call.get_status_display(),
-            related_account,
-            related_contact,
-            related_lead,
-            related_deal,
-            call.notes or "",
-            assigned_to_name,
-            created_by_name,
-            created_at_formatted,
-            updated_at_formatted,
-        ]
-        ws.append(row)
-
-    response = HttpResponse(
-        content_type=(
-            'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-        ),
-    )
-    response['Content-Disposition'] = 'attachment; filename="calls_export.xlsx"'
-    wb.save(response)
-    return response
+    tz = timezone.get_current_timezone()
+    name_of = user_name_lookup()
+
+    def rows():
+        for call in queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            assigned_to_name = name_of(call.assigned_to)
+            created_by_name = name_of(call.created_by)
+            created_at_formatted = (
+                call.created_at.astimezone(tz).strftime(EXPORT_DATETIME_FORMAT)
+                if call.created_at else ""
+            )
+            updated_at_formatted = (
+                call.updated_at.astimezone(tz).strftime(EXPORT_DATETIME_FORMAT)
+                if call.updated_at else ""
+            )
+            call_time_formatted = (
+                call.call_time.astimezone(tz).strftime(EXPORT_DATETIME_FORMAT)
+                if call.call_time else ""
+            )
+            related_account = (
+                call.related_to_account.name if call.related_to_account else ""
+            )
+            related_contact = (
+                call.related_to_contact.full_name
+                if call.related_to_contact else ""
+            )
+            related_lead = (
+                call.related_to_lead.full_name if call.related_to_lead else ""
+            )
+            related_deal = str(call.related_to_deal) if call.related_to_deal else ""
+            row = [
+                call.pk,
+                call.subject or "",
+                call_time_formatted,
+                call.duration_minutes,
+                call.get_direction_display(),
+                call.get_status_display(),
+                related_account,
+                related_contact,
+                related_lead,
+                related_deal,
+                call.notes or "",
+                assigned_to_name,
+                created_by_name,
+                created_at_formatted,
+                updated_at_formatted,
+            ]
+            yield row
+
+    return xlsx_export_response("Calls", headers, rows(), 'calls_export.xlsx')
 
 
 @login_required
@@ -917,10 +911,8 @@ def meeting_export_view(request):
 
     user = request.user
     base_queryset = Meeting.objects.all()
-    filter_params = request.GET.copy()
-    for param in ['sort', 'dir', 'page']:
-        filter_params.pop(param, None)
-    filterset = MeetingFilter(filter_params, queryset=base_queryset)
+    # Sort/dir/page aren't filter fields; the FilterSet ignores them
+    filterset = MeetingFilter(request.GET, queryset=base_queryset)
     queryset = filterset.qs
     sort_by_param = request.GET.get('sort', '-start_time')
     direction_param = request.GET.get('dir', 'desc')
@@ -948,12 +940,21 @@ def meeting_export_view(request):
         'related_to_account',
         'related_to_contact',
         'related_to_lead',
-        'related_to_deal',
+        'related_to_deal__account',
+    ).only(
+        # Just the columns written below
+        'subject', 'start_time', 'end_time', 'location', 'status', 'description',
+        'created_at', 'updated_at',
+        'related_to_account', 'related_to_account__name',
+        'related_to_contact', 'related_to_contact__first_name', 'related_to_contact__last_name',
+        'related_to_lead', 'related_to_lead__first_name', 'related_to_lead__last_name',
+        # Deal.__str__ reads deal_id, name and account.name
+        'related_to_deal', 'related_to_deal__deal_id', 'related_to_deal__name',
+        'related_to_deal__account', 'related_to_deal__account__name',
+        'assigned_to', 'assigned_to__first_name', 'assigned_to__last_name', 'assigned_to__username',
+        'created_by', 'created_by__first_name', 'created_by__last_name', 'created_by__username',
     )
 
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "Meetings"
     headers = [
         "ID",
         "Subject",
@@ -971,70 +972,60 @@ def meeting_export_view(request):
         "Created At",
         "Updated At",
     ]
-    ws.append(headers)
-    for meeting in queryset:
-        assigned_to_name = (
-            meeting.assigned_to.get_full_name() or
-            meeting.assigned_to.username if meeting.assigned_to else ""
-        )
-        created_by_name = (
-            meeting.created_by.get_full_name() or
-            meeting.created_by.username if meeting.created_by else ""
-        )
-        created_at_formatted = (
-            localtime(meeting.created_at).strftime('%Y-%m-%d %H:%M:%S')
-            if meeting.created_at else ""
-        )
-        updated_at_formatted = (
-            localtime(meeting.updated_at).strftime('%Y-%m-%d %H:%M:%S')
-            if meeting.updated_at else ""
-        )
-        start_time_formatted = (
-            localtime(meeting.start_time).strftime('%Y-%m-%d %H:%M:%S')
-            if meeting.start_time else ""
-        )
-        end_time_formatted = (
-            localtime(meeting.end_time).strftime('%Y-%m-%d %H:%M:%S')
-            if meeting.end_time else ""
-        )
-        related_account = (
-            meeting.related_to_account.name
-            if meeting.related_to_account else ""
-        )
-        related_contact = (
-            meeting.related_to_contact.full_name
-            if meeting.related_to_contact else ""
-        )
-        related_lead = (
-            meeting.related_to_lead.full_name if meeting.related_to_lead else ""
-        )
-        related_deal = (
-            str(meeting.related_to_deal) if meeting.related_to_deal else ""
-        )
-        row = [
-            meeting.pk,
-            meeting.subject or "",
-            start_time_formatted,
-            end_time_formatted,
-            meeting.location or "",
-            meeting.get_status_display(),
-            related_account,
-            related_contact,
-            related_lead,
-            related_deal,
-            meeting.description or "",
-            assigned_to_name,
-            created_by_name,
-            created_at_formatted,
-            updated_at_formatted,
-        ]
-        ws.append(row)
-
-    response = HttpResponse(
-        content_type=(
-            'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-        ),
-    )
-    response['Content-Disposition'] = 'attachment; filename="meetings_export.xlsx"'
-    wb.save(response)
-    return response
\ No newline at end of file
+    tz = timezone.get_current_timezone()
+    name_of = user_name_lookup()
+
+    def rows():
+        for meeting in queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            assigned_to_name = name_of(meeting.assigned_to)
+            created_by_name = name_of(meeting.created_by)
+            created_at_formatted = (
+                meeting.created_at.astimezone(tz).strftime(EXPORT_DATETIME_FORMAT)
+                if meeting.created_at else ""
+            )
+            updated_at_formatted = (
+                meeting.updated_at.astimezone(tz).strftime(EXPORT_DATETIME_FORMAT)
+                if meeting.updated_at else ""
+            )
+            start_time_formatted = (
+                meeting.start_time.astimezone(tz).strftime(EXPORT_DATETIME_FORMAT)
+                if meeting.start_time else ""
+            )
+            end_time_formatted = (
+                meeting.end_time.astimezone(tz).strftime(EXPORT_DATETIME_FORMAT)
+                if meeting.end_time else ""
+            )
+            related_account = (
+                meeting.related_to_account.name
+                if meeting.related_to_account else ""
+            )
+            related_contact = (
+                meeting.related_to_contact.full_name
+                if meeting.related_to_contact else ""
+            )
+            related_lead = (
+                meeting.related_to_lead.full_name if meeting.related_to_lead else ""
+            )
+            related_deal = (
+                str(meeting.related_to_deal) if meeting.related_to_deal else ""
+            )
+            row = [
+                meeting.pk,
+                meeting.subject or "",
+                start_time_formatted,
+                end_time_formatted,
+                meeting.location or "",
+                meeting.get_status_display(),
+                related_account,
+                related_contact,
+                related_lead,
+                related_deal,
+                meeting.description or "",
+                assigned_to_name,
+                created_by_name,
+                created_at_formatted,
+                updated_at_formatted,
+            ]
+            yield row
+
+    return xlsx_export_response("Meetings", headers, rows(), 'meetings_export.xlsx')
@@ -0,0 +1,68 @@
+"""Helpers shared by the XLSX exports of the crm_entities, sales_pipeline and activities apps"""
+import tempfile
+
+from django.db import transaction
+from django.http import FileResponse
+
+import xlsxwriter
+
+XLSX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+# Workbooks are built in memory up to this size and spill to a temp file beyond it
+EXPORT_SPOOL_SIZE = 16 << 20
+EXPORT_CHUNK_SIZE = 2000
+EXPORT_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# constant_memory flushes each row to a temp file as it is written. User data
+# stays plain strings: no formula or hyperlink conversion (the latter is capped per sheet).
+XLSX_WRITER_OPTIONS = {
+    'constant_memory': True,
+    'strings_to_formulas': False,
+    'strings_to_urls': False,
+    'remove_timezone': True,
+    'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+}
+
+
+def user_name_lookup():
+    """
+    Returns name_of(user) -> `get_full_name() or username`, memoized by pk so an
+    export where a few users own most rows builds each name once.
+    """
+    names = {}
+
+    def name_of(user):
+        if user is None:
+            return ""
+        name = names.get(user.pk)
+        if name is None:
+            name = names[user.pk] = user.get_full_name() or user.username
+        return name
+    return name_of
+
+
+def xlsx_export_response(sheet_title, headers, rows, filename, date_columns=()):
+    """
+    Writes rows with xlsxwriter in constant_memory mode into a spooled temp file
+    and streams it back as an XLSX attachment.
+    date_columns are the indexes of DateField values, shown without a time.
+    rows should come from queryset.iterator(), which is consumed inside a
+    transaction here. Keep those querysets to joins and annotations: a
+    prefetch_related would add one prefetch query per chunk.
+    """
+    buffer = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_SIZE)
+    wb = xlsxwriter.Workbook(buffer, XLSX_WRITER_OPTIONS)
+    ws = wb.add_worksheet(sheet_title)
+    date_format = wb.add_format({'num_format': 'yyyy-mm-dd'})
+    ws.write_row(0, 0, headers)
+    # Inside a transaction the chunked iterator's server-side cursor needn't be
+    # WITH HOLD, which would make PostgreSQL materialize the whole result first
+    with transaction.atomic(savepoint=False):
+        for row_number, row in enumerate(rows, start=1):
+            ws.write_row(row_number, 0, row)
+            for column in date_columns:
+                ws.write(row_number, column, row[column], date_format)
+    wb.close()
+    buffer.seek(0)
+    return FileResponse(
+        buffer, as_attachment=True, filename=filename, content_type=XLSX_CONTENT_TYPE,
+    )
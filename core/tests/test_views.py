@@ -63,4 +63,18 @@ class DashboardViewTest(TestCase):
         self.client.login(username='testuser_dashboard', password='password123')
         response = self.client.get(reverse('core:dashboard'))
         self.assertEqual(response.status_code, 200)
-        self.assertContains(response, self.test_user.username)
\ No newline at end of file
+        self.assertContains(response, self.test_user.username)
+
+class BotResponseTest(TestCase):
+    def test_robots_txt_is_cacheable(self):
+        response = self.client.get('/robots.txt')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/plain')
+        self.assertIn(b'Disallow: /admin/', response.content)
+        self.assertIn('max-age=86400', response['Cache-Control'])
+
+    def test_block_bots_is_cacheable(self):
+        # Not covered by StaticFileBlockingMiddleware, so this reaches the block_bots route
+        response = self.client.get('/static/remote-sync.json')
+        self.assertEqual(response.status_code, 204)
+        self.assertIn('public', response['Cache-Control'])
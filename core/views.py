@@ -8,7 +8,6 @@ from django.utils import timezone
 from django.views.generic import TemplateView
 
 from dateutil.relativedelta import relativedelta
-import openpyxl
 
 from activities.models import (
     Task,
@@ -23,6 +22,7 @@ from sales_pipeline.models import Deal, Quote
 from sales_territories.models import Territory
 from users.models import CustomUser
 from django.http import HttpResponse, Http404
+from django.views.decorators.cache import cache_control
 from django.views.decorators.csrf import csrf_exempt
 import re
 
@@ -30,19 +30,25 @@ import re
 def health_check(request):
     return HttpResponse("OK", status=200)
 
+# Bot/robots responses never change; let the CDN/browser keep them for a day
+BOT_RESPONSE_MAX_AGE = 60 * 60 * 24
+
+ROBOTS_TXT = b"""User-agent: *
+Disallow: /static/
+Disallow: /admin/
+Crawl-delay: 10
+"""
+
+@cache_control(public=True, max_age=BOT_RESPONSE_MAX_AGE)
 def block_bots(request):
     """Return 444-like response for bot requests"""
     # Don't log these requests
     return HttpResponse(status=204)  # No Content
 
+@cache_control(public=True, max_age=BOT_RESPONSE_MAX_AGE)
 def robots_txt(request):
     """Serve robots.txt to discourage bots"""
-    content = """User-agent: *
-Disallow: /static/
-Disallow: /admin/
-Crawl-delay: 10
-"""
-    return HttpResponse(content, content_type="text/plain")
+    return HttpResponse(ROBOTS_TXT, content_type="text/plain")
 
 class DashboardView(LoginRequiredMixin, TemplateView):
     template_name = 'dashboard.html'
@@ -362,7 +368,3 @@ class DashboardView(LoginRequiredMixin, TemplateView):
                 context['global_progress_percent'] = global_progress_percent
 
         return context
-
-def block_bots(request):
-    """Return 204 for bot requests"""
-    return HttpResponse(status=204)
\ No newline at end of file
@@ -0,0 +1,43 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+# Autocomplete searches compile to UPPER(col::text) LIKE UPPER('%term%') on
+# PostgreSQL, so the trigram indexes are built over that same expression.
+TRIGRAM_INDEXES = [
+    ('crm_entities_account', 'account_name_trgm', 'name'),
+    ('crm_entities_contact', 'contact_first_name_trgm', 'first_name'),
+    ('crm_entities_contact', 'contact_last_name_trgm', 'last_name'),
+    ('crm_entities_contact', 'contact_email_trgm', 'email'),
+    ('crm_entities_lead', 'lead_first_name_trgm', 'first_name'),
+    ('crm_entities_lead', 'lead_last_name_trgm', 'last_name'),
+    ('crm_entities_lead', 'lead_company_name_trgm', 'company_name'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return  # SQLite (local development) has no GIN/pg_trgm
+    for table, index_name, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {index_name} ON {table} '
+            f'USING gin (UPPER({column}::text) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for _table, index_name, _column in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {index_name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm_entities', '0007_alter_account_status'),
+    ]
+
+    operations = [
+        TrigramExtension(),  # No-op on non-PostgreSQL backends
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,51 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm_entities', '0008_autocomplete_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='account',
+            index=models.Index(fields=['assigned_to', 'name'], name='account_assignee_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='account',
+            index=models.Index(fields=['territory', 'name'], name='account_territory_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='account',
+            index=models.Index(fields=['-updated_at'], name='account_updated_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['assigned_to', 'last_name', 'first_name'], name='contact_assignee_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['-updated_at'], name='contact_updated_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['assigned_to', 'last_name'], name='lead_assignee_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['territory', 'last_name'], name='lead_territory_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(
+                condition=models.Q(('status', 'CONVERTED'), _negated=True),
+                fields=['last_name', 'first_name'],
+                name='lead_open_name_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['-updated_at'], name='lead_updated_at_idx'),
+        ),
+    ]
@@ -1,11 +1,85 @@
+import logging
+
 from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.core.validators import RegexValidator
 from django.db import models
+from django.db.models import Exists, OuterRef, Q, Value
 from django.utils.translation import gettext_lazy as _
 from django.core.validators import URLValidator
 
 AUTH_USER_MODEL = settings.AUTH_USER_MODEL
 
+logger = logging.getLogger(__name__)
+
+
+def _manager_scope(user):
+    """
+    Returns (managed_territory_ids, team_member_ids) for a manager.
+    Memoized on the user instance, which lives for one request, so repeated
+    role checks reuse plain ID lists instead of re-querying.
+    """
+    scope = getattr(user, '_crm_role_scope', None)
+    if scope is None:
+        User = get_user_model()
+        territory_ids = list(user.managed_territories.values_list('pk', flat=True))
+        team_member_ids = list(
+            User.objects.filter(
+                territory_id__in=territory_ids,
+                role=User.Roles.SALES,
+            ).exclude(pk=user.pk).values_list('pk', flat=True)
+        )
+        scope = (territory_ids, team_member_ids)
+        user._crm_role_scope = scope
+    return scope
+
+
+class RoleScopedQuerySet(models.QuerySet):
+    """QuerySet for owned CRM records, scoped to what a given user may see"""
+    territory_lookup = 'territory'
+
+    def _visibility_q(self, user):
+        own_q = Q(assigned_to=user) | Q(created_by=user)
+        if user.is_sales_role:
+            return own_q
+        try:
+            territory_ids, team_member_ids = _manager_scope(user)
+        except Exception:
+            logger.exception("Manager role filter failed for %s", self.model.__name__)
+            return own_q
+        return (
+            own_q |
+            Q(assigned_to__in=team_member_ids) |
+            Q(created_by__in=team_member_ids) |
+            Q(**{f'{self.territory_lookup}__in': territory_ids})
+        )
+
+    def for_user(self, user):
+        if user.is_admin_role:
+            return self.all()
+        if user.is_manager_role or user.is_sales_role:
+            # Every condition is a local FK column or a forward FK join, so rows
+            # can't repeat and no DISTINCT pass is needed
+            return self.filter(self._visibility_q(user))
+        return self.none()
+
+    def with_edit_flag(self, user):
+        """Annotates _user_can_edit so callers can check access without another query"""
+        if user.is_admin_role:
+            can_edit = Value(True)
+        elif user.is_manager_role or user.is_sales_role:
+            can_edit = Exists(
+                self.model.objects.filter(self._visibility_q(user), pk=OuterRef('pk'))
+            )
+        else:
+            can_edit = Value(False)
+        return self.annotate(_user_can_edit=can_edit)
+
+
+class ContactQuerySet(RoleScopedQuerySet):
+    territory_lookup = 'account__territory'
+
+
 class StatusChoices(models.TextChoices):
     ACTIVE = 'ACTIVE', _('Active')
     INACTIVE = 'INACTIVE', _('Inactive')
@@ -80,10 +154,18 @@ class Account(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = RoleScopedQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("Account")
         verbose_name_plural = _("Accounts")
         ordering = ['name']
+        # Match the list views' role filters followed by their default sorts
+        indexes = [
+            models.Index(fields=['assigned_to', 'name'], name='account_assignee_name_idx'),
+            models.Index(fields=['territory', 'name'], name='account_territory_name_idx'),
+            models.Index(fields=['-updated_at'], name='account_updated_at_idx'),
+        ]
 
     def __str__(self):
         return self.name
@@ -172,10 +254,16 @@ class Contact(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ContactQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("Contact")
         verbose_name_plural = _("Contacts")
         ordering = ['account', 'last_name', 'first_name']
+        indexes = [
+            models.Index(fields=['assigned_to', 'last_name', 'first_name'], name='contact_assignee_name_idx'),
+            models.Index(fields=['-updated_at'], name='contact_updated_at_idx'),
+        ]
 
     def __str__(self):
         # Handle cases where first name might be blank
@@ -293,10 +381,23 @@ class Lead(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = RoleScopedQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("Lead")
         verbose_name_plural = _("Leads")
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['assigned_to', 'last_name'], name='lead_assignee_name_idx'),
+            models.Index(fields=['territory', 'last_name'], name='lead_territory_name_idx'),
+            # LeadListView always excludes converted leads
+            models.Index(
+                fields=['last_name', 'first_name'],
+                condition=~Q(status='CONVERTED'),
+                name='lead_open_name_idx',
+            ),
+            models.Index(fields=['-updated_at'], name='lead_updated_at_idx'),
+        ]
 
     def __str__(self):
         # Handle cases where first name might be blank
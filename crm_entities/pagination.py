@@ -0,0 +1,206 @@
+import base64
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+
+def encode_cursor(value, pk, backwards=False):
+    """Packs a row's sort value and pk into an opaque, URL-safe cursor"""
+    if hasattr(value, 'isoformat'):
+        value = value.isoformat()  # Full precision; the filter below parses it back
+    raw = json.dumps([value, pk, backwards]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Returns (value, pk, backwards), or None if the cursor is malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        value, pk, backwards = json.loads(raw)
+    except (ValueError, TypeError):
+        return None
+    return value, pk, bool(backwards)
+
+
+class KeysetPaginationMixin:
+    """
+    ListView mixin adding keyset (cursor) pagination.
+
+    Sorts listed in keyset_sort_fields (non-null local columns) are paged entirely
+    by cursor: each page is read as WHERE (sort, pk) > (last_sort, last_pk) LIMIT n+1,
+    so deep pages cost the same as the first and no COUNT(*) is run. Those pages
+    only get prev/next links (context['cursor_pagination'] is True). Other sorts
+    keep the regular ?page= paginator and never emit cursors.
+    Expects the view to set sort_by_applied / direction_applied in get_queryset
+    and to order by (sort field, pk).
+    """
+    keyset_sort_fields = ()
+    next_cursor = None
+    prev_cursor = None
+
+    def _cursor_for(self, row, backwards=False):
+        return encode_cursor(getattr(row, self.sort_by_applied), row.pk, backwards)
+
+    def _uses_cursor(self):
+        return self.sort_by_applied in self.keyset_sort_fields
+
+    def paginate_queryset(self, queryset, page_size):
+        if not self._uses_cursor():
+            return super().paginate_queryset(queryset, page_size)
+
+        cursor = self.request.GET.get('cursor')
+        position = decode_cursor(cursor) if cursor else None
+        if position is None:
+            # First page (or an unreadable cursor): the queryset's own order, no count
+            rows = list(queryset[:page_size + 1])
+            if len(rows) > page_size:
+                rows = rows[:page_size]
+                self.next_cursor = self._cursor_for(rows[-1])
+            return None, None, rows, self.next_cursor is not None
+
+        value, pk, backwards = position
+        field = self.sort_by_applied
+        # Rows after the cursor in display order; walking backwards flips the comparison
+        op = 'gt' if (self.direction_applied == 'desc') == backwards else 'lt'
+        ordering = (field, 'pk') if op == 'gt' else (f'-{field}', '-pk')
+        rows = list(
+            queryset.filter(
+                Q(**{f'{field}__{op}': value}) | Q(**{field: value, f'pk__{op}': pk})
+            ).order_by(*ordering)[:page_size + 1]
+        )
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if backwards:
+            rows.reverse()
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, True
+
+        if rows:
+            self.next_cursor = self._cursor_for(rows[-1]) if has_next else None
+            self.prev_cursor = self._cursor_for(rows[0], backwards=True) if has_previous else None
+        return None, None, rows, True
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['cursor_pagination'] = self._uses_cursor()
+        context['next_cursor'] = self.next_cursor
+        context['prev_cursor'] = self.prev_cursor
+        return context
+
+
+class EstimatedPage(Page):
+    """Page whose has_next comes from the rows fetched, not from the paginator's count"""
+
+    def __init__(self, object_list, number, paginator, has_more):
+        super().__init__(object_list, number, paginator)
+        self.has_more = has_more
+
+    def has_next(self):
+        return self.has_more
+
+    def end_index(self):
+        return self.start_index() + len(self.object_list) - 1 if self.object_list else 0
+
+
+class EstimatingPaginator(Paginator):
+    """
+    Paginator that avoids an exact COUNT(*) on every list page view.
+
+    Unfiltered querysets over a large PostgreSQL table take the planner's row
+    estimate (pg_class.reltuples; count_is_estimate is then True and pages
+    shouldn't be numbered); small tables are counted exactly. Other counts are
+    cached for count_cache_timeout seconds under count_cache_key.
+
+    Since either may be off, the count only labels pages: page() reads
+    per_page + 1 rows, so whether a page exists and has a next one is decided by
+    the rows themselves, and the count is corrected from what that read saw.
+    """
+    estimate_threshold = 10000
+    count_cache_timeout = 30
+    count_is_estimate = False
+
+    def __init__(self, object_list, per_page, count_cache_key=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_cache_key = count_cache_key
+
+    def _estimated_count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is None or query.where:
+            return None
+        connection = connections[self.object_list.db]
+        if connection.vendor != 'postgresql':
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [self.object_list.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        # reltuples is -1 (never analyzed) or 0 on fresh tables
+        if row is None or row[0] < self.estimate_threshold:
+            return None
+        return row[0]
+
+    @cached_property
+    def count(self):
+        estimate = self._estimated_count()
+        if estimate is not None:
+            self.count_is_estimate = True
+            return estimate
+        if self.count_cache_key is None:
+            return super().count
+        count = cache.get(self.count_cache_key)
+        if count is None:
+            count = super().count
+            cache.set(self.count_cache_key, count, self.count_cache_timeout)
+        return count
+
+    def validate_number(self, number):
+        # Only the page's own rows say whether it exists (see page())
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages['invalid_page'])
+        if number < 1:
+            raise EmptyPage(self.error_messages['min_page'])
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise EmptyPage(self.error_messages['no_results'])
+        has_more = len(rows) > self.per_page
+        seen = bottom + len(rows)
+        # The last page pins down the exact total; otherwise `seen` is a lower bound
+        if not has_more or seen > self.count:
+            self.__dict__['count'] = seen
+            self.count_is_estimate = False
+            self.__dict__.pop('num_pages', None)
+        return EstimatedPage(rows[:self.per_page], number, self, has_more)
+
+
+class EstimatedCountMixin:
+    """
+    ListView mixin that pages with EstimatingPaginator, caching the row count per
+    (model, filter params, user). Expects get_queryset to set self.filterset.
+    """
+    paginator_class = EstimatingPaginator
+
+    def get_paginator(self, queryset, per_page, **kwargs):
+        params = self.filterset.data.urlencode() if self.filterset.data else ''
+        kwargs['count_cache_key'] = 'list-count:{}:{}:{}'.format(
+            queryset.model._meta.label_lower,
+            self.request.user.pk,
+            hashlib.md5(params.encode()).hexdigest(),
+        )
+        return super().get_paginator(queryset, per_page, **kwargs)
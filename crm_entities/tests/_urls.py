@@ -0,0 +1,11 @@
+# crm_entities/tests/_urls.py
+
+from functools import lru_cache
+
+from django.urls import reverse
+
+
+@lru_cache(maxsize=None)
+def url(name, **kwargs):
+    """ Cached reverse() for test modules; the URLconf is fixed for the whole run """
+    return reverse(name, kwargs=kwargs or None)
@@ -0,0 +1,28 @@
+# crm_entities/tests/test_migrations.py
+
+from django.db.migrations.executor import MigrationExecutor
+from django.db.utils import ConnectionHandler
+from django.test import SimpleTestCase, override_settings
+
+
+# The test settings disable migrations (see DisableMigrations); put the real modules back
+@override_settings(MIGRATION_MODULES={})
+class MigrationSmokeTest(SimpleTestCase):
+    """ Replays every migration, RunPython ones included, on a scratch SQLite database """
+
+    def test_all_migrations_apply(self):
+        connection = ConnectionHandler({
+            'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'},
+        })['default']
+        try:
+            executor = MigrationExecutor(connection)
+            targets = executor.loader.graph.leaf_nodes()
+            executor.migrate(targets)
+            self.assertIn(
+                ('crm_entities', '0008_autocomplete_trigram_indexes'),
+                executor.recorder.applied_migrations(),
+            )
+            executor.loader.build_graph()
+            self.assertEqual(executor.migration_plan(targets), [])
+        finally:
+            connection.close()
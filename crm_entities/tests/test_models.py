@@ -98,4 +98,39 @@ class LeadModelTest(TestCase):
         self.assertEqual(lead.source, '')
 
     def test_str_method(self):
-        self.assertEqual(str(self.lead), "Jane Smith")
\ No newline at end of file
+        self.assertEqual(str(self.lead), "Jane Smith")
+
+class RoleScopedQuerySetTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.territory = Territory.objects.create(name="Scope Territory")
+        cls.manager = create_user('scope_manager', role=CustomUser.Roles.MANAGER)
+        cls.sales = create_user('scope_sales')
+        cls.sales.territory = cls.territory
+        cls.sales.save()
+        cls.other = create_user('scope_other')
+        cls.territory.manager = cls.manager
+        cls.territory.save()
+        cls.team_account = Account.objects.create(name="Team Account", assigned_to=cls.sales)
+        cls.territory_account = Account.objects.create(name="Territory Account", territory=cls.territory, assigned_to=cls.other)
+        cls.other_account = Account.objects.create(name="Other Account", assigned_to=cls.other)
+        cls.territory_contact = Contact.objects.create(last_name="Territory", account=cls.territory_account, assigned_to=cls.other)
+        cls.other_contact = Contact.objects.create(last_name="Other", account=cls.other_account, assigned_to=cls.other)
+
+    def test_manager_sees_team_and_territory_records(self):
+        names = set(Account.objects.for_user(self.manager).values_list('name', flat=True))
+        self.assertEqual(names, {"Team Account", "Territory Account"})
+        # Contacts reach the territory through their account
+        self.assertEqual(list(Contact.objects.for_user(self.manager)), [self.territory_contact])
+
+    def test_manager_scope_needs_no_distinct(self):
+        queryset = Contact.objects.for_user(self.manager)
+        self.assertFalse(queryset.query.distinct)
+        self.assertEqual(queryset.count(), len(set(queryset.values_list('pk', flat=True))))
+
+    def test_sales_sees_only_own_records(self):
+        self.assertEqual(list(Account.objects.for_user(self.sales)), [self.team_account])
+
+    def test_with_edit_flag(self):
+        flags = dict(Account.objects.with_edit_flag(self.sales).values_list('name', '_user_can_edit'))
+        self.assertEqual(flags, {"Team Account": True, "Territory Account": False, "Other Account": False})
@@ -1,35 +1,49 @@
 # crm_entities/tests/test_views.py
 
-from django.test import TestCase, Client
-from django.urls import reverse
+from django.core.cache import cache
+from django.test import TestCase, Client, override_settings
 from datetime import date, timedelta
 from users.models import CustomUser
+from users.tests._factories import fast_user
 from sales_territories.models import Territory
 from ..models import Account, Contact, Lead # Use ..models to import from app
+from ..forms import ContactForm, LeadForm
+from ..views import _windowed_rows
 from sales_pipeline.models import Deal
+import csv
+import io
 import json # Import json to parse response content
 import re
 
-# Model Imports
-from users.models import CustomUser
-from sales_territories.models import Territory
-from sales_pipeline.models import Deal # Keep this import
-from ..models import Account, Contact, Lead
+import openpyxl
+
+from ._urls import url
+from django.contrib.auth.models import update_last_login
+from django.contrib.auth.signals import user_logged_in
+
+
+def setUpModule():
+    # None of these tests assert on last_login; skip the extra UPDATE per client.login()
+    user_logged_in.disconnect(update_last_login, dispatch_uid='update_last_login')
+
+
+def tearDownModule():
+    user_logged_in.connect(update_last_login, dispatch_uid='update_last_login')
 
 
 # Helper function - Corrected Default Role
-def create_user(username, password="password123", role=CustomUser.Roles.SALES, territory=None, is_superuser=False):
+def create_user(username, role=CustomUser.Roles.SALES, territory=None, is_superuser=False):
     """ Creates a user with specified role/territory """
-    if is_superuser:
-        # Superuser must have is_staff=True and is_superuser=True
-        return CustomUser.objects.create_superuser(
-            username=username, password=password, email=f"{username}@example.com", role=CustomUser.Roles.ADMIN
-        )
-    else:
-        # Regular user creation
-        return CustomUser.objects.create_user(
-            username=username, password=password, role=role, territory=territory, email=f"{username}@example.com"
-        )
+    user = fast_user(username, role=role, territory=territory, is_superuser=is_superuser)
+    user.save()
+    return user
+
+
+def _session_cookies(user):
+    """ Logs user in on a throwaway client and returns its cookies, for reuse across tests """
+    client = Client()
+    client.force_login(user)
+    return client.cookies
 
 # --- Account List View Tests ---
 class AccountListViewPermissionTest(TestCase):
@@ -37,26 +51,32 @@ class AccountListViewPermissionTest(TestCase):
     @classmethod
     def setUpTestData(cls):
         # Create Territories
-        cls.t1 = Territory.objects.create(name="Acc Test Territory 1")
-        cls.t2 = Territory.objects.create(name="Acc Test Territory 2")
+        cls.t1, cls.t2 = Territory.objects.bulk_create([
+            Territory(name="Acc Test Territory 1"),
+            Territory(name="Acc Test Territory 2"),
+        ])
 
         # Create Users (Using corrected helper, removed no_role_user)
-        cls.admin_user = create_user('acc_test_admin', is_superuser=True) # Will have ADMIN role
-        cls.manager_user = create_user('acc_test_manager', role=CustomUser.Roles.MANAGER)
-        cls.sales_user1 = create_user('acc_test_sales1', role=CustomUser.Roles.SALES, territory=cls.t1)
-        cls.sales_user2 = create_user('acc_test_sales2', role=CustomUser.Roles.SALES, territory=cls.t2)
+        cls.admin_user, cls.manager_user, cls.sales_user1, cls.sales_user2 = CustomUser.objects.bulk_create([
+            fast_user('acc_test_admin', is_superuser=True), # Will have ADMIN role
+            fast_user('acc_test_manager', role=CustomUser.Roles.MANAGER),
+            fast_user('acc_test_sales1', role=CustomUser.Roles.SALES, territory=cls.t1),
+            fast_user('acc_test_sales2', role=CustomUser.Roles.SALES, territory=cls.t2),
+        ])
 
         # Assign manager to territory
         cls.manager_user.managed_territories.add(cls.t1)
 
         # Create Accounts
-        cls.acc1 = Account.objects.create(name="Admin Account Test", created_by=cls.admin_user, assigned_to=cls.admin_user)
-        cls.acc2 = Account.objects.create(name="Manager Account Test", created_by=cls.manager_user, assigned_to=cls.manager_user, territory=cls.t1)
-        cls.acc3 = Account.objects.create(name="Sales1 Account 1 Test (Own)", created_by=cls.sales_user1, assigned_to=cls.sales_user1, territory=cls.t1)
-        cls.acc4 = Account.objects.create(name="Sales1 Account 2 Test (Assigned)", created_by=cls.admin_user, assigned_to=cls.sales_user1, territory=cls.t1)
-        cls.acc5 = Account.objects.create(name="Sales2 Account Test", created_by=cls.sales_user2, assigned_to=cls.sales_user2, territory=cls.t2)
+        cls.acc1, cls.acc2, cls.acc3, cls.acc4, cls.acc5 = Account.objects.bulk_create([
+            Account(name="Admin Account Test", created_by=cls.admin_user, assigned_to=cls.admin_user),
+            Account(name="Manager Account Test", created_by=cls.manager_user, assigned_to=cls.manager_user, territory=cls.t1),
+            Account(name="Sales1 Account 1 Test (Own)", created_by=cls.sales_user1, assigned_to=cls.sales_user1, territory=cls.t1),
+            Account(name="Sales1 Account 2 Test (Assigned)", created_by=cls.admin_user, assigned_to=cls.sales_user1, territory=cls.t1),
+            Account(name="Sales2 Account Test", created_by=cls.sales_user2, assigned_to=cls.sales_user2, territory=cls.t2),
+        ])
 
-        cls.account_list_url = reverse('crm_entities:account-list')
+        cls.account_list_url = url('crm_entities:account-list')
 
     def test_view_url_exists_at_desired_location(self):
         self.client.login(username='acc_test_admin', password='password123')
@@ -77,7 +97,7 @@ class AccountListViewPermissionTest(TestCase):
 
     def test_redirect_if_not_logged_in(self):
         response = self.client.get(self.account_list_url)
-        login_url = reverse('login')
+        login_url = url('login')
         self.assertRedirects(response, f'{login_url}?next={self.account_list_url}')
 
     def test_admin_sees_all_accounts(self):
@@ -132,35 +152,152 @@ class AccountListViewPermissionTest(TestCase):
         self.assertIn(self.acc3.name, account_names)
         self.assertIn(self.acc4.name, account_names)
 
+    def test_list_defers_unrendered_columns(self):
+        self.client.login(username='acc_test_admin', password='password123')
+        response = self.client.get(self.account_list_url)
+        deferred = response.context['accounts'][0].get_deferred_fields()
+        self.assertIn('billing_address', deferred)
+        self.assertIn('shipping_address', deferred)
+        self.assertNotIn('name', deferred)
+        self.assertNotIn('updated_at', deferred)
+
     # Removed test_no_role_user_sees_no_accounts
 
 
+# --- List View Keyset Pagination Tests ---
+class AccountListKeysetPaginationTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = create_user('acc_keyset_admin', is_superuser=True)
+        Account.objects.bulk_create([
+            Account(name=f"Keyset Account {i:02d}", assigned_to=cls.admin_user) for i in range(20)
+        ])
+        cls.account_list_url = url('crm_entities:account-list')
+        cls.admin_cookies = _session_cookies(cls.admin_user)
+
+    def setUp(self):
+        self.client.cookies.update(self.admin_cookies)
+
+    def test_first_page_hands_off_to_cursor(self):
+        response = self.client.get(self.account_list_url)
+        self.assertEqual(len(response.context['accounts']), 15)
+        self.assertIsNotNone(response.context['next_cursor'])
+        self.assertIsNone(response.context['prev_cursor'])
+
+    def test_cursor_sort_renders_only_prev_next(self):
+        first = self.client.get(self.account_list_url)
+        self.assertTrue(first.context['cursor_pagination'])
+        self.assertContains(first, f'href="?cursor={first.context["next_cursor"]}&amp;')
+        self.assertNotContains(first, '?page=')
+
+        second = self.client.get(self.account_list_url, {'cursor': first.context['next_cursor']})
+        self.assertContains(second, f'href="?cursor={second.context["prev_cursor"]}&amp;')
+        self.assertContains(second, '<span class="page-link">Next')  # Disabled on the last page
+        self.assertNotContains(second, '?page=')
+
+    def test_numbered_sort_never_emits_cursors(self):
+        response = self.client.get(self.account_list_url, {'sort': 'status'})
+        self.assertFalse(response.context['cursor_pagination'])
+        self.assertIsNone(response.context['next_cursor'])
+        self.assertContains(response, 'href="?page=2&amp;sort=status')
+        self.assertNotContains(response, '?cursor=')
+
+    def test_cursor_pages_forward_and_back(self):
+        first = self.client.get(self.account_list_url)
+        first_names = [a.name for a in first.context['accounts']]
+
+        second = self.client.get(self.account_list_url, {'cursor': first.context['next_cursor']})
+        self.assertEqual(second.status_code, 200)
+        second_names = [a.name for a in second.context['accounts']]
+        self.assertEqual(second_names, [f"Keyset Account {i:02d}" for i in range(15, 20)])
+        self.assertIsNone(second.context['next_cursor'])
+
+        back = self.client.get(self.account_list_url, {'cursor': second.context['prev_cursor']})
+        self.assertEqual([a.name for a in back.context['accounts']], first_names)
+
+    def test_cursor_respects_descending_sort(self):
+        first = self.client.get(self.account_list_url, {'sort': 'name', 'dir': 'desc'})
+        second = self.client.get(
+            self.account_list_url, {'sort': 'name', 'dir': 'desc', 'cursor': first.context['next_cursor']}
+        )
+        self.assertEqual(
+            [a.name for a in second.context['accounts']], [f"Keyset Account {i:02d}" for i in range(4, -1, -1)]
+        )
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_page_count_is_cached_per_filter(self):
+        cache.clear()
+        # Numbered pages (and so the count) are only used by non-keyset sorts
+        params = {'name': 'Keyset', 'sort': 'status'}
+        self.client.get(self.account_list_url, params)
+        Account.objects.create(name="Keyset Account 99", assigned_to=self.admin_user)
+
+        first = self.client.get(self.account_list_url, params)
+        self.assertEqual(first.context['paginator'].count, 20)  # Cached label
+        other_filter = self.client.get(self.account_list_url, {'name': 'Keyset Account', 'sort': 'status'})
+        self.assertEqual(other_filter.context['paginator'].count, 21)
+
+        # The stale count only labels pages: the last page still shows the new row
+        last = self.client.get(self.account_list_url, {**params, 'page': 2})
+        self.assertIn("Keyset Account 99", [a.name for a in last.context['accounts']])
+        self.assertEqual(last.context['paginator'].count, 21)
+        cache.clear()
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_stale_count_does_not_hide_next_page(self):
+        cache.clear()
+        params = {'name': 'Keyset', 'sort': 'status'}
+        self.client.get(self.account_list_url, params)  # Caches a count of 20: two pages
+        Account.objects.bulk_create([
+            Account(name=f"Keyset Account {i}", assigned_to=self.admin_user) for i in range(20, 31)
+        ])
+
+        second = self.client.get(self.account_list_url, {**params, 'page': 2})
+        self.assertTrue(second.context['page_obj'].has_next())
+        self.assertContains(second, 'href="?page=3&amp;sort=status')
+        third = self.client.get(self.account_list_url, {**params, 'page': 3})
+        self.assertEqual(len(third.context['accounts']), 1)
+        cache.clear()
+
+    def test_invalid_cursor_falls_back_to_first_page(self):
+        response = self.client.get(self.account_list_url, {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['accounts']), 15)
+
+
 # --- Contact List View Tests ---
 class ContactListViewPermissionTest(TestCase):
 
     @classmethod
     def setUpTestData(cls):
         # Users & Territories
-        cls.admin_user = create_user('cont_test_admin', is_superuser=True)
-        cls.manager_user = create_user('cont_test_manager', role=CustomUser.Roles.MANAGER)
         cls.t1 = Territory.objects.create(name="Contact Test Territory 1")
-        cls.sales_user1 = create_user('cont_test_sales1', role=CustomUser.Roles.SALES, territory=cls.t1)
-        cls.sales_user2 = create_user('cont_test_sales2', role=CustomUser.Roles.SALES) # No territory or different one
+        cls.admin_user, cls.manager_user, cls.sales_user1, cls.sales_user2 = CustomUser.objects.bulk_create([
+            fast_user('cont_test_admin', is_superuser=True),
+            fast_user('cont_test_manager', role=CustomUser.Roles.MANAGER),
+            fast_user('cont_test_sales1', role=CustomUser.Roles.SALES, territory=cls.t1),
+            fast_user('cont_test_sales2', role=CustomUser.Roles.SALES), # No territory or different one
+        ])
         cls.manager_user.managed_territories.add(cls.t1)
 
         # Accounts
-        cls.acc_managed = Account.objects.create(name="Managed Acc CTest", territory=cls.t1, assigned_to=cls.manager_user)
-        cls.acc_team = Account.objects.create(name="Team Acc CTest", territory=cls.t1, assigned_to=cls.sales_user1)
-        cls.acc_other = Account.objects.create(name="Other Acc CTest", assigned_to=cls.sales_user2)
+        cls.acc_managed, cls.acc_team, cls.acc_other = Account.objects.bulk_create([
+            Account(name="Managed Acc CTest", territory=cls.t1, assigned_to=cls.manager_user),
+            Account(name="Team Acc CTest", territory=cls.t1, assigned_to=cls.sales_user1),
+            Account(name="Other Acc CTest", assigned_to=cls.sales_user2),
+        ])
 
         # Contacts
-        cls.cont1 = Contact.objects.create(last_name="AdminContactTest", account=cls.acc_other, created_by=cls.admin_user, assigned_to=cls.admin_user)
-        cls.cont2 = Contact.objects.create(last_name="ManagerContactTest", account=cls.acc_managed, created_by=cls.manager_user, assigned_to=cls.manager_user)
-        cls.cont3 = Contact.objects.create(last_name="Sales1Contact1Test", account=cls.acc_team, created_by=cls.sales_user1, assigned_to=cls.sales_user1)
-        cls.cont4 = Contact.objects.create(last_name="Sales1Contact2Test", account=cls.acc_managed, created_by=cls.admin_user, assigned_to=cls.sales_user1)
-        cls.cont5 = Contact.objects.create(last_name="Sales2ContactTest", account=cls.acc_other, created_by=cls.sales_user2, assigned_to=cls.sales_user2)
+        cls.cont1, cls.cont2, cls.cont3, cls.cont4, cls.cont5 = Contact.objects.bulk_create([
+            Contact(last_name="AdminContactTest", account=cls.acc_other, created_by=cls.admin_user, assigned_to=cls.admin_user),
+            Contact(last_name="ManagerContactTest", account=cls.acc_managed, created_by=cls.manager_user, assigned_to=cls.manager_user),
+            Contact(last_name="Sales1Contact1Test", account=cls.acc_team, created_by=cls.sales_user1, assigned_to=cls.sales_user1),
+            Contact(last_name="Sales1Contact2Test", account=cls.acc_managed, created_by=cls.admin_user, assigned_to=cls.sales_user1),
+            Contact(last_name="Sales2ContactTest", account=cls.acc_other, created_by=cls.sales_user2, assigned_to=cls.sales_user2),
+        ])
 
-        cls.contact_list_url = reverse('crm_entities:contact-list')
+        cls.contact_list_url = url('crm_entities:contact-list')
 
     def test_url_and_template(self):
         self.client.login(username='cont_test_admin', password='password123')
@@ -170,7 +307,7 @@ class ContactListViewPermissionTest(TestCase):
 
     def test_redirect_if_not_logged_in(self):
         response = self.client.get(self.contact_list_url)
-        login_url = reverse('login')
+        login_url = url('login')
         self.assertRedirects(response, f'{login_url}?next={self.contact_list_url}')
 
     def test_admin_sees_all_contacts(self):
@@ -212,17 +349,6 @@ class ContactListViewPermissionTest(TestCase):
         contact_names = {c.last_name for c in response.context['contacts']}
         self.assertIn(self.cont1.last_name, contact_names)
         
-def test_invalid_email_format(self):
-    self.client.login(username='cont_test_admin', password='password123')
-    response = self.client.post(self.create_url, {
-        'first_name': 'Test',
-        'last_name': 'Invalid',
-        'email': 'invalid_email',
-        'account': self.acc_managed.pk
-    })
-    self.assertEqual(response.status_code, 200)
-    self.assertFormError(response.context['form'], 'email', 'Enter a valid email address.')
-
 
 # --- Lead List View Tests ---
 class LeadListViewPermissionTest(TestCase):
@@ -230,24 +356,30 @@ class LeadListViewPermissionTest(TestCase):
     @classmethod
     def setUpTestData(cls):
         # Users & Territories
-        cls.admin_user = create_user('lead_test_admin', is_superuser=True)
-        cls.manager_user = create_user('lead_test_manager', role=CustomUser.Roles.MANAGER)
-        cls.t1 = Territory.objects.create(name="Lead Test Territory 1")
-        cls.t2 = Territory.objects.create(name="Lead Test Territory 2")
-        cls.sales_user1 = create_user('lead_test_sales1', role=CustomUser.Roles.SALES, territory=cls.t1)
-        cls.sales_user2 = create_user('lead_test_sales2', role=CustomUser.Roles.SALES, territory=cls.t2)
+        cls.t1, cls.t2 = Territory.objects.bulk_create([
+            Territory(name="Lead Test Territory 1"),
+            Territory(name="Lead Test Territory 2"),
+        ])
+        cls.admin_user, cls.manager_user, cls.sales_user1, cls.sales_user2 = CustomUser.objects.bulk_create([
+            fast_user('lead_test_admin', is_superuser=True),
+            fast_user('lead_test_manager', role=CustomUser.Roles.MANAGER),
+            fast_user('lead_test_sales1', role=CustomUser.Roles.SALES, territory=cls.t1),
+            fast_user('lead_test_sales2', role=CustomUser.Roles.SALES, territory=cls.t2),
+        ])
         cls.manager_user.managed_territories.add(cls.t1)
 
         # Leads
-        cls.lead1 = Lead.objects.create(last_name="AdminLeadTest", company_name="Comp A", status=Lead.StatusChoices.NEW, assigned_to=cls.admin_user)
-        cls.lead2 = Lead.objects.create(last_name="ManagerLeadTest", company_name="Comp B", status=Lead.StatusChoices.QUALIFIED, territory=cls.t1, assigned_to=cls.manager_user)
-        cls.lead3 = Lead.objects.create(last_name="Sales1Lead1Test", company_name="Comp C", status=Lead.StatusChoices.CONTACTED, territory=cls.t1, assigned_to=cls.sales_user1)
-        cls.lead4 = Lead.objects.create(last_name="Sales1Lead2Test", company_name="Comp D", status=Lead.StatusChoices.NEW, territory=cls.t1, assigned_to=cls.sales_user1)
-        cls.lead5 = Lead.objects.create(last_name="Sales2LeadTest", company_name="Comp E", status=Lead.StatusChoices.QUALIFIED, territory=cls.t2, assigned_to=cls.sales_user2)
-        cls.lead_converted = Lead.objects.create(last_name="ConvertedLeadTest", company_name="Comp F", status=Lead.StatusChoices.CONVERTED, territory=cls.t1, assigned_to=cls.sales_user1)
-        cls.lead_lost = Lead.objects.create(last_name="LostLeadTest", company_name="Comp G", status=Lead.StatusChoices.LOST, territory=cls.t1, assigned_to=cls.sales_user1)
-
-        cls.lead_list_url = reverse('crm_entities:lead-list')
+        cls.lead1, cls.lead2, cls.lead3, cls.lead4, cls.lead5, cls.lead_converted, cls.lead_lost = Lead.objects.bulk_create([
+            Lead(last_name="AdminLeadTest", company_name="Comp A", status=Lead.StatusChoices.NEW, assigned_to=cls.admin_user),
+            Lead(last_name="ManagerLeadTest", company_name="Comp B", status=Lead.StatusChoices.QUALIFIED, territory=cls.t1, assigned_to=cls.manager_user),
+            Lead(last_name="Sales1Lead1Test", company_name="Comp C", status=Lead.StatusChoices.CONTACTED, territory=cls.t1, assigned_to=cls.sales_user1),
+            Lead(last_name="Sales1Lead2Test", company_name="Comp D", status=Lead.StatusChoices.NEW, territory=cls.t1, assigned_to=cls.sales_user1),
+            Lead(last_name="Sales2LeadTest", company_name="Comp E", status=Lead.StatusChoices.QUALIFIED, territory=cls.t2, assigned_to=cls.sales_user2),
+            Lead(last_name="ConvertedLeadTest", company_name="Comp F", status=Lead.StatusChoices.CONVERTED, territory=cls.t1, assigned_to=cls.sales_user1),
+            Lead(last_name="LostLeadTest", company_name="Comp G", status=Lead.StatusChoices.LOST, territory=cls.t1, assigned_to=cls.sales_user1),
+        ])
+
+        cls.lead_list_url = url('crm_entities:lead-list')
 
     def test_url_and_template(self):
         self.client.login(username='lead_test_admin', password='password123')
@@ -257,7 +389,7 @@ class LeadListViewPermissionTest(TestCase):
 
     def test_redirect_if_not_logged_in(self):
         response = self.client.get(self.lead_list_url)
-        login_url = reverse('login')
+        login_url = url('login')
         self.assertRedirects(response, f'{login_url}?next={self.lead_list_url}')
 
     def test_admin_sees_all_non_converted_leads(self):
@@ -326,26 +458,22 @@ class AccountCreateViewTest(TestCase):
 
     @classmethod
     def setUpTestData(cls):
-        cls.user = CustomUser.objects.create_user(
-            username='account_create_user', password='password123', role='SALES'
-        )
-        cls.test_user = CustomUser.objects.create_user(
-            username='test_user', password='password123', role='SALES'
-        )
-        cls.sales_user = CustomUser.objects.create_user(
-            username='sales_user', password='password123', role='SALES'
-        )
+        cls.user, cls.test_user, cls.sales_user = CustomUser.objects.bulk_create([
+            fast_user(username='account_create_user', role='SALES'),
+            fast_user(username='test_user', role='SALES'),
+            fast_user(username='sales_user', role='SALES'),
+        ])
         cls.territory = Territory.objects.create(name='Test Territory')
         cls.test_account = Account.objects.create(
             name='Test Account', created_by=cls.user, territory=cls.territory
         )
-        cls.create_url = reverse('crm_entities:account-create')
-        cls.list_url = reverse('crm_entities:account-list')
+        cls.create_url = url('crm_entities:account-create')
+        cls.list_url = url('crm_entities:account-list')
     def setUp(self):
         # Log in a user for most tests (can be overridden per test)
         self.client.login(username='acc_create_sales', password='password123')
-        self.create_url = reverse('crm_entities:account-create')
-        self.list_url = reverse('crm_entities:account-list')
+        self.create_url = url('crm_entities:account-create')
+        self.list_url = url('crm_entities:account-list')
 
     def test_create_view_get_page_authenticated_sales(self):
         self.client.login(username='sales_user', password='password123')
@@ -357,7 +485,7 @@ class AccountCreateViewTest(TestCase):
     def test_create_view_redirects_if_not_logged_in(self):
         self.client.logout() # Ensure user is logged out
         response = self.client.get(self.create_url)
-        login_url = reverse('login')
+        login_url = url('login')
         self.assertRedirects(response, f'{login_url}?next={self.create_url}')
 
     def test_create_account_success_post(self):
@@ -372,7 +500,7 @@ class AccountCreateViewTest(TestCase):
         self.assertEqual(response.status_code, 302)
         self.assertRedirects(response, self.list_url)
         self.assertEqual(Account.objects.count(), initial_count + 1)
-        new_account = Account.objects.latest('created_at')
+        new_account = Account.objects.get(name='New Account') # name is unique, so this is an index lookup
         self.assertEqual(new_account.name, 'New Account')
 
     def test_create_account_missing_required_field(self):
@@ -421,9 +549,11 @@ class AccountDetailViewTest(TestCase):
     def setUpTestData(cls):
         # Create users with different roles
         # Use slightly different usernames to avoid potential conflicts if tests run together weirdly
-        cls.admin_user = create_user(username='acc_detail_admin', is_superuser=True)
-        cls.sales_user1 = create_user(username='acc_detail_sales1', role=CustomUser.Roles.SALES)
-        cls.sales_user2 = create_user(username='acc_detail_sales2', role=CustomUser.Roles.SALES)
+        cls.admin_user, cls.sales_user1, cls.sales_user2 = CustomUser.objects.bulk_create([
+            fast_user(username='acc_detail_admin', is_superuser=True),
+            fast_user(username='acc_detail_sales1', role=CustomUser.Roles.SALES),
+            fast_user(username='acc_detail_sales2', role=CustomUser.Roles.SALES),
+        ])
 
         # Create an account owned/assigned to sales_user1
         cls.account1 = Account.objects.create(
@@ -432,12 +562,12 @@ class AccountDetailViewTest(TestCase):
             assigned_to=cls.sales_user1
         )
         # Create URL for this specific account's detail view
-        cls.account1_detail_url = reverse('crm_entities:account-detail', kwargs={'pk': cls.account1.pk})
+        cls.account1_detail_url = url('crm_entities:account-detail', pk=cls.account1.pk)
 
     def test_view_redirects_if_not_logged_in(self):
         """ Test detail view redirects if user not logged in """
         response = self.client.get(self.account1_detail_url)
-        login_url = reverse('login')
+        login_url = url('login')
         self.assertRedirects(response, f'{login_url}?next={self.account1_detail_url}')
 
     def test_view_accessible_by_owner(self):
@@ -480,9 +610,11 @@ class AccountUpdateViewTest(TestCase):
     @classmethod
     def setUpTestData(cls):
         # Create users and an account to be updated
-        cls.owner_user = create_user(username='acc_update_owner', role=CustomUser.Roles.SALES)
-        cls.other_user = create_user(username='acc_update_other', role=CustomUser.Roles.SALES)
-        cls.admin_user = create_user(username='acc_update_admin', is_superuser=True)
+        cls.owner_user, cls.other_user, cls.admin_user = CustomUser.objects.bulk_create([
+            fast_user(username='acc_update_owner', role=CustomUser.Roles.SALES),
+            fast_user(username='acc_update_other', role=CustomUser.Roles.SALES),
+            fast_user(username='acc_update_admin', is_superuser=True),
+        ])
         cls.territory = Territory.objects.create(name="Acc Update Territory") # Needed for form
 
         cls.account_to_update = Account.objects.create(
@@ -492,9 +624,9 @@ class AccountUpdateViewTest(TestCase):
             assigned_to=cls.owner_user,
             territory=cls.territory
         )
-        cls.update_url = reverse('crm_entities:account-update', kwargs={'pk': cls.account_to_update.pk})
-        cls.detail_url = reverse('crm_entities:account-detail', kwargs={'pk': cls.account_to_update.pk}) # Often redirect target
-        cls.list_url = reverse('crm_entities:account-list') # Or this redirect target
+        cls.update_url = url('crm_entities:account-update', pk=cls.account_to_update.pk)
+        cls.detail_url = url('crm_entities:account-detail', pk=cls.account_to_update.pk) # Often redirect target
+        cls.list_url = url('crm_entities:account-list') # Or this redirect target
 
     def test_update_view_get_page_as_owner(self):
         """ Test GET request loads form with initial data for owner """
@@ -504,7 +636,7 @@ class AccountUpdateViewTest(TestCase):
         self.assertTemplateUsed(response, 'crm_entities/account_form.html')
         # Check form is pre-filled
         self.assertEqual(response.context['form'].initial['name'], self.account_to_update.name)
-        self.assertContains(response, 'Update Account:') # Check title
+        self.assertIn('Update Account:', response.content.decode()) # Check title
 
     def test_update_view_get_page_as_admin(self):
         """ Test GET request loads form for admin """
@@ -522,7 +654,7 @@ class AccountUpdateViewTest(TestCase):
 
     def test_update_view_redirects_if_not_logged_in(self):
         response = self.client.get(self.update_url)
-        login_url = reverse('login')
+        login_url = url('login')
         self.assertRedirects(response, f'{login_url}?next={self.update_url}')
 
     def test_update_account_success_post_as_owner(self):
@@ -564,40 +696,87 @@ class AccountUpdateViewTest(TestCase):
         # Should get 404 because get_queryset prevents access
         self.assertEqual(response.status_code, 404)
         # Verify object was not changed
-        self.account_to_update.refresh_from_db()
-        self.assertEqual(self.account_to_update.name, original_name)
+        current_name = Account.objects.values_list('name', flat=True).get(pk=self.account_to_update.pk)
+        self.assertEqual(current_name, original_name)
         
         
  # Add this class to the end of crm_entities/tests/test_views.py
 
-# --- Contact Create View Tests ---
-class ContactCreateViewTest(TestCase):
+# --- Contact Create / Detail / Update View Tests ---
+class ContactViewsTest(TestCase):
 
     @classmethod
     def setUpTestData(cls):
-        # Create a user to perform actions and an account to link contacts to
-        cls.test_user = create_user(username='contact_create_user', role=CustomUser.Roles.SALES)
-        cls.test_account = Account.objects.create(name="Contact Test Account", assigned_to=cls.test_user)
+        # Users plus one shared account serve the create, detail and update tests
+        cls.owner_user, cls.other_user, cls.admin_user = CustomUser.objects.bulk_create([
+            fast_user(username='contact_views_owner', role=CustomUser.Roles.SALES),
+            fast_user(username='contact_views_other', role=CustomUser.Roles.SALES),
+            fast_user(username='contact_views_admin', is_superuser=True),
+        ])
+        cls.account = Account.objects.create(name="Contact Test Account", assigned_to=cls.owner_user)
+
+        # Contact owned/assigned to owner_user (detail tests)
+        cls.contact1 = Contact.objects.create(
+            last_name="DetailContact",
+            account=cls.account,
+            created_by=cls.owner_user,
+            assigned_to=cls.owner_user
+        )
+        # Contact modified by the update tests
+        cls.contact_to_update = Contact.objects.create(
+            last_name="UpdateMe", account=cls.account, assigned_to=cls.owner_user
+        )
+
+        cls.create_url = url('crm_entities:contact-create')
+        cls.list_url = url('crm_entities:contact-list')
+        cls.contact1_detail_url = url('crm_entities:contact-detail', pk=cls.contact1.pk)
+        cls.update_url = url('crm_entities:contact-update', pk=cls.contact_to_update.pk)
+
+        # Valid payload shared by the form validation tests; each test overrides one field
+        cls.base_post = {
+            'first_name': 'Test',
+            'last_name': 'Invalid',
+            'title': 'Manager',
+            'department': 'Sales',
+            'email': 'test@contact.com',
+            'work_phone': '+639088835511',
+            'mobile_phone_1': '+639088835512',
+            'mobile_phone_2': '+639088835513',
+            'notes': 'Test note',
+            'account': cls.account.pk,
+        }
 
     def setUp(self):
-        # Log in the user for most tests
-        self.client.login(username='contact_create_user', password='password123')
-        self.create_url = reverse('crm_entities:contact-create')
-        self.list_url = reverse('crm_entities:contact-list')
+        # Log in the owner for most tests
+        self.client.login(username='contact_views_owner', password='password123')
+
+    # --- Create ---
 
     def test_create_view_get_page_authenticated(self):
         """ Test GET request for create page loads for authenticated user """
         response = self.client.get(self.create_url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'crm_entities/contact_form.html')
-        self.assertContains(response, 'Create New Contact')
+        self.assertIsInstance(response.context['form'], ContactForm)
+        self.assertEqual(response.resolver_match.view_name, 'crm_entities:contact-create')
+        self.assertEqual(response.context['form_title'], 'Create New Contact')
 
     def test_create_view_redirects_if_not_logged_in(self):
         self.client.logout()
         response = self.client.get(self.create_url)
-        login_url = reverse('login')
+        login_url = url('login')
         self.assertRedirects(response, f'{login_url}?next={self.create_url}')
 
+    def test_create_view_initial_account_from_query(self):
+        response = self.client.get(self.create_url, {'account': self.account.pk})
+        self.assertEqual(response.context['form'].initial['account'].pk, self.account.pk)
+
+    def test_create_view_invalid_account_param(self):
+        response = self.client.get(self.create_url, {'account': 'not-a-pk'})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('account', response.context['form'].initial)
+        self.assertIn("Invalid Account specified.", [str(m) for m in response.context['messages']])
+
     def test_create_contact_success_post(self):
         """ Test successfully creating a contact via POST """
         initial_count = Contact.objects.count()
@@ -606,7 +785,7 @@ class ContactCreateViewTest(TestCase):
             'last_name': 'Contact', # Required
             'email': 'test@contact.com',
             'title': 'Tester',
-            'account': self.test_account.pk, # Link to existing account PK
+            'account': self.account.pk, # Link to existing account PK
             'assigned_to': '', # Leave blank to test defaulting
         }
         response = self.client.post(self.create_url, data=contact_data)
@@ -616,28 +795,28 @@ class ContactCreateViewTest(TestCase):
         # Check that one new contact was created
         self.assertEqual(Contact.objects.count(), initial_count + 1)
         # Check the details of the created contact
-        new_contact = Contact.objects.latest('created_at')
+        new_contact = Contact.objects.get(last_name='Contact', created_by=self.owner_user)
         self.assertEqual(new_contact.last_name, 'Contact')
-        self.assertEqual(new_contact.account, self.test_account)
-        self.assertEqual(new_contact.created_by, self.test_user) # Check created_by
-        self.assertEqual(new_contact.assigned_to, self.test_user) # Check default assigned_to
+        self.assertEqual(new_contact.account, self.account)
+        self.assertEqual(new_contact.created_by, self.owner_user) # Check created_by
+        self.assertEqual(new_contact.assigned_to, self.owner_user) # Check default assigned_to
 
     def test_create_contact_success_post_with_assignee(self):
         """ Test successfully creating a contact via POST when assignee is specified """
-        other_user = create_user(username='other_assignee', role=CustomUser.Roles.SALES)
+        other_user = self.other_user
         initial_count = Contact.objects.count()
         contact_data = {
             'first_name': 'Another',
             'last_name': 'Tester',
-            'account': self.test_account.pk,
+            'account': self.account.pk,
             'assigned_to': other_user.pk, # Specify different assignee
         }
         response = self.client.post(self.create_url, data=contact_data)
         self.assertRedirects(response, self.list_url)
         self.assertEqual(Contact.objects.count(), initial_count + 1)
-        new_contact = Contact.objects.latest('created_at')
+        new_contact = Contact.objects.get(last_name='Tester', created_by=self.owner_user)
         self.assertEqual(new_contact.last_name, 'Tester')
-        self.assertEqual(new_contact.created_by, self.test_user)
+        self.assertEqual(new_contact.created_by, self.owner_user)
         self.assertEqual(new_contact.assigned_to, other_user) # Verify specified assignee was used
 
     def test_create_contact_missing_required_field(self):
@@ -646,7 +825,7 @@ class ContactCreateViewTest(TestCase):
         contact_data = {
             'first_name': 'Test',
             # 'last_name': 'Missing', # Last Name is required
-            'account': self.test_account.pk,
+            'account': self.account.pk,
         }
         response = self.client.post(self.create_url, data=contact_data)
 
@@ -661,208 +840,114 @@ class ContactCreateViewTest(TestCase):
         self.assertTemplateUsed(response, 'crm_entities/contact_form.html')
         
     def test_form_invalid_phone(self):
-        self.client.login(username='contact_create_user', password='password123')
         initial_count = Contact.objects.count()
-        response = self.client.post(self.create_url, {
-            'first_name': 'Test',
-            'last_name': 'Invalid',
-            'email': 'test@contact.com',
-            'work_phone': 'invalid_phone',
-            'account': self.test_account.pk
-        })
+        response = self.client.post(self.create_url, {**self.base_post, 'work_phone': 'invalid_phone'})
         self.assertEqual(response.status_code, 200)  # Form re-rendered with errors
         self.assertEqual(Contact.objects.count(), initial_count)  # No contact created
         self.assertFormError(response.context['form'], 'work_phone', 'Enter a valid phone number (e.g., +6388019525).')
         
     def test_form_invalid_email(self):
-        self.client.login(username='contact_create_user', password='password123')
         initial_count = Contact.objects.count()
-        response = self.client.post(self.create_url, {
-            'first_name': 'Test',
-            'last_name': 'Invalid',
-            'email': 'invalid_email',
-            'work_phone': '+1234567890',
-            'account': self.test_account.pk
-        })
+        response = self.client.post(self.create_url, {**self.base_post, 'email': 'invalid_email'})
         self.assertEqual(response.status_code, 200)
         self.assertEqual(Contact.objects.count(), initial_count)
         self.assertFormError(response.context['form'], 'email', 'Enter a valid email address.')
 
     def test_form_empty_last_name(self):
-        self.client.login(username='contact_create_user', password='password123')
         initial_count = Contact.objects.count()
-        response = self.client.post(self.create_url, {
-            'first_name': 'Test',
-            'last_name': '',
-            'email': 'test@contact.com',
-            'work_phone': '+1234567890',
-            'account': self.test_account.pk
-        })
+        response = self.client.post(self.create_url, {**self.base_post, 'last_name': ''})
         self.assertEqual(response.status_code, 200)
         self.assertEqual(Contact.objects.count(), initial_count)
         self.assertFormError(response.context['form'], 'last_name', 'This field is required.')
         
     def test_form_invalid_mobile_phone_1(self):
-        self.client.login(username='contact_create_user', password='password123')
         initial_count = Contact.objects.count()
-        response = self.client.post(self.create_url, {
-            'first_name': 'Test',
-            'last_name': 'Invalid',
-            'title': 'Manager',
-            'department': 'Sales',
-            'email': 'test@contact.com',
-            'work_phone': '+639088835511',
-            'mobile_phone_1': 'invalid_phone',
-            'mobile_phone_2': '+639088835512',
-            'notes': 'Test note',
-            'account': self.test_account.pk
-        })
+        response = self.client.post(self.create_url, {**self.base_post, 'mobile_phone_1': 'invalid_phone'})
         self.assertEqual(response.status_code, 200)
         self.assertEqual(Contact.objects.count(), initial_count)
         self.assertFormError(response.context['form'], 'mobile_phone_1', 'Enter a valid phone number (e.g., +639088835511).')
 
     def test_form_invalid_mobile_phone_2(self):
-        self.client.login(username='contact_create_user', password='password123')
         initial_count = Contact.objects.count()
-        response = self.client.post(self.create_url, {
-            'first_name': 'Test',
-            'last_name': 'Invalid',
-            'title': 'Manager',
-            'department': 'Sales',
-            'email': 'test@contact.com',
-            'work_phone': '+639088835511',
-            'mobile_phone_1': '+639088835512',
-            'mobile_phone_2': 'invalid_phone',
-            'notes': 'Test note',
-            'account': self.test_account.pk
-        })
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(Contact.objects.count(), initial_count)
-        self.assertFormError(response.context['form'], 'mobile_phone_2', 'Enter a valid phone number (e.g., +639088835511).')
-        
-    def test_form_invalid_email_format(self):
-        self.client.login(username='contact_create_user', password='password123')
-        initial_count = Contact.objects.count()
-        response = self.client.post(self.create_url, {
-            'first_name': 'Test',
-            'last_name': 'Invalid',
-            'title': 'Manager',
-            'department': 'Sales',
-            'email': 'invalid@.com',
-            'work_phone': '+639088835511',
-            'mobile_phone_1': '+639088835512',
-            'mobile_phone_2': '+639088835513',
-            'notes': 'Test note',
-            'account': self.test_account.pk
-        })
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(Contact.objects.count(), initial_count)
-        self.assertFormError(response.context['form'], 'email', 'Enter a valid email address.')
-        
-    def test_form_invalid_mobile_phone_1(self):
-        self.client.login(username='contact_create_user', password='password123')
-        initial_count = Contact.objects.count()
-        response = self.client.post(self.create_url, {
-            'first_name': 'Test',
-            'last_name': 'Invalid',
-            'title': 'Manager',
-            'department': 'Sales',
-            'email': 'test@contact.com',
-            'work_phone': '+639088835511',
-            'mobile_phone_1': 'invalid_phone',
-            'mobile_phone_2': '+639088835512',
-            'notes': 'Test note',
-            'account': self.test_account.pk
-        })
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(Contact.objects.count(), initial_count)
-        self.assertFormError(response.context['form'], 'mobile_phone_1', 'Enter a valid phone number (e.g., +639088835511).')
-
-    def test_form_invalid_mobile_phone_2(self):
-        self.client.login(username='contact_create_user', password='password123')
-        initial_count = Contact.objects.count()
-        response = self.client.post(self.create_url, {
-            'first_name': 'Test',
-            'last_name': 'Invalid',
-            'title': 'Manager',
-            'department': 'Sales',
-            'email': 'test@contact.com',
-            'work_phone': '+639088835511',
-            'mobile_phone_1': '+639088835512',
-            'mobile_phone_2': 'invalid_phone',
-            'notes': 'Test note',
-            'account': self.test_account.pk
-        })
+        response = self.client.post(self.create_url, {**self.base_post, 'mobile_phone_2': 'invalid_phone'})
         self.assertEqual(response.status_code, 200)
         self.assertEqual(Contact.objects.count(), initial_count)
         self.assertFormError(response.context['form'], 'mobile_phone_2', 'Enter a valid phone number (e.g., +639088835511).')
 
     def test_form_invalid_email_format(self):
-        self.client.login(username='contact_create_user', password='password123')
         initial_count = Contact.objects.count()
-        response = self.client.post(self.create_url, {
-            'first_name': 'Test',
-            'last_name': 'Invalid',
-            'title': 'Manager',
-            'department': 'Sales',
-            'email': 'invalid@.com',
-            'work_phone': '+639088835511',
-            'mobile_phone_1': '+639088835512',
-            'mobile_phone_2': '+639088835513',
-            'notes': 'Test note',
-            'account': self.test_account.pk
-        })
+        response = self.client.post(self.create_url, {**self.base_post, 'email': 'invalid@.com'})
         self.assertEqual(response.status_code, 200)
         self.assertEqual(Contact.objects.count(), initial_count)
         self.assertFormError(response.context['form'], 'email', 'Enter a valid email address.')
 
-class ContactDetailViewTest(TestCase):
-    @classmethod
-    def setUpTestData(cls):
-        # Users & Account needed for context
-        cls.owner_user = create_user(username='cont_detail_owner', role=CustomUser.Roles.SALES)
-        cls.other_user = create_user(username='cont_detail_other', role=CustomUser.Roles.SALES)
-        cls.admin_user = create_user(username='cont_detail_admin', is_superuser=True)
-        cls.account = Account.objects.create(name="Detail Contact Account", assigned_to=cls.owner_user)
-
-        # Contact owned/assigned to owner_user
-        cls.contact1 = Contact.objects.create(
-            last_name="DetailContact",
-            account=cls.account,
-            created_by=cls.owner_user,
-            assigned_to=cls.owner_user
-        )
-        cls.contact1_detail_url = reverse('crm_entities:contact-detail', kwargs={'pk': cls.contact1.pk})
+    # --- Detail ---
 
     def test_detail_view_redirects_if_not_logged_in(self):
+        self.client.logout()
         response = self.client.get(self.contact1_detail_url)
-        login_url = reverse('login')
+        login_url = url('login')
         self.assertRedirects(response, f'{login_url}?next={self.contact1_detail_url}')
 
     def test_detail_view_accessible_by_owner(self):
-        self.client.login(username='cont_detail_owner', password='password123')
         response = self.client.get(self.contact1_detail_url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'crm_entities/contact_detail.html')
 
     def test_detail_view_contains_contact_details(self):
-        self.client.login(username='cont_detail_owner', password='password123')
         response = self.client.get(self.contact1_detail_url)
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, self.contact1.last_name)
         self.assertEqual(response.context['contact'], self.contact1)
 
     def test_detail_view_permission_denied_for_other_user(self):
-        self.client.login(username='cont_detail_other', password='password123')
+        self.client.login(username='contact_views_other', password='password123')
         response = self.client.get(self.contact1_detail_url)
         self.assertEqual(response.status_code, 404) # Expect 404 due to queryset filtering
 
     def test_detail_view_accessible_by_admin(self):
-        self.client.login(username='cont_detail_admin', password='password123')
+        self.client.login(username='contact_views_admin', password='password123')
         response = self.client.get(self.contact1_detail_url)
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, self.contact1.last_name)
 
+    # --- Update ---
+
+    def test_update_view_get_page_as_owner(self):
+        response = self.client.get(self.update_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'crm_entities/contact_form.html')
+        self.assertEqual(response.context['form'].initial['last_name'], self.contact_to_update.last_name)
+        self.assertIn('Update Contact:', response.content.decode())
+
+    def test_update_view_get_permission_denied_for_other_user(self):
+        self.client.login(username='contact_views_other', password='password123')
+        response = self.client.get(self.update_url)
+        self.assertEqual(response.status_code, 404)
+
+    def test_update_contact_success_post_as_owner(self):
+        updated_last_name = "UpdatedLastName"
+        updated_title = "Lead Tester"
+        contact_data = {
+            'first_name': self.contact_to_update.first_name or '',
+            'last_name': updated_last_name,
+            'title': updated_title,
+            'account': self.contact_to_update.account.pk,
+            'assigned_to': self.contact_to_update.assigned_to.pk,
+            # Include other required fields from the form if any, or existing values
+            'email': self.contact_to_update.email or '',
+            'department': self.contact_to_update.department or '',
+            'work_phone': self.contact_to_update.work_phone or '',
+            'mobile_phone_1': self.contact_to_update.mobile_phone_1 or '',
+            'mobile_phone_2': self.contact_to_update.mobile_phone_2 or '',
+            'notes': self.contact_to_update.notes or '',
+        }
+        response = self.client.post(self.update_url, data=contact_data)
+        self.assertRedirects(response, self.list_url)
+        row = Contact.objects.values('last_name', 'title').get(pk=self.contact_to_update.pk)
+        self.assertEqual(row['last_name'], updated_last_name)
+        self.assertEqual(row['title'], updated_title)
+
 
 # --- Lead Detail View Tests ---
 class LeadDetailViewTest(TestCase):
@@ -870,28 +955,32 @@ class LeadDetailViewTest(TestCase):
     @classmethod
     def setUpTestData(cls):
          # Users & Territory needed
-        cls.owner_user = create_user(username='lead_detail_owner', role=CustomUser.Roles.SALES)
-        cls.other_user = create_user(username='lead_detail_other', role=CustomUser.Roles.SALES)
-        cls.admin_user = create_user(username='lead_detail_admin', is_superuser=True)
+        cls.owner_user, cls.other_user, cls.admin_user = CustomUser.objects.bulk_create([
+            fast_user(username='lead_detail_owner', role=CustomUser.Roles.SALES),
+            fast_user(username='lead_detail_other', role=CustomUser.Roles.SALES),
+            fast_user(username='lead_detail_admin', is_superuser=True),
+        ])
 
         # Lead owned/assigned to owner_user
-        cls.lead1 = Lead.objects.create(
-            last_name="DetailLead",
-            company_name="Lead Detail Co",
-            status=Lead.StatusChoices.QUALIFIED, # Use qualified for convert button check
-            created_by=cls.owner_user,
-            assigned_to=cls.owner_user
-        )
-        # Create a converted lead to test button visibility
-        cls.lead_converted = Lead.objects.create(last_name="AlreadyConverted", status=Lead.StatusChoices.CONVERTED, assigned_to=cls.owner_user)
-
-        cls.lead1_detail_url = reverse('crm_entities:lead-detail', kwargs={'pk': cls.lead1.pk})
-        cls.lead_converted_detail_url = reverse('crm_entities:lead-detail', kwargs={'pk': cls.lead_converted.pk})
-
+        # Qualified lead for the convert button check, plus a converted one to test button visibility
+        cls.lead1, cls.lead_converted = Lead.objects.bulk_create([
+            Lead(
+                last_name="DetailLead",
+                company_name="Lead Detail Co",
+                status=Lead.StatusChoices.QUALIFIED,
+                created_by=cls.owner_user,
+                assigned_to=cls.owner_user
+            ),
+            Lead(last_name="AlreadyConverted", status=Lead.StatusChoices.CONVERTED, assigned_to=cls.owner_user),
+        ])
+
+        cls.lead1_detail_url = url('crm_entities:lead-detail', pk=cls.lead1.pk)
+        cls.lead_converted_detail_url = url('crm_entities:lead-detail', pk=cls.lead_converted.pk)
+        cls.lead1_convert_url = url('crm_entities:lead-convert', pk=cls.lead1.pk)
 
     def test_detail_view_redirects_if_not_logged_in(self):
         response = self.client.get(self.lead1_detail_url)
-        login_url = reverse('login')
+        login_url = url('login')
         self.assertRedirects(response, f'{login_url}?next={self.lead1_detail_url}')
 
     def test_detail_view_accessible_by_owner(self):
@@ -924,8 +1013,9 @@ class LeadDetailViewTest(TestCase):
         self.client.login(username='lead_detail_owner', password='password123')
         response = self.client.get(self.lead1_detail_url)
         self.assertEqual(response.status_code, 200)
-        self.assertContains(response, 'Convert Lead') # Check button text/presence
-        self.assertContains(response, reverse('crm_entities:lead-convert', kwargs={'pk': self.lead1.pk})) # Check form action URL
+        html = response.content.decode() # Decode once for both checks
+        self.assertIn('Convert Lead', html) # Check button text/presence
+        self.assertIn(self.lead1_convert_url, html) # Check form action URL
 
     def test_convert_button_visibility_converted(self):
         """ Test Convert button does NOT show for CONVERTED leads """
@@ -947,23 +1037,39 @@ class LeadCreateViewTest(TestCase):
         cls.test_user = create_user(username='lead_create_user', role=CustomUser.Roles.SALES)
         # Territory might be needed if form field is required/used
         cls.territory = Territory.objects.create(name="Lead Create Territory")
+        # Valid payload shared by the form validation tests; each test overrides one field
+        cls.base_post = {
+            'first_name': 'Test',
+            'last_name': 'Invalid',
+            'company_name': 'Test Corp',
+            'email': 'test@lead.com',
+            'work_phone': '+639088835511',
+            'mobile_phone_1': '+639088835512',
+            'mobile_phone_2': '+639088835513',
+            'status': Lead.StatusChoices.NEW,
+            'source': 'Web',
+            'territory': cls.territory.pk,
+            'assigned_to': cls.test_user.pk,
+        }
 
     def setUp(self):
         self.client.login(username='lead_create_user', password='password123')
-        self.create_url = reverse('crm_entities:lead-create')
-        self.list_url = reverse('crm_entities:lead-list')
+        self.create_url = url('crm_entities:lead-create')
+        self.list_url = url('crm_entities:lead-list')
 
     def test_create_view_get_page_authenticated(self):
         """ Test GET request for create page loads for authenticated user """
         response = self.client.get(self.create_url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'crm_entities/lead_form.html')
-        self.assertContains(response, 'Create New Lead')
+        self.assertIsInstance(response.context['form'], LeadForm)
+        self.assertEqual(response.resolver_match.view_name, 'crm_entities:lead-create')
+        self.assertEqual(response.context['form_title'], 'Create New Lead')
 
     def test_create_view_redirects_if_not_logged_in(self):
         self.client.logout()
         response = self.client.get(self.create_url)
-        login_url = reverse('login')
+        login_url = url('login')
         self.assertRedirects(response, f'{login_url}?next={self.create_url}')
 
     def test_create_lead_success_post(self):
@@ -984,7 +1090,7 @@ class LeadCreateViewTest(TestCase):
 
         self.assertRedirects(response, self.list_url)
         self.assertEqual(Lead.objects.count(), initial_count + 1)
-        new_lead = Lead.objects.latest('created_at')
+        new_lead = Lead.objects.get(last_name='Lead', created_by=self.test_user)
         self.assertEqual(new_lead.last_name, 'Lead')
         self.assertEqual(new_lead.created_by, self.test_user)
         self.assertEqual(new_lead.assigned_to, self.test_user) # Check default assigned_to
@@ -1010,152 +1116,25 @@ class LeadCreateViewTest(TestCase):
         self.assertTemplateUsed(response, 'crm_entities/lead_form.html')
         
     def test_form_invalid_email(self):
-        self.client.login(username='lead_create_user', password='password123')
         initial_count = Lead.objects.count()
-        response = self.client.post(self.create_url, {
-            'first_name': 'Test',
-            'last_name': 'Invalid',
-            'company_name': 'Test Corp',
-            'email': 'invalid_email',
-            'status': Lead.StatusChoices.NEW,
-            'source': 'Web',
-            'territory': self.territory.pk,
-            'assigned_to': self.test_user.pk
-        })
+        response = self.client.post(self.create_url, {**self.base_post, 'email': 'invalid_email'})
         self.assertEqual(response.status_code, 200)
         self.assertEqual(Lead.objects.count(), initial_count)
         self.assertFormError(response.context['form'], 'email', 'Enter a valid email address.')
         
     def test_form_invalid_work_phone(self):
-        self.client.login(username='lead_create_user', password='password123')
         initial_count = Lead.objects.count()
-        response = self.client.post(self.create_url, {
-            'first_name': 'Test',
-            'last_name': 'Invalid',
-            'company_name': 'Test Corp',
-            'email': 'test@lead.com',
-            'work_phone': 'invalid_phone',
-            'mobile_phone_1': '+6388019526',
-            'mobile_phone_2': '+6388019527',
-            'status': Lead.StatusChoices.NEW,
-            'source': 'Web',
-            'territory': self.territory.pk,
-            'assigned_to': self.test_user.pk
-        })
+        response = self.client.post(self.create_url, {**self.base_post, 'work_phone': 'invalid_phone'})
         self.assertEqual(response.status_code, 200)
         self.assertEqual(Lead.objects.count(), initial_count)
         self.assertFormError(response.context['form'], 'work_phone', 'Enter a valid phone number (e.g., +6388019525).')
 
     def test_form_invalid_email_format(self):
-        self.client.login(username='lead_create_user', password='password123')
         initial_count = Lead.objects.count()
-        response = self.client.post(self.create_url, {
-            'first_name': 'Test',
-            'last_name': 'Invalid',
-            'company_name': 'Test Corp',
-            'email': 'invalid@.com',
-            'work_phone': '+639088835511',
-            'mobile_phone_1': '+639088835512',
-            'mobile_phone_2': '+639088835513',
-            'status': Lead.StatusChoices.NEW,
-            'source': 'Web',
-            'territory': self.territory.pk,
-            'assigned_to': self.test_user.pk
-        })
+        response = self.client.post(self.create_url, {**self.base_post, 'email': 'invalid@.com'})
         self.assertEqual(response.status_code, 200)
         self.assertEqual(Lead.objects.count(), initial_count)
         self.assertFormError(response.context['form'], 'email', 'Enter a valid email address.')
-        
-    def test_form_invalid_work_phone(self):
-        self.client.login(username='lead_create_user', password='password123')
-        initial_count = Lead.objects.count()
-        response = self.client.post(self.create_url, {
-            'first_name': 'Test',
-            'last_name': 'Invalid',
-            'company_name': 'Test Corp',
-            'email': 'test@lead.com',
-            'work_phone': 'invalid_phone',
-            'status': Lead.StatusChoices.NEW,
-            'source': 'Web',
-            'territory': self.territory.pk,
-            'assigned_to': self.test_user.pk
-        })
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(Lead.objects.count(), initial_count)
-        self.assertFormError(response.context['form'], 'work_phone', 'Enter a valid phone number (e.g., +6388019525).')
-
-    def test_form_invalid_email_format(self):
-        self.client.login(username='lead_create_user', password='password123')
-        initial_count = Lead.objects.count()
-        response = self.client.post(self.create_url, {
-            'first_name': 'Test',
-            'last_name': 'Invalid',
-            'company_name': 'Test Corp',
-            'email': 'invalid@.com',
-            'work_phone': '+639088835511',
-            'mobile_phone_1': '+639088835512',
-            'mobile_phone_2': '+639088835513',
-            'status': Lead.StatusChoices.NEW,
-            'source': 'Web',
-            'territory': self.territory.pk,
-            'assigned_to': self.test_user.pk
-        })
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(Lead.objects.count(), initial_count)
-        self.assertFormError(response.context['form'], 'email', 'Enter a valid email address.')
-
-
-# --- Contact Update View Tests ---
-class ContactUpdateViewTest(TestCase):
-
-    @classmethod
-    def setUpTestData(cls):
-        cls.owner_user = create_user(username='contact_update_owner', role=CustomUser.Roles.SALES)
-        cls.other_user = create_user(username='contact_update_other', role=CustomUser.Roles.SALES)
-        cls.admin_user = create_user(username='contact_update_admin', is_superuser=True)
-        cls.account = Account.objects.create(name="Update Contact Account", assigned_to=cls.owner_user)
-        cls.contact_to_update = Contact.objects.create(
-            last_name="UpdateMe", account=cls.account, assigned_to=cls.owner_user
-        )
-        cls.update_url = reverse('crm_entities:contact-update', kwargs={'pk': cls.contact_to_update.pk})
-        cls.list_url = reverse('crm_entities:contact-list')
-
-    def test_update_view_get_page_as_owner(self):
-        self.client.login(username='contact_update_owner', password='password123')
-        response = self.client.get(self.update_url)
-        self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'crm_entities/contact_form.html')
-        self.assertEqual(response.context['form'].initial['last_name'], self.contact_to_update.last_name)
-        self.assertContains(response, 'Update Contact:')
-
-    def test_update_view_get_permission_denied_for_other_user(self):
-        self.client.login(username='contact_update_other', password='password123')
-        response = self.client.get(self.update_url)
-        self.assertEqual(response.status_code, 404)
-
-    def test_update_contact_success_post_as_owner(self):
-        self.client.login(username='contact_update_owner', password='password123')
-        updated_last_name = "UpdatedLastName"
-        updated_title = "Lead Tester"
-        contact_data = {
-            'first_name': self.contact_to_update.first_name or '',
-            'last_name': updated_last_name,
-            'title': updated_title,
-            'account': self.contact_to_update.account.pk,
-            'assigned_to': self.contact_to_update.assigned_to.pk,
-            # Include other required fields from the form if any, or existing values
-            'email': self.contact_to_update.email or '',
-            'department': self.contact_to_update.department or '',
-            'work_phone': self.contact_to_update.work_phone or '',
-            'mobile_phone_1': self.contact_to_update.mobile_phone_1 or '',
-            'mobile_phone_2': self.contact_to_update.mobile_phone_2 or '',
-            'notes': self.contact_to_update.notes or '',
-        }
-        response = self.client.post(self.update_url, data=contact_data)
-        self.assertRedirects(response, self.list_url)
-        self.contact_to_update.refresh_from_db()
-        self.assertEqual(self.contact_to_update.last_name, updated_last_name)
-        self.assertEqual(self.contact_to_update.title, updated_title)
 
 
 # --- Lead Update View Tests ---
@@ -1163,15 +1142,17 @@ class LeadUpdateViewTest(TestCase):
 
     @classmethod
     def setUpTestData(cls):
-        cls.owner_user = create_user(username='lead_update_owner', role=CustomUser.Roles.SALES)
-        cls.other_user = create_user(username='lead_update_other', role=CustomUser.Roles.SALES)
+        cls.owner_user, cls.other_user = CustomUser.objects.bulk_create([
+            fast_user(username='lead_update_owner', role=CustomUser.Roles.SALES),
+            fast_user(username='lead_update_other', role=CustomUser.Roles.SALES),
+        ])
         cls.territory = Territory.objects.create(name="Lead Update Territory")
         cls.lead_to_update = Lead.objects.create(
             last_name="LeadToUpdate", company_name="Update Co", status=Lead.StatusChoices.NEW,
             assigned_to=cls.owner_user, territory=cls.territory
         )
-        cls.update_url = reverse('crm_entities:lead-update', kwargs={'pk': cls.lead_to_update.pk})
-        cls.list_url = reverse('crm_entities:lead-list')
+        cls.update_url = url('crm_entities:lead-update', pk=cls.lead_to_update.pk)
+        cls.list_url = url('crm_entities:lead-list')
 
     def test_update_view_get_page_as_owner(self):
         self.client.login(username='lead_update_owner', password='password123')
@@ -1179,7 +1160,7 @@ class LeadUpdateViewTest(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'crm_entities/lead_form.html')
         self.assertEqual(response.context['form'].initial['last_name'], self.lead_to_update.last_name)
-        self.assertContains(response, 'Update Lead:')
+        self.assertIn('Update Lead:', response.content.decode())
 
     def test_update_view_get_permission_denied_for_other_user(self):
         self.client.login(username='lead_update_other', password='password123')
@@ -1209,164 +1190,152 @@ class LeadUpdateViewTest(TestCase):
         
 # Add these classes to the end of crm_entities/tests/test_views.py
 
-# --- Account Delete View Tests ---
-class AccountDeleteViewTest(TestCase):
-
-    @classmethod
-    def setUpTestData(cls):
-        cls.owner_user = create_user(username='acc_delete_owner', role=CustomUser.Roles.SALES)
-        cls.other_user = create_user(username='acc_delete_other', role=CustomUser.Roles.SALES)
-        cls.admin_user = create_user(username='acc_delete_admin', is_superuser=True)
-
-        cls.account_to_delete = Account.objects.create(name="Delete Me Account", assigned_to=cls.owner_user)
-        cls.delete_url = reverse('crm_entities:account-delete', kwargs={'pk': cls.account_to_delete.pk})
-        cls.list_url = reverse('crm_entities:account-list')
+# --- Delete View Tests ---
+class DeleteViewTestMixin:
+    """
+    Owner/other-user checks shared by the *DeleteView tests.
+    Subclasses set model, template_name and label_field, and create object_to_delete,
+    delete_url, list_url and the owner/other session cookies in setUpTestData.
+    """
+    model = None
+    template_name = None
+    label_field = None  # Field whose value the confirmation page shows
 
     def test_delete_view_get_page_as_owner(self):
         """ Test GET request loads confirmation page for owner """
-        self.client.login(username='acc_delete_owner', password='password123')
+        self.client.cookies.update(self.owner_cookies)
         response = self.client.get(self.delete_url)
         self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'crm_entities/account_confirm_delete.html')
-        self.assertContains(response, 'Are you sure you want to delete')
-        self.assertContains(response, self.account_to_delete.name)
+        self.assertTemplateUsed(response, self.template_name)
+        html = response.content.decode() # Decode once; status is already checked above
+        self.assertIn('Are you sure you want to delete', html)
+        self.assertIn(getattr(self.object_to_delete, self.label_field), html)
 
     def test_delete_view_get_permission_denied_for_other_user(self):
         """ Test other user gets 404 trying to access delete confirmation page """
-        self.client.login(username='acc_delete_other', password='password123')
+        self.client.cookies.update(self.other_cookies)
         response = self.client.get(self.delete_url)
         self.assertEqual(response.status_code, 404)
 
-    def test_delete_account_success_post_as_owner(self):
-        """ Test successfully deleting an account via POST as owner """
-        self.client.login(username='acc_delete_owner', password='password123')
-        initial_count = Account.objects.count()
+    def test_delete_success_post_as_owner(self):
+        """ Test successfully deleting via POST as owner """
+        self.client.cookies.update(self.owner_cookies)
         response = self.client.post(self.delete_url) # POST to confirm deletion
-
-        # Check for successful redirect to the list page
         self.assertRedirects(response, self.list_url)
-        # Check that one account was deleted
-        self.assertEqual(Account.objects.count(), initial_count - 1)
-        # Check that the specific account no longer exists
-        self.assertFalse(Account.objects.filter(pk=self.account_to_delete.pk).exists())
+        self.assertFalse(self.model.objects.filter(pk=self.object_to_delete.pk).exists())
 
-    def test_delete_account_permission_denied_post_other_user(self):
+    def test_delete_permission_denied_post_other_user(self):
         """ Test POST delete fails for user without permission """
-        self.client.login(username='acc_delete_other', password='password123')
-        initial_count = Account.objects.count()
+        self.client.cookies.update(self.other_cookies)
         response = self.client.post(self.delete_url)
         # Should get 404 because get_queryset prevents access before deletion happens
         self.assertEqual(response.status_code, 404)
-        # Verify object was NOT deleted
-        self.assertEqual(Account.objects.count(), initial_count)
-        self.assertTrue(Account.objects.filter(pk=self.account_to_delete.pk).exists())
+        self.assertTrue(self.model.objects.filter(pk=self.object_to_delete.pk).exists())
 
 
-# --- Contact Delete View Tests ---
-class ContactDeleteViewTest(TestCase):
+class AccountDeleteViewTest(DeleteViewTestMixin, TestCase):
+    model = Account
+    template_name = 'crm_entities/account_confirm_delete.html'
+    label_field = 'name'
 
     @classmethod
     def setUpTestData(cls):
-        cls.owner_user = create_user(username='cont_delete_owner', role=CustomUser.Roles.SALES)
-        cls.other_user = create_user(username='cont_delete_other', role=CustomUser.Roles.SALES)
-        cls.test_account = Account.objects.create(name="Delete Contact Account", assigned_to=cls.owner_user)
-        cls.contact_to_delete = Contact.objects.create(last_name="DeleteMeContact", account=cls.test_account, assigned_to=cls.owner_user)
-        cls.delete_url = reverse('crm_entities:contact-delete', kwargs={'pk': cls.contact_to_delete.pk})
-        cls.list_url = reverse('crm_entities:contact-list')
+        cls.owner_user, cls.other_user, cls.admin_user = CustomUser.objects.bulk_create([
+            fast_user(username='acc_delete_owner', role=CustomUser.Roles.SALES),
+            fast_user(username='acc_delete_other', role=CustomUser.Roles.SALES),
+            fast_user(username='acc_delete_admin', is_superuser=True),
+        ])
 
-    def test_delete_view_get_page_as_owner(self):
-        self.client.login(username='cont_delete_owner', password='password123')
-        response = self.client.get(self.delete_url)
-        self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'crm_entities/contact_confirm_delete.html')
-        self.assertContains(response, self.contact_to_delete.last_name)
-
-    def test_delete_view_get_permission_denied_for_other_user(self):
-        self.client.login(username='cont_delete_other', password='password123')
-        response = self.client.get(self.delete_url)
-        self.assertEqual(response.status_code, 404)
+        cls.object_to_delete = Account.objects.create(name="Delete Me Account", assigned_to=cls.owner_user)
+        cls.delete_url = url('crm_entities:account-delete', pk=cls.object_to_delete.pk)
+        cls.list_url = url('crm_entities:account-list')
 
-    def test_delete_contact_success_post_as_owner(self):
-        self.client.login(username='cont_delete_owner', password='password123')
-        initial_count = Contact.objects.count()
-        response = self.client.post(self.delete_url)
-        self.assertRedirects(response, self.list_url)
-        self.assertEqual(Contact.objects.count(), initial_count - 1)
-        self.assertFalse(Contact.objects.filter(pk=self.contact_to_delete.pk).exists())
+        # Log each user in once; tests reuse the session cookie instead of client.login()
+        cls.owner_cookies = _session_cookies(cls.owner_user)
+        cls.other_cookies = _session_cookies(cls.other_user)
 
 
-# --- Lead Delete View Tests ---
-class LeadDeleteViewTest(TestCase):
+class ContactDeleteViewTest(DeleteViewTestMixin, TestCase):
+    model = Contact
+    template_name = 'crm_entities/contact_confirm_delete.html'
+    label_field = 'last_name'
 
     @classmethod
     def setUpTestData(cls):
-        cls.owner_user = create_user(username='lead_delete_owner', role=CustomUser.Roles.SALES)
-        cls.other_user = create_user(username='lead_delete_other', role=CustomUser.Roles.SALES)
-        cls.lead_to_delete = Lead.objects.create(last_name="DeleteMeLead", company_name="Delete Co", assigned_to=cls.owner_user)
-        cls.delete_url = reverse('crm_entities:lead-delete', kwargs={'pk': cls.lead_to_delete.pk})
-        cls.list_url = reverse('crm_entities:lead-list')
+        cls.owner_user, cls.other_user = CustomUser.objects.bulk_create([
+            fast_user(username='cont_delete_owner', role=CustomUser.Roles.SALES),
+            fast_user(username='cont_delete_other', role=CustomUser.Roles.SALES),
+        ])
+        cls.test_account = Account.objects.create(name="Delete Contact Account", assigned_to=cls.owner_user)
+        cls.object_to_delete = Contact.objects.create(last_name="DeleteMeContact", account=cls.test_account, assigned_to=cls.owner_user)
+        cls.delete_url = url('crm_entities:contact-delete', pk=cls.object_to_delete.pk)
+        cls.list_url = url('crm_entities:contact-list')
 
-    def test_delete_view_get_page_as_owner(self):
-        self.client.login(username='lead_delete_owner', password='password123')
-        response = self.client.get(self.delete_url)
-        self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'crm_entities/lead_confirm_delete.html')
-        self.assertContains(response, self.lead_to_delete.last_name)
+        # Log each user in once; tests reuse the session cookie instead of client.login()
+        cls.owner_cookies = _session_cookies(cls.owner_user)
+        cls.other_cookies = _session_cookies(cls.other_user)
 
-    def test_delete_view_get_permission_denied_for_other_user(self):
-        self.client.login(username='lead_delete_other', password='password123')
-        response = self.client.get(self.delete_url)
-        self.assertEqual(response.status_code, 404)
 
-    def test_delete_lead_success_post_as_owner(self):
-        self.client.login(username='lead_delete_owner', password='password123')
-        initial_count = Lead.objects.count()
-        response = self.client.post(self.delete_url)
-        self.assertRedirects(response, self.list_url)
-        self.assertEqual(Lead.objects.count(), initial_count - 1)
-        self.assertFalse(Lead.objects.filter(pk=self.lead_to_delete.pk).exists())
-        
+class LeadDeleteViewTest(DeleteViewTestMixin, TestCase):
+    model = Lead
+    template_name = 'crm_entities/lead_confirm_delete.html'
+    label_field = 'last_name'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner_user, cls.other_user = CustomUser.objects.bulk_create([
+            fast_user(username='lead_delete_owner', role=CustomUser.Roles.SALES),
+            fast_user(username='lead_delete_other', role=CustomUser.Roles.SALES),
+        ])
+        cls.object_to_delete = Lead.objects.create(last_name="DeleteMeLead", company_name="Delete Co", assigned_to=cls.owner_user)
+        cls.delete_url = url('crm_entities:lead-delete', pk=cls.object_to_delete.pk)
+        cls.list_url = url('crm_entities:lead-list')
+
+        # Log each user in once; tests reuse the session cookie instead of client.login()
+        cls.owner_cookies = _session_cookies(cls.owner_user)
+        cls.other_cookies = _session_cookies(cls.other_user)
 
 
 class LeadConvertViewTest(TestCase):
+    # Nothing here needs DB contents restored after rollback; keep the test DB from being serialized
+    serialized_rollback = False
 
     @classmethod
     def setUpTestData(cls):
         # Create users first
-        cls.test_user = create_user(username='lead_convert_user_v3', role=CustomUser.Roles.SALES)
-        cls.other_user = create_user('convert_other_user_v3', role=CustomUser.Roles.SALES)
+        cls.test_user, cls.other_user = CustomUser.objects.bulk_create([
+            fast_user(username='lead_convert_user_v3', role=CustomUser.Roles.SALES),
+            fast_user('convert_other_user_v3', role=CustomUser.Roles.SALES),
+        ])
 
         # Create leads AFTER users, ensuring assignment is clear
         # Use very distinct names to help database query later if needed
-        cls.lead_to_convert = Lead.objects.create(
-            first_name="Ready_v3", last_name="ToConvert", company_name="ConvertCorp Success Test v3",
-            email="convert_v3@example.com", status=Lead.StatusChoices.QUALIFIED,
-            assigned_to=cls.test_user, created_by=cls.test_user
-        )
-        cls.lead_already_converted = Lead.objects.create(
-            first_name="Already_v3", last_name="Done", company_name="Converted Inc Test v3",
-            email="done_v3@example.com", status=Lead.StatusChoices.CONVERTED,
-            assigned_to=cls.test_user, created_by=cls.test_user
-        )
-        cls.other_lead = Lead.objects.create(
-            last_name="OtherLeadToConvert_v3", status=Lead.StatusChoices.QUALIFIED, assigned_to=cls.other_user
-        )
+        cls.lead_to_convert, cls.lead_already_converted, cls.other_lead = Lead.objects.bulk_create([
+            Lead(
+                first_name="Ready_v3", last_name="ToConvert", company_name="ConvertCorp Success Test v3",
+                email="convert_v3@example.com", status=Lead.StatusChoices.QUALIFIED,
+                assigned_to=cls.test_user, created_by=cls.test_user
+            ),
+            Lead(
+                first_name="Already_v3", last_name="Done", company_name="Converted Inc Test v3",
+                email="done_v3@example.com", status=Lead.StatusChoices.CONVERTED,
+                assigned_to=cls.test_user, created_by=cls.test_user
+            ),
+            Lead(last_name="OtherLeadToConvert_v3", status=Lead.StatusChoices.QUALIFIED, assigned_to=cls.other_user),
+        ])
+
+        # PKs are fixed for the class, so build the URLs once
+        cls.convert_url = url('crm_entities:lead-convert', pk=cls.lead_to_convert.pk)
+        cls.already_converted_url = url('crm_entities:lead-convert', pk=cls.lead_already_converted.pk)
+        cls.other_convert_url = url('crm_entities:lead-convert', pk=cls.other_lead.pk)
+        cls.other_lead_detail_url = url('crm_entities:lead-detail', pk=cls.other_lead.pk)
 
     def setUp(self):
         # Login the primary test user for most tests
         self.client.login(username='lead_convert_user_v3', password='password123')
-        # Define URLs within setUp or test methods using correct PKs directly
-        self.convert_url = reverse('crm_entities:lead-convert', kwargs={'pk': self.lead_to_convert.pk})
-        self.already_converted_url = reverse('crm_entities:lead-convert', kwargs={'pk': self.lead_already_converted.pk})
-        self.other_convert_url = reverse('crm_entities:lead-convert', kwargs={'pk': self.other_lead.pk})
-        self.other_lead_detail_url = reverse('crm_entities:lead-detail', kwargs={'pk': self.other_lead.pk})
 
     def test_convert_lead_success(self):
         """ Test successful lead conversion via POST request """
-        initial_account_count = Account.objects.count()
-        initial_contact_count = Contact.objects.count()
-        initial_deal_count = Deal.objects.count()
-
         # Use the specific URL for the lead we want to convert
         response = self.client.post(self.convert_url)
 
@@ -1378,13 +1347,12 @@ class LeadConvertViewTest(TestCase):
         new_account = Account.objects.filter(name="ConvertCorp Success Test v3").first()
         self.assertIsNotNone(new_account, "New account 'ConvertCorp Success Test v3' should have been created")
 
-        expected_redirect_url = reverse('crm_entities:account-detail', kwargs={'pk': new_account.pk})
+        expected_redirect_url = url('crm_entities:account-detail', pk=new_account.pk)
         self.assertEqual(response.url, expected_redirect_url, "Should redirect to the new account's detail page.")
 
-        # 2. Check Object Creation
-        self.assertEqual(Account.objects.count(), initial_account_count + 1, "Account count should increment")
-        self.assertEqual(Contact.objects.count(), initial_contact_count + 1, "Contact count should increment")
-        self.assertEqual(Deal.objects.count(), initial_deal_count + 1, "Deal count should increment")
+        # 2. Check Object Creation (the account was found above)
+        self.assertTrue(Contact.objects.filter(email="convert_v3@example.com").exists(), "Contact should have been created")
+        self.assertTrue(Deal.objects.filter(account=new_account).exists(), "Deal should have been created")
 
         # 3. Check Lead Status Update
         self.lead_to_convert.refresh_from_db()
@@ -1398,18 +1366,16 @@ class LeadConvertViewTest(TestCase):
 
     def test_convert_already_converted_lead(self):
         """ Test attempting to convert an already converted lead """
-        initial_account_count = Account.objects.count()
         response = self.client.post(self.already_converted_url)
         # Check it redirects back to the lead detail page
-        expected_redirect_url = reverse('crm_entities:lead-detail', kwargs={'pk': self.lead_already_converted.pk})
+        expected_redirect_url = url('crm_entities:lead-detail', pk=self.lead_already_converted.pk)
         self.assertEqual(response.status_code, 302)
         self.assertEqual(response.url, expected_redirect_url)
-        # Check no new objects were created
-        self.assertEqual(Account.objects.count(), initial_account_count)
+        # Check no new objects were created (this class creates no accounts up front)
+        self.assertFalse(Account.objects.exists())
 
     def test_convert_permission_denied(self):
         """ Test converting a lead not assigned to user fails and redirects correctly """
-        initial_account_count = Account.objects.count()
         response = self.client.post(self.other_convert_url) # User 'lead_convert_user_v3' tries to convert 'other_lead'
 
         # Check it redirects (302) back to the detail page of the lead they TRIED to convert
@@ -1417,27 +1383,32 @@ class LeadConvertViewTest(TestCase):
         self.assertEqual(response.url, self.other_lead_detail_url)
 
         # Verify no conversion actually happened
-        self.assertEqual(Account.objects.count(), initial_account_count)
+        self.assertFalse(Account.objects.exists())
         self.other_lead.refresh_from_db()
         self.assertEqual(self.other_lead.status, Lead.StatusChoices.QUALIFIED) # Status should not change
         
+    def test_convert_with_existing_account_name(self):
+        Account.objects.create(name="ConvertCorp Success Test v3", assigned_to=self.other_user)
+        response = self.client.post(self.convert_url)
+        self.assertRedirects(response, url('crm_entities:lead-detail', pk=self.lead_to_convert.pk))
+        # The whole conversion rolls back
+        self.assertFalse(Contact.objects.filter(email="convert_v3@example.com").exists())
+        self.lead_to_convert.refresh_from_db()
+        self.assertEqual(self.lead_to_convert.status, Lead.StatusChoices.QUALIFIED)
+
     def test_convert_invalid_lead(self):
-        self.client.login(username='lead_convert_user_v3', password='password123')
-        invalid_url = reverse('crm_entities:lead-convert', kwargs={'pk': 999})
+        invalid_url = url('crm_entities:lead-convert', pk=999)
         response = self.client.post(invalid_url)
         self.assertEqual(response.status_code, 302)  # Redirects to list page
-        self.assertRedirects(response, reverse('crm_entities:lead-list'))
+        self.assertRedirects(response, url('crm_entities:lead-list'))
         
     def test_convert_with_empty_data(self):
-        self.client.login(username='lead_convert_user_v3', password='password123')
-        initial_account_count = Account.objects.count()
         response = self.client.post(self.convert_url, {})
         self.assertEqual(response.status_code, 302)  # Redirects to new account
-        self.assertEqual(Account.objects.count(), initial_account_count + 1)  # New account created
         self.lead_to_convert.refresh_from_db()
         self.assertEqual(self.lead_to_convert.status, Lead.StatusChoices.CONVERTED)  # Lead converted
-        new_account = Account.objects.latest('created_at')
-        self.assertRedirects(response, reverse('crm_entities:account-detail', kwargs={'pk': new_account.pk}))
+        new_account = Account.objects.get(name=self.lead_to_convert.company_name)  # New account created
+        self.assertRedirects(response, url('crm_entities:account-detail', pk=new_account.pk))
 
 # --- Export View Tests ---
 class CrmEntitiesExportViewTest(TestCase):
@@ -1445,61 +1416,95 @@ class CrmEntitiesExportViewTest(TestCase):
     @classmethod
     def setUpTestData(cls):
         # Create users with different roles
-        cls.sales_user = create_user(username='export_test_sales', role=CustomUser.Roles.SALES)
-        cls.manager_user = create_user(username='export_test_manager', role=CustomUser.Roles.MANAGER)
-        cls.admin_user = create_user(username='export_test_admin', is_superuser=True)
+        cls.sales_user, cls.manager_user, cls.admin_user = CustomUser.objects.bulk_create([
+            fast_user(username='export_test_sales', role=CustomUser.Roles.SALES),
+            fast_user(username='export_test_manager', role=CustomUser.Roles.MANAGER),
+            fast_user(username='export_test_admin', is_superuser=True),
+        ])
 
         # URLs for export views
-        cls.account_export_url = reverse('crm_entities:account-export')
-        cls.contact_export_url = reverse('crm_entities:contact-export')
-        cls.lead_export_url = reverse('crm_entities:lead-export')
+        cls.account_export_url = url('crm_entities:account-export')
+        cls.contact_export_url = url('crm_entities:contact-export')
+        cls.lead_export_url = url('crm_entities:lead-export')
+
+        # Log each user in once; tests reuse the session cookie instead of client.login()
+        cls.sales_cookies = _session_cookies(cls.sales_user)
+        cls.manager_cookies = _session_cookies(cls.manager_user)
+        cls.admin_cookies = _session_cookies(cls.admin_user)
 
     # Test Permissions (Non-Admins should be Forbidden)
-    def test_export_permission_denied_for_sales(self):
-        self.client.login(username='export_test_sales', password='password123')
-        response_acc = self.client.get(self.account_export_url)
-        response_con = self.client.get(self.contact_export_url)
-        response_lead = self.client.get(self.lead_export_url)
-        self.assertEqual(response_acc.status_code, 403, "Sales user should get 403 Forbidden for account export")
-        self.assertEqual(response_con.status_code, 403, "Sales user should get 403 Forbidden for contact export")
-        self.assertEqual(response_lead.status_code, 403, "Sales user should get 403 Forbidden for lead export")
-
-    def test_export_permission_denied_for_manager(self):
-        self.client.login(username='export_test_manager', password='password123')
-        response_acc = self.client.get(self.account_export_url)
-        response_con = self.client.get(self.contact_export_url)
-        response_lead = self.client.get(self.lead_export_url)
-        self.assertEqual(response_acc.status_code, 403, "Manager should get 403 Forbidden for account export")
-        self.assertEqual(response_con.status_code, 403, "Manager should get 403 Forbidden for contact export")
-        self.assertEqual(response_lead.status_code, 403, "Manager should get 403 Forbidden for lead export")
+    def test_export_permission_denied_for_non_admins(self):
+        export_urls = (self.account_export_url, self.contact_export_url, self.lead_export_url)
+        for role, cookies in (('sales', self.sales_cookies), ('manager', self.manager_cookies)):
+            self.client.cookies.update(cookies)
+            for export_url in export_urls:
+                with self.subTest(role=role, url=export_url):
+                    self.assertEqual(self.client.get(export_url).status_code, 403)
 
     # Test Success for Admin
     def test_account_export_success_for_admin(self):
-        self.client.login(username='export_test_admin', password='password123')
-        response = self.client.get(self.account_export_url)
+        self.client.cookies.update(self.admin_cookies)
+        # User + one joined export query, however many rows there are (sessions live in the cookie)
+        with self.assertNumQueries(2):
+            response = self.client.get(self.account_export_url)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response['content-type'], 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
         self.assertTrue(response['content-disposition'].startswith('attachment; filename="accounts_export.xlsx"'))
 
     def test_contact_export_success_for_admin(self):
-        self.client.login(username='export_test_admin', password='password123')
-        response = self.client.get(self.contact_export_url)
+        self.client.cookies.update(self.admin_cookies)
+        # User + one joined export query, however many rows there are (sessions live in the cookie)
+        with self.assertNumQueries(2):
+            response = self.client.get(self.contact_export_url)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response['content-type'], 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
         self.assertTrue(response['content-disposition'].startswith('attachment; filename="contacts_export.xlsx"'))
 
     def test_lead_export_success_for_admin(self):
-        self.client.login(username='export_test_admin', password='password123')
-        response = self.client.get(self.lead_export_url)
+        self.client.cookies.update(self.admin_cookies)
+        # User + one joined export query, however many rows there are (sessions live in the cookie)
+        with self.assertNumQueries(2):
+            response = self.client.get(self.lead_export_url)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response['content-type'], 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
         self.assertTrue(response['content-disposition'].startswith('attachment; filename="leads_export.xlsx"'))
 
+    def test_account_export_streams_readable_workbook(self):
+        Account.objects.create(name="Streamed Export Account", assigned_to=self.admin_user)
+        self.client.cookies.update(self.admin_cookies)
+        response = self.client.get(self.account_export_url)
+        self.assertTrue(response.streaming)
+        wb = openpyxl.load_workbook(io.BytesIO(b''.join(response.streaming_content)))
+        rows = list(wb["Accounts"].values)
+        self.assertEqual(rows[0][:2], ("ID", "Name"))
+        self.assertEqual(rows[1][1], "Streamed Export Account")
+        # No first/last name set, so "Assigned To" falls back to the username
+        self.assertEqual(rows[1][9], "export_test_admin")
+
+    def test_account_export_csv_format(self):
+        Account.objects.create(name="CSV Export Account", assigned_to=self.admin_user)
+        self.client.cookies.update(self.admin_cookies)
+        response = self.client.get(self.account_export_url, {'format': 'csv', 'name': 'CSV Export'})
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertIn('accounts_export.csv', response['Content-Disposition'])
+        rows = list(csv.reader(io.StringIO(b''.join(response.streaming_content).decode())))
+        self.assertEqual(rows[0][:2], ["ID", "Name"])
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[1][1], "CSV Export Account")
+        self.assertRegex(rows[1][10], r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$')
+
+    def test_windowed_rows_keep_sort_order_across_windows(self):
+        for name in ("Window C", "Window A", "Window B"):
+            Account.objects.create(name=name, assigned_to=self.admin_user)
+        queryset = Account.objects.filter(name__startswith="Window").order_by('-name').values_list('pk', 'name')
+        rows = list(_windowed_rows(queryset, chunk_size=2))
+        self.assertEqual([name for _, name in rows], ["Window C", "Window B", "Window A"])
+
     # Test redirect if not logged in
     def test_export_redirects_if_not_logged_in(self):
         self.client.logout()
         response = self.client.get(self.account_export_url) # Test one is enough
-        login_url = reverse('login')
+        login_url = url('login')
         # Note: @login_required redirects differently than LoginRequiredMixin
         # It might redirect directly to login without the ?next= part for simple GET
         # Let's check for redirect status first, then target URL if needed
@@ -1513,61 +1518,76 @@ class CrmEntitiesExportViewTest(TestCase):
 
 # --- Autocomplete View Tests ---
 class CrmEntitiesAutocompleteViewTest(TestCase):
+    # Nothing here needs DB contents restored after rollback; keep the test DB from being serialized
+    serialized_rollback = False
 
     @classmethod
     def setUpTestData(cls):
-        # Users
-        cls.admin_user = create_user(username='auto_admin', is_superuser=True)
-        cls.manager_user = create_user(username='auto_manager', role=CustomUser.Roles.MANAGER)
-        cls.sales_user1 = create_user(username='auto_sales1', role=CustomUser.Roles.SALES)
-        cls.sales_user2 = create_user(username='auto_sales2', role=CustomUser.Roles.SALES)
-
-        # Territories & Manager Assignment
+        # Territory first so sales_user1 can be inserted with it (no follow-up save())
         cls.t1 = Territory.objects.create(name="Autocomplete Territory 1")
+
+        # Users
+        cls.admin_user, cls.manager_user, cls.sales_user1, cls.sales_user2 = CustomUser.objects.bulk_create([
+            fast_user(username='auto_admin', is_superuser=True),
+            fast_user(username='auto_manager', role=CustomUser.Roles.MANAGER),
+            fast_user(username='auto_sales1', role=CustomUser.Roles.SALES, territory=cls.t1),
+            fast_user(username='auto_sales2', role=CustomUser.Roles.SALES),
+        ])
+
+        # Manager Assignment
         cls.manager_user.managed_territories.add(cls.t1)
-        cls.sales_user1.territory = cls.t1
-        cls.sales_user1.save()
 
         # Accounts
-        cls.acc1 = Account.objects.create(name="Alpha Test Account", assigned_to=cls.sales_user1, territory=cls.t1)
-        cls.acc2 = Account.objects.create(name="Beta Test Account", assigned_to=cls.sales_user2)
-        cls.acc3 = Account.objects.create(name="Gamma Admin Account", assigned_to=cls.admin_user)
+        cls.acc1, cls.acc2, cls.acc3 = Account.objects.bulk_create([
+            Account(name="Alpha Test Account", assigned_to=cls.sales_user1, territory=cls.t1),
+            Account(name="Beta Test Account", assigned_to=cls.sales_user2),
+            Account(name="Gamma Admin Account", assigned_to=cls.admin_user),
+        ])
 
         # Contacts (Link some to acc1 for forwarding test)
-        cls.cont1 = Contact.objects.create(last_name="ContactAlpha", account=cls.acc1, assigned_to=cls.sales_user1)
-        cls.cont2 = Contact.objects.create(last_name="ContactBeta", account=cls.acc2, assigned_to=cls.sales_user2)
-        cls.cont3 = Contact.objects.create(last_name="ContactAlpha2", account=cls.acc1, assigned_to=cls.sales_user1) # Another for acc1
+        cls.cont1, cls.cont2, cls.cont3 = Contact.objects.bulk_create([
+            Contact(last_name="ContactAlpha", account=cls.acc1, assigned_to=cls.sales_user1),
+            Contact(last_name="ContactBeta", account=cls.acc2, assigned_to=cls.sales_user2),
+            Contact(last_name="ContactAlpha2", account=cls.acc1, assigned_to=cls.sales_user1), # Another for acc1
+        ])
 
         # Leads
-        cls.lead1 = Lead.objects.create(last_name="LeadAlpha", status=Lead.StatusChoices.QUALIFIED, assigned_to=cls.sales_user1)
-        cls.lead2 = Lead.objects.create(last_name="LeadBeta", status=Lead.StatusChoices.NEW, assigned_to=cls.sales_user2)
+        cls.lead1, cls.lead2, cls.converted_lead = Lead.objects.bulk_create([
+            Lead(last_name="LeadAlpha", status=Lead.StatusChoices.QUALIFIED, assigned_to=cls.sales_user1),
+            Lead(last_name="LeadBeta", status=Lead.StatusChoices.NEW, assigned_to=cls.sales_user2),
+            # Converted lead that the lead autocomplete must never return
+            Lead(last_name="ShouldNotAppear", status=Lead.StatusChoices.CONVERTED, assigned_to=cls.admin_user),
+        ])
 
         # Deal (Needed for contact forwarding test)
-        # Ensure Deal model import is available if not already global
-        from sales_pipeline.models import Deal
         cls.deal_for_acc1 = Deal.objects.create(name="Deal for Acc1", account=cls.acc1, stage=Deal.StageChoices.PROSPECTING, amount=100, close_date=date.today())
 
 
         # URLs
-        cls.acc_auto_url = reverse('crm_entities:account-autocomplete')
-        cls.cont_auto_url = reverse('crm_entities:contact-autocomplete')
-        cls.lead_auto_url = reverse('crm_entities:lead-autocomplete')
+        cls.acc_auto_url = url('crm_entities:account-autocomplete')
+        cls.cont_auto_url = url('crm_entities:contact-autocomplete')
+        cls.lead_auto_url = url('crm_entities:lead-autocomplete')
+
+        # Log each user in once; tests reuse the session cookie instead of client.login()
+        cls.admin_cookies = _session_cookies(cls.admin_user)
+        cls.sales_user2_cookies = _session_cookies(cls.sales_user2)
 
     # --- Account Autocomplete Tests ---
 
     def test_account_autocomplete_login_required(self):
         """ Test autocomplete view redirects if not logged in """
         response = self.client.get(self.acc_auto_url) # Make request without login
-        login_url = reverse('login')
+        login_url = url('login')
         # Check it redirects to login page, appending the original URL as 'next'
         self.assertRedirects(response, f'{login_url}?next={self.acc_auto_url}')
 
     def test_account_autocomplete_admin_search(self):
-        self.client.login(username='auto_admin', password='password123')
-        response = self.client.get(self.acc_auto_url, data={'q': 'Test Account'})
+        self.client.cookies.update(self.admin_cookies)
+        # User + paginator COUNT + one page SELECT
+        with self.assertNumQueries(3):
+            response = self.client.get(self.acc_auto_url, data={'q': 'Test Account'})
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response['content-type'], 'application/json')
-        content = json.loads(response.content)
+        content = response.json()
         self.assertIn('results', content)
         # Admin sees all accounts matching
         self.assertEqual(len(content['results']), 2) # Alpha Test Account, Beta Test Account
@@ -1577,33 +1597,50 @@ class CrmEntitiesAutocompleteViewTest(TestCase):
         self.assertNotIn("Gamma Admin Account", result_names) # Doesn't contain 'Test Account'
 
     def test_account_autocomplete_sales_permissions(self):
-        self.client.login(username='auto_sales2', password='password123') # Sales user 2
+        self.client.cookies.update(self.sales_user2_cookies) # Sales user 2
         response = self.client.get(self.acc_auto_url, data={'q': 'Account'}) # Search broadly
         self.assertEqual(response.status_code, 200)
-        content = json.loads(response.content)
+        content = response.json()
         # Sales user 2 should only see acc2 (Beta Test Account) based on simple assign/create logic
         self.assertEqual(len(content['results']), 1)
         self.assertEqual(content['results'][0]['text'], "Beta Test Account")
 
+    def test_account_autocomplete_short_term_matches_prefix(self):
+        self.client.cookies.update(self.admin_cookies)
+        # Two characters: prefix match only, so "Ac" no longer hits every "... Account"
+        self.assertEqual(self.client.get(self.acc_auto_url, data={'q': 'Ac'}).json()['results'], [])
+        results = self.client.get(self.acc_auto_url, data={'q': 'be'}).json()['results']
+        self.assertEqual([r['text'] for r in results], ["Beta Test Account"])
+
+    def test_account_autocomplete_no_n_plus_one(self):
+        """ Query count stays flat no matter how many accounts match """
+        Account.objects.bulk_create([Account(name=f"Bulk {i}", assigned_to=self.admin_user) for i in range(20)])
+        self.client.cookies.update(self.admin_cookies)
+        # User + paginator COUNT + one page SELECT; no per-row lookups for the labels
+        with self.assertNumQueries(3):
+            response = self.client.get(self.acc_auto_url, data={'q': 'Bulk'})
+        self.assertEqual(len(response.json()['results']), 10) # One page
+
     # --- Contact Autocomplete Tests ---
 
     def test_contact_autocomplete_basic_search(self):
-        self.client.login(username='auto_admin', password='password123')
+        self.client.cookies.update(self.admin_cookies)
         response = self.client.get(self.cont_auto_url, data={'q': 'Alpha'})
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response['content-type'], 'application/json')
-        content = json.loads(response.content)
+        content = response.json()
         self.assertIn('results', content)
         # Should find ContactAlpha and ContactAlpha2
         self.assertEqual(len(content['results']), 2)
 
     def test_contact_autocomplete_forwarding(self):
         """ Test that contact results are filtered by deal's account when deal is forwarded """
-        self.client.login(username='auto_admin', password='password123')
+        self.client.cookies.update(self.admin_cookies)
         # Request contacts related to the deal linked to acc1
-        response = self.client.get(self.cont_auto_url, data={'forward': json.dumps({'deal': self.deal_for_acc1.pk})})
+        # User + forwarded deal lookup + paginator COUNT + one page SELECT
+        with self.assertNumQueries(4):
+            response = self.client.get(self.cont_auto_url, data={'forward': json.dumps({'deal': self.deal_for_acc1.pk})})
         self.assertEqual(response.status_code, 200)
-        content = json.loads(response.content)
+        content = response.json()
         self.assertIn('results', content)
         # Should only see contacts linked to acc1 (cont1, cont3)
         self.assertEqual(len(content['results']), 2)
@@ -1614,18 +1651,26 @@ class CrmEntitiesAutocompleteViewTest(TestCase):
         # Request contacts related to a non-existent deal pk (should return none)
         response_bad_deal = self.client.get(self.cont_auto_url, data={'forward': json.dumps({'deal': 9999})})
         self.assertEqual(response_bad_deal.status_code, 200)
-        content_bad_deal = json.loads(response_bad_deal.content)
+        content_bad_deal = response_bad_deal.json()
         self.assertEqual(len(content_bad_deal['results']), 0)
 
+    def test_contact_autocomplete_no_n_plus_one(self):
+        """ Query count stays flat no matter how many contacts match """
+        Contact.objects.bulk_create([
+            Contact(last_name=f"Bulk {i}", account=self.acc1, assigned_to=self.admin_user) for i in range(20)
+        ])
+        self.client.cookies.update(self.admin_cookies)
+        with self.assertNumQueries(3):
+            response = self.client.get(self.cont_auto_url, data={'q': 'Bulk'})
+        self.assertEqual(len(response.json()['results']), 10)
+
     # --- Lead Autocomplete Tests ---
 
     def test_lead_autocomplete_excludes_converted(self):
-        self.client.login(username='auto_admin', password='password123')
-        # Create a converted lead for this test that shouldn't appear
-        Lead.objects.create(last_name="ShouldNotAppear", status=Lead.StatusChoices.CONVERTED, assigned_to=self.admin_user)
+        self.client.cookies.update(self.admin_cookies)
         response = self.client.get(self.lead_auto_url, data={'q': 'Lead'}) # Search broadly
         self.assertEqual(response.status_code, 200)
-        content = json.loads(response.content)
+        content = response.json()
         result_names = {r['text'] for r in content['results']}
         # Should find LeadAlpha and LeadBeta, but not ShouldNotAppear or ConvertedLeadTest from other class
         self.assertIn("LeadAlpha", result_names)
@@ -1,13 +1,13 @@
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
-from django.db import transaction
-from django.db.models import Q
-from django.http import HttpResponse, HttpResponseForbidden
+from django.db import IntegrityError, transaction
+from django.db.models import DateTimeField, F, Func, Q, Value
+from django.db.models.functions import Coalesce, Concat, NullIf, Trim
+from django.http import HttpResponseForbidden, QueryDict, StreamingHttpResponse
 from django.shortcuts import render, get_object_or_404, redirect
 from django.urls import reverse_lazy
 from django.utils import timezone
-from django.utils.timezone import localtime
 from django.views import View
 from django.views.generic import (
     ListView,
@@ -16,93 +16,92 @@ from django.views.generic import (
     UpdateView,
     DeleteView,
 )
-from datetime import timedelta
-import openpyxl
+from datetime import datetime, timedelta
+import csv
+import logging
 
 from dal import autocomplete
 
+from core.exports import EXPORT_CHUNK_SIZE, xlsx_export_response
+
 from .filters import AccountFilter, ContactFilter, LeadFilter
 from .forms import AccountForm, ContactForm, LeadForm
 from .models import Account, Contact, Lead
+from .pagination import EstimatedCountMixin, KeysetPaginationMixin
 from sales_pipeline.models import Deal
-from sales_territories.models import Territory
-from users.models import CustomUser
-
 
-class BaseCrmView(LoginRequiredMixin):
-    """Basic Mixin to require login and contain role filtering helper"""
 
-    def _filter_queryset_by_role(self, user, queryset):
-        if not hasattr(self, 'model'):
-            return queryset.none()
+logger = logging.getLogger(__name__)
+
+# Sortable columns per list; shared by the list views and their exports
+ACCOUNT_SORT_FIELDS = frozenset({
+    'name',
+    'status',
+    'territory__name',
+    'assigned_to__username',
+    'updated_at',
+})
+
+CONTACT_SORT_FIELDS = frozenset({
+    'last_name',
+    'first_name',
+    'account__name',
+    'title',
+    'department',
+    'email',
+    'assigned_to__username',
+    'updated_at',
+})
+
+LEAD_SORT_FIELDS = frozenset({
+    'last_name',
+    'first_name',
+    'company_name',
+    'status',
+    'source',
+    'territory__name',
+    'assigned_to__username',
+    'updated_at',
+})
+
+# Sorting/paging keys carried in the list URLs alongside the filter fields
+UI_PARAMS = frozenset(('sort', 'dir', 'page', 'cursor', 'format'))
+
+
+def _strip_ui_params(query_dict):
+    """Returns the GET params with only the filter fields left (rebuilt, not deep-copied)"""
+    params = QueryDict(mutable=True)
+    for key, values in query_dict.lists():
+        if key not in UI_PARAMS:
+            params.setlist(key, list(values))
+    return params
 
-        if user.is_admin_role:
-            return queryset
-        elif user.is_manager_role:
-            try:
-                managed_territories = user.managed_territories.all()
-                team_members = CustomUser.objects.filter(
-                    territory__in=managed_territories,
-                    role=CustomUser.Roles.SALES,
-                ).exclude(pk=user.pk)
-
-                base_q = (
-                    Q(assigned_to=user) |
-                    Q(created_by=user) |
-                    Q(assigned_to__in=team_members) |
-                    Q(created_by__in=team_members)
-                )
 
-                if hasattr(self.model, 'territory') and hasattr(Territory, 'objects'):
-                    base_q |= Q(territory__in=managed_territories)
-                elif hasattr(self.model, 'account') and hasattr(Account, 'territory'):
-                    base_q |= Q(account__territory__in=managed_territories)
-
-                return queryset.filter(base_q).distinct()
-            except Exception as e:
-                print(f"Error applying manager role filter for {self.model.__name__}: {e}")
-                return queryset.filter(
-                    Q(assigned_to=user) | Q(created_by=user)
-                ).distinct()
-        elif user.is_sales_role:
-            return queryset.filter(
-                Q(assigned_to=user) | Q(created_by=user)
-            ).distinct()
-        else:
-            return queryset.none()
+class BaseCrmView(LoginRequiredMixin):
+    """Basic Mixin to require login; role scoping lives on the model querysets (for_user)"""
 
 
-class AccountListView(BaseCrmView, ListView):
+class AccountListView(KeysetPaginationMixin, EstimatedCountMixin, BaseCrmView, ListView):
     model = Account
     context_object_name = 'accounts'
     template_name = 'crm_entities/account_list.html'
     paginate_by = 15
+    keyset_sort_fields = ('name', 'updated_at')
     sort_by_applied = 'name'
     direction_applied = 'asc'
 
     def get_queryset(self):
         user = self.request.user
-        base_queryset = Account.objects.all()
-        queryset = self._filter_queryset_by_role(user, base_queryset)
+        queryset = Account.objects.for_user(user)
 
-        filter_params = self.request.GET.copy()
-        filter_params.pop('sort', None)
-        filter_params.pop('dir', None)
-        filter_params.pop('page', None)
+        filter_params = _strip_ui_params(self.request.GET)
         self.filterset = AccountFilter(filter_params, queryset=queryset)
         queryset = self.filterset.qs
 
         sort_by_param = self.request.GET.get('sort', 'name')
         direction_param = self.request.GET.get('dir', 'asc')
-        valid_sort_fields = [
-            'name',
-            'status',
-            'territory__name',
-            'assigned_to__username',
-            'updated_at',
-        ]
         sort_by_validated = sort_by_param.lstrip('-')
-        if sort_by_validated not in valid_sort_fields:
+        if sort_by_validated not in ACCOUNT_SORT_FIELDS:
             sort_by_validated = 'name'
             direction_validated = 'asc'
         else:
@@ -114,10 +113,25 @@ class AccountListView(BaseCrmView, ListView):
             else self.sort_by_applied
         )
 
-        queryset = queryset.order_by(sort_by_final).select_related(
+        # pk tiebreak gives a stable total order (required by the keyset cursor)
+        queryset = queryset.order_by(
+            sort_by_final, '-pk' if self.direction_applied == 'desc' else 'pk'
+        ).select_related(
             'territory',
             'assigned_to',
         )
+        # Only the columns the list template renders; the wide text fields stay unread
+        queryset = queryset.only(
+            'name',
+            'status',
+            'updated_at',
+            'territory',
+            'territory__name',
+            'assigned_to',
+            'assigned_to__username',
+            'assigned_to__first_name',
+            'assigned_to__last_name',
+        )
         return queryset
 
     def get_context_data(self, **kwargs):
@@ -128,11 +142,9 @@ class AccountListView(BaseCrmView, ListView):
         context['opposite_direction'] = (
             'desc' if self.direction_applied == 'asc' else 'asc'
         )
-        query_params = self.request.GET.copy()
-        query_params.pop('sort', None)
-        query_params.pop('dir', None)
-        query_params.pop('page', None)
-        context['current_filters_encoded'] = query_params.urlencode()
+        # Same filter-only params get_queryset built (FilterSet keeps {} when there are none)
+        filter_data = self.filterset.data
+        context['current_filters_encoded'] = filter_data.urlencode() if filter_data else ''
         return context
 
 
@@ -148,7 +160,7 @@ class AccountDetailView(BaseCrmView, DetailView):
             'assigned_to',
             'created_by',
         )
-        return self._filter_queryset_by_role(user, queryset)
+        return queryset.for_user(user)
 
 
 class AccountCreateView(BaseCrmView, CreateView):
@@ -178,7 +190,7 @@ class AccountUpdateView(BaseCrmView, UpdateView):
     def get_queryset(self):
         user = self.request.user
         queryset = super().get_queryset()
-        return self._filter_queryset_by_role(user, queryset)
+        return queryset.for_user(user)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -196,42 +208,29 @@ class AccountDeleteView(PermissionRequiredMixin, BaseCrmView, DeleteView):
     def get_queryset(self):
         user = self.request.user
         queryset = super().get_queryset()
-        return self._filter_queryset_by_role(user, queryset)
+        return queryset.for_user(user)
 
 
-class ContactListView(BaseCrmView, ListView):
+class ContactListView(KeysetPaginationMixin, EstimatedCountMixin, BaseCrmView, ListView):
     model = Contact
     context_object_name = 'contacts'
     template_name = 'crm_entities/contact_list.html'
     paginate_by = 15
+    keyset_sort_fields = ('last_name', 'updated_at')
     sort_by_applied = 'last_name'
     direction_applied = 'asc'
 
     def get_queryset(self):
         user = self.request.user
-        base_queryset = Contact.objects.all()
-        queryset = self._filter_queryset_by_role(user, base_queryset)
-        filter_params = self.request.GET.copy()
-        filter_params.pop('sort', None)
-        filter_params.pop('dir', None)
-        filter_params.pop('page', None)
+        queryset = Contact.objects.for_user(user)
+        filter_params = _strip_ui_params(self.request.GET)
         self.filterset = ContactFilter(filter_params, queryset=queryset)
         queryset = self.filterset.qs
 
         sort_by_param = self.request.GET.get('sort', 'last_name')
         direction_param = self.request.GET.get('dir', 'asc')
-        valid_sort_fields = [
-            'last_name',
-            'first_name',
-            'account__name',
-            'title',
-            'department',
-            'email',
-            'assigned_to__username',
-            'updated_at',
-        ]
         sort_by_validated = sort_by_param.lstrip('-')
-        if sort_by_validated not in valid_sort_fields:
+        if sort_by_validated not in CONTACT_SORT_FIELDS:
             sort_by_validated = 'last_name'
             direction_validated = 'asc'
         else:
@@ -242,9 +241,28 @@ class ContactListView(BaseCrmView, ListView):
             f'-{self.sort_by_applied}' if self.direction_applied == 'desc'
             else self.sort_by_applied
         )
-        queryset = queryset.order_by(sort_by_final).select_related(
+        # pk tiebreak gives a stable total order (required by the keyset cursor)
+        queryset = queryset.order_by(
+            sort_by_final, '-pk' if self.direction_applied == 'desc' else 'pk'
+        ).select_related(
+            'account',
+            'assigned_to',
+        )
+        # Only the columns the list template renders; the wide text fields stay unread
+        queryset = queryset.only(
+            'first_name',
+            'last_name',
+            'title',
+            'department',
+            'email',
+            'work_phone',
+            'updated_at',
             'account',
+            'account__name',
             'assigned_to',
+            'assigned_to__username',
+            'assigned_to__first_name',
+            'assigned_to__last_name',
         )
         return queryset
 
@@ -256,11 +274,9 @@ class ContactListView(BaseCrmView, ListView):
         context['opposite_direction'] = (
             'desc' if self.direction_applied == 'asc' else 'asc'
         )
-        query_params = self.request.GET.copy()
-        query_params.pop('sort', None)
-        query_params.pop('dir', None)
-        query_params.pop('page', None)
-        context['current_filters_encoded'] = query_params.urlencode()
+        # Same filter-only params get_queryset built (FilterSet keeps {} when there are none)
+        filter_data = self.filterset.data
+        context['current_filters_encoded'] = filter_data.urlencode() if filter_data else ''
         return context
 
 
@@ -276,7 +292,7 @@ class ContactDetailView(BaseCrmView, DetailView):
             'assigned_to',
             'created_by',
         )
-        return self._filter_queryset_by_role(user, queryset)
+        return queryset.for_user(user)
 
 
 class ContactCreateView(BaseCrmView, CreateView):
@@ -295,8 +311,9 @@ class ContactCreateView(BaseCrmView, CreateView):
         account_pk = self.request.GET.get('account')
         if account_pk:
             try:
-                initial['account'] = Account.objects.get(pk=account_pk)
-            except Account.DoesNotExist:
+                # Garbage input fails int() without a query; the field only needs the pk
+                initial['account'] = Account.objects.only('pk').get(pk=int(account_pk))
+            except (ValueError, Account.DoesNotExist):
                 messages.error(self.request, "Invalid Account specified.")
         return initial
 
@@ -316,7 +333,7 @@ class ContactUpdateView(BaseCrmView, UpdateView):
     def get_queryset(self):
         user = self.request.user
         queryset = super().get_queryset()
-        return self._filter_queryset_by_role(user, queryset)
+        return queryset.for_user(user)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -333,42 +350,29 @@ class ContactDeleteView(BaseCrmView, DeleteView):
     def get_queryset(self):
         user = self.request.user
         queryset = super().get_queryset()
-        return self._filter_queryset_by_role(user, queryset)
+        return queryset.for_user(user)
 
 
-class LeadListView(BaseCrmView, ListView):
+class LeadListView(KeysetPaginationMixin, EstimatedCountMixin, BaseCrmView, ListView):
     model = Lead
     context_object_name = 'leads'
     template_name = 'crm_entities/lead_list.html'
     paginate_by = 15
+    keyset_sort_fields = ('last_name', 'company_name', 'updated_at')
     sort_by_applied = 'last_name'
     direction_applied = 'asc'
 
     def get_queryset(self):
         user = self.request.user
-        base_queryset = Lead.objects.exclude(status=Lead.StatusChoices.CONVERTED)
-        queryset = self._filter_queryset_by_role(user, base_queryset)
-        filter_params = self.request.GET.copy()
-        filter_params.pop('sort', None)
-        filter_params.pop('dir', None)
-        filter_params.pop('page', None)
+        queryset = Lead.objects.exclude(status=Lead.StatusChoices.CONVERTED).for_user(user)
+        filter_params = _strip_ui_params(self.request.GET)
         self.filterset = LeadFilter(filter_params, queryset=queryset)
         queryset = self.filterset.qs
 
         sort_by_param = self.request.GET.get('sort', 'last_name')
         direction_param = self.request.GET.get('dir', 'asc')
-        valid_sort_fields = [
-            'last_name',
-            'first_name',
-            'company_name',
-            'status',
-            'source',
-            'territory__name',
-            'assigned_to__username',
-            'updated_at',
-        ]
         sort_by_validated = sort_by_param.lstrip('-')
-        if sort_by_validated not in valid_sort_fields:
+        if sort_by_validated not in LEAD_SORT_FIELDS:
             sort_by_validated = 'last_name'
             direction_validated = 'asc'
         else:
@@ -379,10 +383,29 @@ class LeadListView(BaseCrmView, ListView):
             f'-{self.sort_by_applied}' if self.direction_applied == 'desc'
             else self.sort_by_applied
         )
-        queryset = queryset.order_by(sort_by_final).select_related(
+        # pk tiebreak gives a stable total order (required by the keyset cursor)
+        queryset = queryset.order_by(
+            sort_by_final, '-pk' if self.direction_applied == 'desc' else 'pk'
+        ).select_related(
             'territory',
             'assigned_to',
         )
+        # Only the columns the list template renders; the wide text fields stay unread
+        queryset = queryset.only(
+            'first_name',
+            'last_name',
+            'company_name',
+            'work_phone',
+            'status',
+            'source',
+            'updated_at',
+            'territory',
+            'territory__name',
+            'assigned_to',
+            'assigned_to__username',
+            'assigned_to__first_name',
+            'assigned_to__last_name',
+        )
         return queryset
 
     def get_context_data(self, **kwargs):
@@ -393,11 +416,9 @@ class LeadListView(BaseCrmView, ListView):
         context['opposite_direction'] = (
             'desc' if self.direction_applied == 'asc' else 'asc'
         )
-        query_params = self.request.GET.copy()
-        query_params.pop('sort', None)
-        query_params.pop('dir', None)
-        query_params.pop('page', None)
-        context['current_filters_encoded'] = query_params.urlencode()
+        # Same filter-only params get_queryset built (FilterSet keeps {} when there are none)
+        filter_data = self.filterset.data
+        context['current_filters_encoded'] = filter_data.urlencode() if filter_data else ''
         return context
 
 
@@ -413,7 +434,7 @@ class LeadDetailView(BaseCrmView, DetailView):
             'assigned_to',
             'created_by',
         )
-        return self._filter_queryset_by_role(user, queryset)
+        return queryset.for_user(user)
 
 
 class LeadCreateView(BaseCrmView, CreateView):
@@ -443,7 +464,7 @@ class LeadUpdateView(BaseCrmView, UpdateView):
     def get_queryset(self):
         user = self.request.user
         queryset = super().get_queryset()
-        return self._filter_queryset_by_role(user, queryset)
+        return queryset.for_user(user)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -460,47 +481,22 @@ class LeadDeleteView(BaseCrmView, DeleteView):
     def get_queryset(self):
         user = self.request.user
         queryset = super().get_queryset()
-        return self._filter_queryset_by_role(user, queryset)
+        return queryset.for_user(user)
 
 
 class LeadConvertView(BaseCrmView, View):
     """Lead conversion view with permission checks and transaction handling"""
     def post(self, request, *args, **kwargs):
         lead_pk = kwargs.get('pk')
-        lead = Lead.objects.filter(pk=lead_pk).first()
+        user = request.user
+        lead = Lead.objects.with_edit_flag(user).filter(pk=lead_pk).first()
 
         if not lead:
             messages.error(request, f"Lead with ID {lead_pk} not found.")
             return redirect('crm_entities:lead-list')
 
-        user = request.user
-
         # Permission check
-        has_permission = False
-        if user.is_admin_role:
-            has_permission = True
-        elif user.is_manager_role:
-            try:
-                managed_territories = user.managed_territories.all()
-                team_members = CustomUser.objects.filter(
-                    territory__in=managed_territories,
-                    role=CustomUser.Roles.SALES,
-                ).exclude(pk=user.pk)
-                if (
-                    lead.assigned_to == user or
-                    lead.created_by == user or
-                    lead.assigned_to in team_members or
-                    lead.created_by in team_members or
-                    (lead.territory and lead.territory in managed_territories)
-                ):
-                    has_permission = True
-            except Exception as e:
-                print(f"Error checking manager permission for lead conversion: {e}")
-                if lead.assigned_to == user or lead.created_by == user:
-                    has_permission = True
-        elif user.is_sales_role:
-            if lead.assigned_to == user or lead.created_by == user:
-                has_permission = True
+        has_permission = lead._user_can_edit
 
         if not has_permission:
             messages.error(request, "You do not have permission to convert this lead.")
@@ -527,19 +523,21 @@ class LeadConvertView(BaseCrmView, View):
                 account_name = (
                     lead.company_name or f"{lead.full_name}'s Company (from Lead)"
                 )
-                if Account.objects.filter(name=account_name).exists():
+                # Account.name is unique; let the INSERT decide instead of a racy exists() check
+                try:
+                    account = Account.objects.create(
+                        name=account_name,
+                        phone_number=lead.work_phone,
+                        billing_address=lead.address,
+                        created_by=user,
+                        assigned_to=lead.assigned_to or user,
+                        territory=lead.territory,
+                    )
+                except IntegrityError:
                     raise ValueError(
                         f"An account with the name '{account_name}' already exists. "
                         "Cannot convert lead automatically. Please resolve manually."
                     )
-                account = Account.objects.create(
-                    name=account_name,
-                    phone_number=lead.work_phone,
-                    billing_address=lead.address,
-                    created_by=user,
-                    assigned_to=lead.assigned_to or user,
-                    territory=lead.territory,
-                )
                 messages.info(request, f"New Account created: '{account.name}'")
 
                 # Create Contact
@@ -591,74 +589,55 @@ class LeadConvertView(BaseCrmView, View):
             return redirect('crm_entities:account-detail', pk=account.pk)
 
         except Exception as e:
-            print(f"ERROR during Lead Conversion (PK: {lead_pk}): {type(e).__name__}: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Lead conversion failed (PK: %s)", lead_pk)
             messages.error(request, f"Error converting lead: {str(e)}")
             return redirect('crm_entities:lead-detail', pk=lead.pk)
 
 
+AUTOCOMPLETE_CONTAINS_MIN_LENGTH = 3
+
+
+def _autocomplete_search_q(term, *fields):
+    """
+    OR's a case-insensitive match for term across fields.
+    Terms shorter than a trigram can't use the trigram indexes for '%term%',
+    so they match as a prefix instead.
+    """
+    lookup = 'icontains' if len(term) >= AUTOCOMPLETE_CONTAINS_MIN_LENGTH else 'istartswith'
+    search_q = Q()
+    for field in fields:
+        search_q |= Q(**{f'{field}__{lookup}': term})
+    return search_q
+
+
 class AccountAutocomplete(LoginRequiredMixin, autocomplete.Select2QuerySetView):
     def get_queryset(self):
         user = self.request.user
-        qs = Account.objects.all()
-        if user.is_admin_role:
-            pass
-        elif user.is_manager_role:
-            try:
-                managed_territories = user.managed_territories.all()
-                team_members = CustomUser.objects.filter(
-                    territory__in=managed_territories,
-                ).exclude(pk=user.pk)
-                qs = qs.filter(
-                    Q(assigned_to=user) |
-                    Q(created_by=user) |
-                    Q(assigned_to__in=team_members) |
-                    Q(created_by__in=team_members) |
-                    Q(territory__in=managed_territories)
-                ).distinct()
-            except Exception:
-                qs = qs.filter(
-                    Q(assigned_to=user) | Q(created_by=user)
-                ).distinct()
-        elif user.is_sales_role:
-            qs = qs.filter(
-                Q(assigned_to=user) | Q(created_by=user)
-            ).distinct()
-        else:
-            qs = Account.objects.none()
+        qs = Account.objects.for_user(user)
 
         if self.q:
-            qs = qs.filter(name__icontains=self.q)
+            qs = qs.filter(_autocomplete_search_q(self.q, 'name'))
 
-        return qs.order_by('name')
+        # Results only show the name
+        return qs.only('name').order_by('name')
 
 
 class ContactAutocomplete(LoginRequiredMixin, autocomplete.Select2QuerySetView):
     def get_queryset(self):
-        user = self.request.user
-        if user.is_admin_role:
-            qs = Contact.objects.all()
-        else:
-            qs = Contact.objects.all()
+        qs = Contact.objects.all()
 
-        account = None
         deal_pk = self.forwarded.get('deal', None)
         if deal_pk:
-            try:
-                deal = Deal.objects.select_related('account').get(pk=deal_pk)
-                account = deal.account
-            except Deal.DoesNotExist:
+            # Only the deal's account_id is needed; no join, no full row
+            account_id = Deal.objects.filter(pk=deal_pk).values_list('account_id', flat=True).first()
+            if account_id is None:
                 return Contact.objects.none()
-        if account:
-            qs = qs.filter(account=account)
+            qs = qs.filter(account_id=account_id)
 
         if self.q:
             qs = qs.filter(
-                Q(first_name__icontains=self.q) |
-                Q(last_name__icontains=self.q) |
-                Q(email__icontains=self.q)
-            ).distinct()
+                _autocomplete_search_q(self.q, 'first_name', 'last_name', 'email')
+            )
         return qs.order_by('last_name', 'first_name')
 
 
@@ -667,82 +646,143 @@ class LeadAutocomplete(LoginRequiredMixin, autocomplete.Select2QuerySetView):
         user = self.request.user
         qs = Lead.objects.exclude(
             status__in=[Lead.StatusChoices.CONVERTED, Lead.StatusChoices.LOST]
-        )
-
-        if user.is_admin_role:
-            pass
-        elif user.is_manager_role:
-            try:
-                managed_territories = user.managed_territories.all()
-                team_members = CustomUser.objects.filter(
-                    territory__in=managed_territories,
-                ).exclude(pk=user.pk)
-                qs = qs.filter(
-                    Q(assigned_to=user) |
-                    Q(created_by=user) |
-                    Q(assigned_to__in=team_members) |
-                    Q(created_by__in=team_members) |
-                    Q(territory__in=managed_territories)
-                ).distinct()
-            except Exception:
-                qs = qs.filter(
-                    Q(assigned_to=user) | Q(created_by=user)
-                ).distinct()
-        elif user.is_sales_role:
-            qs = qs.filter(
-                Q(assigned_to=user) | Q(created_by=user)
-            ).distinct()
-        else:
-            qs = Lead.objects.none()
+        ).for_user(user)
 
         if self.q:
             qs = qs.filter(
-                Q(first_name__icontains=self.q) |
-                Q(last_name__icontains=self.q) |
-                Q(company_name__icontains=self.q)
-            ).distinct()
+                _autocomplete_search_q(self.q, 'first_name', 'last_name', 'company_name')
+            )
         return qs.order_by('last_name', 'first_name')
 
 
+class _LocalDateTime(Func):
+    """
+    A timestamptz column as naive wall-clock time in tzname. PostgreSQL converts in
+    SQL (AT TIME ZONE); other backends return the aware value for _export_datetime.
+    """
+    output_field = DateTimeField()
+
+    def __init__(self, field, tzname, **extra):
+        super().__init__(F(field), Value(tzname), **extra)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        return compiler.compile(self.source_expressions[0])
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        return super().as_sql(
+            compiler, connection, template='(%(expressions)s)', arg_joiner=' AT TIME ZONE ',
+            **extra_context,
+        )
+
+
+def _export_datetime(value, tz):
+    """Local wall-clock time, written as a date cell rather than formatted text"""
+    if not value:
+        return ""
+    # Already converted by the database unless the backend lacks AT TIME ZONE
+    return value.astimezone(tz) if value.tzinfo else value
+
+
+def _user_display_name(relation):
+    """SQL for `user.get_full_name() or user.username` across a user FK; '' when unset"""
+    full_name = Trim(Concat(f'{relation}__first_name', Value(' '), f'{relation}__last_name'))
+    return Coalesce(NullIf(full_name, Value('')), f'{relation}__username', Value(''))
+
+
+class _Echo:
+    """File-like object whose write() hands the formatted line back to csv.writer's caller"""
+
+    def write(self, value):
+        return value
+
+
+def _windowed_rows(queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Yields a values_list queryset's rows (pk first) in its order, fetched by pk
+    window: the ordered pk list is read up front, then chunk_size rows at a time
+    with pk IN (...). Nothing holds a cursor or transaction between windows.
+    """
+    pks = list(queryset.values_list('pk', flat=True))
+    for start in range(0, len(pks), chunk_size):
+        window = pks[start:start + chunk_size]
+        by_pk = {row[0]: row for row in queryset.filter(pk__in=window).order_by()}
+        for pk in window:
+            row = by_pk.get(pk)
+            if row is not None:  # Deleted since the pk list was read
+                yield row
+
+
+def _csv_export_response(headers, rows, filename):
+    """
+    Streams rows as CSV while they are read: nothing is buffered beyond the
+    current window, and there is no workbook to zip at the end.
+    """
+    writer = csv.writer(_Echo())
+
+    def lines():
+        yield writer.writerow(headers)
+        for row in rows:
+            yield writer.writerow([
+                value.strftime('%Y-%m-%d %H:%M:%S') if isinstance(value, datetime) else value
+                for value in row
+            ])
+
+    response = StreamingHttpResponse(lines(), content_type='text/csv')
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
+def _export_response(request, sheet_title, headers, queryset, shape_rows, basename):
+    """
+    ?format=csv streams CSV (much faster for bulk exports); the default is XLSX.
+    shape_rows turns the queryset's value tuples into output rows. The CSV body
+    is sent while the client downloads, so it reads pk windows rather than
+    keeping a server-side cursor open for the whole transfer.
+    """
+    if request.GET.get('format') == 'csv':
+        return _csv_export_response(headers, shape_rows(_windowed_rows(queryset)), f'{basename}.csv')
+    records = queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    return xlsx_export_response(sheet_title, headers, shape_rows(records), f'{basename}.xlsx')
+
+
+def _sorted_export_queryset(request, queryset, filterset_class, sort_fields, default_sort):
+    """Applies the list page's filters and (whitelisted) sort to an export queryset"""
+    # UI params aren't filter fields, so the FilterSet can read request.GET as is
+    queryset = filterset_class(request.GET, queryset=queryset).qs
+    sort_by = request.GET.get('sort', default_sort).lstrip('-')
+    if sort_by not in sort_fields:
+        return queryset.order_by(default_sort)
+    return queryset.order_by(f'-{sort_by}' if request.GET.get('dir') == 'desc' else sort_by)
+
+
 @login_required
 def account_export_view(request):
     if not request.user.is_admin_role:
         return HttpResponseForbidden("Permission Denied.")
 
-    base_queryset = Account.objects.all()
-    filter_params = request.GET.copy()
-    filter_params.pop('sort', None)
-    filter_params.pop('dir', None)
-    filter_params.pop('page', None)
-    filterset = AccountFilter(filter_params, queryset=base_queryset)
-    queryset = filterset.qs
-    sort_by_param = request.GET.get('sort', 'name')
-    direction_param = request.GET.get('dir', 'asc')
-    valid_sort_fields = [
+    queryset = _sorted_export_queryset(
+        request, Account.objects.all(), AccountFilter, ACCOUNT_SORT_FIELDS, default_sort='name',
+    )
+    tz = timezone.get_current_timezone()
+    queryset = queryset.annotate(
+        _assignee=_user_display_name('assigned_to'),
+        _created_local=_LocalDateTime('created_at', tz.key),
+        _updated_local=_LocalDateTime('updated_at', tz.key),
+    ).values_list(
+        'pk',
         'name',
+        'website',
+        'phone_number',
+        'billing_address',
+        'shipping_address',
+        'industry',
         'status',
         'territory__name',
-        'assigned_to__username',
-        'updated_at',
-    ]
-    sort_by_validated = sort_by_param.lstrip('-')
-    if sort_by_validated not in valid_sort_fields:
-        sort_by_validated = 'name'
-        direction_validated = 'asc'
-    else:
-        direction_validated = 'desc' if direction_param == 'desc' else 'asc'
-    sort_by_final = (
-        f'-{sort_by_validated}' if direction_validated == 'desc'
-        else sort_by_validated
-    )
-    queryset = queryset.order_by(sort_by_final).select_related(
-        'territory',
-        'assigned_to',
+        '_assignee',
+        '_created_local',
+        '_updated_local',
     )
 
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "Accounts"
     headers = [
         "ID",
         "Name",
@@ -757,43 +797,17 @@ def account_export_view(request):
         "Created At",
         "Updated At",
     ]
-    ws.append(headers)
-    for account in queryset:
-        assigned_to_name = (
-            account.assigned_to.get_full_name() or
-            account.assigned_to.username if account.assigned_to else ""
-        )
-        created_at_formatted = (
-            localtime(account.created_at).strftime('%Y-%m-%d %H:%M:%S')
-            if account.created_at else ""
-        )
-        updated_at_formatted = (
-            localtime(account.updated_at).strftime('%Y-%m-%d %H:%M:%S')
-            if account.updated_at else ""
-        )
-        row = [
-            account.pk,
-            account.name,
-            account.website or "",
-            account.phone_number or "",
-            account.billing_address or "",
-            account.shipping_address or "",
-            account.industry or "",
-            account.status or "",
-            account.territory.name if account.territory else "",
-            assigned_to_name,
-            created_at_formatted,
-            updated_at_formatted,
-        ]
-        ws.append(row)
-    response = HttpResponse(
-        content_type=(
-            'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-        ),
-    )
-    response['Content-Disposition'] = 'attachment; filename="accounts_export.xlsx"'
-    wb.save(response)
-    return response
+
+    def rows(records):
+        # Plain tuples in header order; no model instances are built
+        for *values, created_at, updated_at in records:
+            yield [
+                *(value or "" for value in values),
+                _export_datetime(created_at, tz),
+                _export_datetime(updated_at, tz),
+            ]
+
+    return _export_response(request, "Accounts", headers, queryset, rows, 'accounts_export')
 
 
 @login_required
@@ -801,44 +815,33 @@ def contact_export_view(request):
     if not request.user.is_admin_role:
         return HttpResponseForbidden("Permission Denied.")
 
-    base_queryset = Contact.objects.all()
-    filter_params = request.GET.copy()
-    filter_params.pop('sort', None)
-    filter_params.pop('dir', None)
-    filter_params.pop('page', None)
-    filterset = ContactFilter(filter_params, queryset=base_queryset)
-    queryset = filterset.qs
-    sort_by_param = request.GET.get('sort', 'last_name')
-    direction_param = request.GET.get('dir', 'asc')
-    valid_sort_fields = [
-        'last_name',
+    queryset = _sorted_export_queryset(
+        request, Contact.objects.all(), ContactFilter, CONTACT_SORT_FIELDS, default_sort='last_name',
+    )
+    tz = timezone.get_current_timezone()
+    queryset = queryset.annotate(
+        _assignee=_user_display_name('assigned_to'),
+        _creator=_user_display_name('created_by'),
+        _created_local=_LocalDateTime('created_at', tz.key),
+        _updated_local=_LocalDateTime('updated_at', tz.key),
+    ).values_list(
+        'pk',
         'first_name',
+        'last_name',
         'account__name',
         'title',
         'department',
         'email',
-        'assigned_to__username',
-        'updated_at',
-    ]
-    sort_by_validated = sort_by_param.lstrip('-')
-    if sort_by_validated not in valid_sort_fields:
-        sort_by_validated = 'last_name'
-        direction_validated = 'asc'
-    else:
-        direction_validated = 'desc' if direction_param == 'desc' else 'asc'
-    sort_by_final = (
-        f'-{sort_by_validated}' if direction_validated == 'desc'
-        else sort_by_validated
-    )
-    queryset = queryset.order_by(sort_by_final).select_related(
-        'account',
-        'assigned_to',
-        'created_by',
+        'work_phone',
+        'mobile_phone_1',
+        'mobile_phone_2',
+        'notes',
+        '_assignee',
+        '_creator',
+        '_created_local',
+        '_updated_local',
     )
 
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "Contacts"
     headers = [
         "ID",
         "First Name",
@@ -856,50 +859,16 @@ def contact_export_view(request):
         "Created At",
         "Updated At",
     ]
-    ws.append(headers)
-    for contact in queryset:
-        assigned_to_name = (
-            contact.assigned_to.get_full_name() or
-            contact.assigned_to.username if contact.assigned_to else ""
-        )
-        created_by_name = (
-            contact.created_by.get_full_name() or
-            contact.created_by.username if contact.created_by else ""
-        )
-        created_at_formatted = (
-            localtime(contact.created_at).strftime('%Y-%m-%d %H:%M:%S')
-            if contact.created_at else ""
-        )
-        updated_at_formatted = (
-            localtime(contact.updated_at).strftime('%Y-%m-%d %H:%M:%S')
-            if contact.updated_at else ""
-        )
-        row = [
-            contact.pk,
-            contact.first_name or "",
-            contact.last_name or "",
-            contact.account.name if contact.account else "",
-            contact.title or "",
-            contact.department or "",
-            contact.email or "",
-            contact.work_phone or "",
-            contact.mobile_phone_1 or "",
-            contact.mobile_phone_2 or "",
-            contact.notes or "",
-            assigned_to_name,
-            created_by_name,
-            created_at_formatted,
-            updated_at_formatted,
-        ]
-        ws.append(row)
-    response = HttpResponse(
-        content_type=(
-            'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-        ),
-    )
-    response['Content-Disposition'] = 'attachment; filename="contacts_export.xlsx"'
-    wb.save(response)
-    return response
+
+    def rows(records):
+        for *values, created_at, updated_at in records:
+            yield [
+                *(value or "" for value in values),
+                _export_datetime(created_at, tz),
+                _export_datetime(updated_at, tz),
+            ]
+
+    return _export_response(request, "Contacts", headers, queryset, rows, 'contacts_export')
 
 
 @login_required
@@ -907,44 +876,37 @@ def lead_export_view(request):
     if not request.user.is_admin_role:
         return HttpResponseForbidden("Permission Denied.")
 
-    base_queryset = Lead.objects.all()
-    filter_params = request.GET.copy()
-    filter_params.pop('sort', None)
-    filter_params.pop('dir', None)
-    filter_params.pop('page', None)
-    filterset = LeadFilter(filter_params, queryset=base_queryset)
-    queryset = filterset.qs
-    sort_by_param = request.GET.get('sort', 'last_name')
-    direction_param = request.GET.get('dir', 'asc')
-    valid_sort_fields = [
-        'last_name',
+    queryset = _sorted_export_queryset(
+        request, Lead.objects.all(), LeadFilter, LEAD_SORT_FIELDS, default_sort='last_name',
+    )
+    tz = timezone.get_current_timezone()
+    queryset = queryset.annotate(
+        _assignee=_user_display_name('assigned_to'),
+        _creator=_user_display_name('created_by'),
+        _created_local=_LocalDateTime('created_at', tz.key),
+        _updated_local=_LocalDateTime('updated_at', tz.key),
+    ).values_list(
+        'pk',
         'first_name',
+        'last_name',
         'company_name',
+        'title',
+        'department',
+        'email',
+        'work_phone',
+        'mobile_phone_1',
+        'mobile_phone_2',
+        'address',
+        'notes',
         'status',
         'source',
         'territory__name',
-        'assigned_to__username',
-        'updated_at',
-    ]
-    sort_by_validated = sort_by_param.lstrip('-')
-    if sort_by_validated not in valid_sort_fields:
-        sort_by_validated = 'last_name'
-        direction_validated = 'asc'
-    else:
-        direction_validated = 'desc' if direction_param == 'desc' else 'asc'
-    sort_by_final = (
-        f'-{sort_by_validated}' if direction_validated == 'desc'
-        else sort_by_validated
-    )
-    queryset = queryset.order_by(sort_by_final).select_related(
-        'territory',
-        'assigned_to',
-        'created_by',
+        '_assignee',
+        '_creator',
+        '_created_local',
+        '_updated_local',
     )
 
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "Leads"
     headers = [
         "ID",
         "First Name",
@@ -966,51 +928,21 @@ def lead_export_view(request):
         "Created At",
         "Updated At",
     ]
-    ws.append(headers)
-    for lead in queryset:
-        assigned_to_name = (
-            lead.assigned_to.get_full_name() or
-            lead.assigned_to.username if lead.assigned_to else ""
-        )
-        created_by_name = (
-            lead.created_by.get_full_name() or
-            lead.created_by.username if lead.created_by else ""
-        )
-        created_at_formatted = (
-            localtime(lead.created_at).strftime('%Y-%m-%d %H:%M:%S')
-            if lead.created_at else ""
-        )
-        updated_at_formatted = (
-            localtime(lead.updated_at).strftime('%Y-%m-%d %H:%M:%S')
-            if lead.updated_at else ""
-        )
-        row = [
-            lead.pk,
-            lead.first_name or "",
-            lead.last_name or "",
-            lead.company_name or "",
-            lead.title or "",
-            lead.department or "",
-            lead.email or "",
-            lead.work_phone or "",
-            lead.mobile_phone_1 or "",
-            lead.mobile_phone_2 or "",
-            lead.address or "",
-            lead.notes or "",
-            lead.get_status_display(),
-            lead.get_source_display() or "",
-            lead.territory.name if lead.territory else "",
-            assigned_to_name,
-            created_by_name,
-            created_at_formatted,
-            updated_at_formatted,
-        ]
-        ws.append(row)
-    response = HttpResponse(
-        content_type=(
-            'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-        ),
-    )
-    response['Content-Disposition'] = 'attachment; filename="leads_export.xlsx"'
-    wb.save(response)
-    return response
\ No newline at end of file
+    status_labels = {value: str(label) for value, label in Lead.StatusChoices.choices}
+    source_labels = {value: str(label) for value, label in Lead.SourceChoices.choices}
+
+    def rows(records):
+        for row in records:
+            *values, status, source, territory_name, assignee, creator, created_at, updated_at = row
+            yield [
+                *(value or "" for value in values),
+                status_labels.get(status, status),
+                source_labels.get(source, source) or "",
+                territory_name or "",
+                assignee,
+                creator,
+                _export_datetime(created_at, tz),
+                _export_datetime(updated_at, tz),
+            ]
+
+    return _export_response(request, "Leads", headers, queryset, rows, 'leads_export')
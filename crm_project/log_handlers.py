@@ -0,0 +1,17 @@
+import atexit
+import logging
+import logging.handlers
+import queue
+
+
+class QueueStreamHandler(logging.handlers.QueueHandler):
+    """
+    Formats records on the calling thread and hands them to a background
+    listener that writes to stderr, so request threads never block on the stream.
+    """
+
+    def __init__(self):
+        super().__init__(queue.SimpleQueue())
+        self.listener = logging.handlers.QueueListener(self.queue, logging.StreamHandler())
+        self.listener.start()
+        atexit.register(self.listener.stop)
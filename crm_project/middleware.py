@@ -1,28 +1,33 @@
 from django.middleware.security import SecurityMiddleware
-from django.http import HttpResponsePermanentRedirect, HttpResponse
+from django.http import HttpResponse
 import re
 
+# Load balancer health checks hit these over plain HTTP
+SSL_REDIRECT_EXEMPT_PATHS = frozenset(('/health/', '/'))
+
 class CustomSecurityMiddleware(SecurityMiddleware):
     def process_request(self, request):
-        if request.path in ['/health/', '/']:
+        if request.path in SSL_REDIRECT_EXEMPT_PATHS:
             return None  # Skip HTTPS redirect
         return super().process_request(request)
 
+# Probed paths under /static/, searched as one alternation so a request costs a single regex pass
+BLOCKED_STATIC_PATTERNS = (
+    r'\.env$', r'\.git/', r'\.ssh/', r'jenkinsFile$',
+    r'\.ini$', r'\.yml$', r'\.yaml$', r'\.vscode/',
+    r'js/.*\.chunk\.js$', r'js/main\.[a-f0-9]+\.js$',
+    r'config\.json$'
+)
+_BLOCKED_STATIC_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in BLOCKED_STATIC_PATTERNS))
+
 class StaticFileBlockingMiddleware:
+    __slots__ = ('get_response',)
+
     def __init__(self, get_response):
         self.get_response = get_response
-        self.blocked_static_patterns = [
-            r'\.env$', r'\.git/', r'\.ssh/', r'jenkinsFile$',
-            r'\.ini$', r'\.yml$', r'\.yaml$', r'\.vscode/',
-            r'js/.*\.chunk\.js$', r'js/main\.[a-f0-9]+\.js$',
-            r'config\.json$'
-        ]
-        self.compiled_patterns = [re.compile(pattern) for pattern in self.blocked_static_patterns]
 
     def __call__(self, request):
-        if request.path.startswith('/static/'):
-            path_after_static = request.path[8:]  # Remove '/static/'
-            for pattern in self.compiled_patterns:
-                if pattern.search(path_after_static):
-                    return HttpResponse(status=204)
-        return self.get_response(request)
\ No newline at end of file
+        path = request.path
+        if path.startswith('/static/') and _BLOCKED_STATIC_RE.search(path, 8):  # Skip '/static/'
+            return HttpResponse(status=204)
+        return self.get_response(request)
@@ -1,13 +1,15 @@
 # crm_project/settings.py (FINAL EB PREP VERSION - Response #155)
 
 from pathlib import Path
+import logging
 import os
+import sys
 import dj_database_url # Import dj-database-url
 from dotenv import load_dotenv
-from django.middleware.security import SecurityMiddleware
-from django.http import HttpResponsePermanentRedirect
 
-print("DEBUG: All environment variables:", os.environ)
+# Module logger: LOGGING isn't configured yet, so only warnings surface (via logging's last-resort stderr handler)
+logger = logging.getLogger(__name__)
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -20,7 +22,9 @@ SECRET_KEY = os.environ.get('SECRET_KEY')
 
 # DEBUG automatically False unless explicitly 'True' in environment
 DEBUG = os.environ.get('DEBUG', 'True') == 'True'
-print(f"DEBUG: DEBUG={DEBUG}")
+logger.debug("DEBUG=%s", DEBUG)
+# True under `manage.py test` and pytest; used to swap in cheaper test-only settings
+TESTING = (len(sys.argv) > 1 and sys.argv[1] == 'test') or 'pytest' in sys.modules
 # ALLOWED_HOSTS read from environment variable, split by comma
 # Use a distinct name for prod hosts env var, default to empty string
 
@@ -39,8 +43,8 @@ if not DEBUG:
     # ALLOWED_HOSTS.append('.elasticbeanstalk.com') #
     ALLOWED_HOSTS.extend(['.elasticbeanstalk.com', '.compute.amazonaws.com'])  # Cover ELB/EC2 IPs
 if not DEBUG and not os.environ.get('ALLOWED_HOSTS_PROD'):
-    print("WARNING: ALLOWED_HOSTS_PROD not set, using defaults.")
-print(f"DEBUG: ALLOWED_HOSTS={ALLOWED_HOSTS}")
+    logger.warning("ALLOWED_HOSTS_PROD not set, using defaults.")
+logger.debug("ALLOWED_HOSTS=%s", ALLOWED_HOSTS)
 
 # Application definition
 
@@ -75,14 +79,8 @@ INSTALLED_APPS = [
     'sales_performance.apps.SalesPerformanceConfig',
 ]
 
-# Exempt health check from HTTPS redirect
+# Health-check paths are exempted by crm_project.middleware.CustomSecurityMiddleware
 SECURE_SSL_REDIRECT = os.environ.get('SECURE_SSL_REDIRECT', 'False') == 'True'
-if SECURE_SSL_REDIRECT:
-    class CustomSecurityMiddleware(SecurityMiddleware):
-        def process_request(self, request):
-            if request.path == '/health/' or request.path == '/':
-                return None  # Skip HTTPS redirect for health check
-            return super().process_request(request)
 
 MIDDLEWARE = [
     # 'django.middleware.security.SecurityMiddleware', #
@@ -121,11 +119,10 @@ WSGI_APPLICATION = 'crm_project.wsgi.application'
 
 # Database (Using dj-database-url for flexibility)
 DATABASE_URL = os.environ.get('DATABASE_URL')
-print(f"DEBUG: DATABASE_URL={DATABASE_URL}")
 # Check if running in Elastic Beanstalk environment which sets RDS variables
 # Fallback to building URL from RDS vars if DATABASE_URL isn't explicitly set in EB Env Properties
 if not DATABASE_URL and 'RDS_DB_NAME' in os.environ:
-     print("INFO: DATABASE_URL not set, building from RDS_* vars.")
+     logger.info("DATABASE_URL not set, building from RDS_* vars.")
      db_user = os.environ.get('RDS_USERNAME')
      db_pass = os.environ.get('RDS_PASSWORD')
      db_host = os.environ.get('RDS_HOSTNAME')
@@ -134,17 +131,17 @@ if not DATABASE_URL and 'RDS_DB_NAME' in os.environ:
      if db_user and db_pass and db_host and db_port and db_name:
           DATABASE_URL = f"postgres://{db_user}:{db_pass}@{db_host}:{db_port}/{db_name}"
      else:
-          print("WARNING: Missing RDS_* environment variables, cannot build DATABASE_URL.")
+          logger.warning("Missing RDS_* environment variables, cannot build DATABASE_URL.")
 
 if DATABASE_URL:
     # Require SSL for RDS connections in production (set DATABASE_SSL=True in Env Properties)
     SSL_REQUIRE = os.environ.get('DATABASE_SSL', 'True' if not DEBUG else 'False') == 'True'
     DATABASES = {'default': dj_database_url.config(default=DATABASE_URL, conn_max_age=600, ssl_require=SSL_REQUIRE)}
-    print(f"INFO: Configured database using DATABASE_URL (SSL Require: {SSL_REQUIRE})")
+    logger.info("Configured database using DATABASE_URL (SSL Require: %s)", SSL_REQUIRE)
 else:
     # Fallback to local SQLite ONLY IF DEBUG is True
     if DEBUG:
-         print("WARNING: DATABASE_URL or RDS_* environment variables not set, falling back to local SQLite.")
+         logger.warning("DATABASE_URL or RDS_* environment variables not set, falling back to local SQLite.")
          DATABASES = { 'default': { 'ENGINE': 'django.db.backends.sqlite3', 'NAME': BASE_DIR / 'db.sqlite3', } }
     else:
          # Don't allow fallback to SQLite in production if DB isn't configured
@@ -154,6 +151,50 @@ else:
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [ {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',}, {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator',}, {'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator',}, {'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator',}, ]
 
+# Tests don't exercise hashing strength; PBKDF2 iterations on every create_user/login are pure overhead
+if TESTING:
+    PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+    # Build the test DB straight from model state instead of replaying migrations. The only
+    # RunPython migration (crm_entities 0008, PostgreSQL trigram indexes) is still exercised by
+    # crm_entities/tests/test_migrations.py, which replays every migration on a scratch DB
+    class DisableMigrations:
+        def __contains__(self, item):
+            return True
+
+        def __getitem__(self, item):
+            return None
+
+    MIGRATION_MODULES = DisableMigrations()
+
+    # Keep sessions in the signed cookie so each test request skips the django_session SELECT/UPDATE
+    SESSION_ENGINE = 'django.contrib.sessions.backends.signed_cookies'
+
+    # List row counts are cached per user/filter; tests reuse both across cases with different data
+    CACHES = {'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}
+
+    # Parse each template once per test process (loaders replaces APP_DIRS, so list app_directories explicitly)
+    TEMPLATES[0]['APP_DIRS'] = False
+    TEMPLATES[0]['OPTIONS']['loaders'] = [
+        ('django.template.loaders.cached.Loader', [
+            'django.template.loaders.filesystem.Loader',
+            'django.template.loaders.app_directories.Loader',
+        ]),
+    ]
+
+# Logging: records go through a queue to a listener thread that writes to stderr
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'verbose': {'format': '{asctime} {levelname} {name}: {message}', 'style': '{'},
+    },
+    'handlers': {
+        'queued_console': {'class': 'crm_project.log_handlers.QueueStreamHandler', 'formatter': 'verbose'},
+    },
+    'root': {'handlers': ['queued_console'], 'level': 'WARNING'},
+}
+
 # Internationalization
 LANGUAGE_CODE = 'en-us'; TIME_ZONE = 'Asia/Manila'; USE_I18N = True; USE_TZ = True
 
@@ -28,6 +28,8 @@ class QuoteAdmin(admin.ModelAdmin):
     )
     list_filter = ('status', 'assigned_to', 'account__territory', 'presented_date') # Filter by new date field
     search_fields = ('quote_id', 'account__name', 'deal__name', 'contact__first_name')
+    # deal's __str__ shows its account name
+    list_select_related = ('account', 'deal__account', 'assigned_to')
     autocomplete_fields = ['deal', 'contact', 'assigned_to']
     # Make calculated field and auto-fields read-only
     readonly_fields = ('created_at', 'updated_at', 'created_by',
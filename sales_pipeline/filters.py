@@ -10,6 +10,47 @@ from .models import Deal, Quote
 from crm_entities.models import Account
 from users.models import CustomUser
 
+# Only the selected user is rendered (matches load from users:user-autocomplete); load
+# just what CustomUser.__str__ shows. Lazy, and each filter form works on its own clone.
+ASSIGNABLE_USERS = CustomUser.objects.filter(is_active=True).only(
+    'username', 'first_name', 'last_name',
+).order_by('username')
+
+
+# Shared by DealFilter and QuoteFilter; each form deep-copies its widgets
+AccountFilterWidget = autocomplete.ModelSelect2(
+    url='crm_entities:account-autocomplete',
+    attrs={'data-placeholder': 'Search Account...', 'class': 'form-control form-control-sm'},
+)
+UserFilterWidget = autocomplete.ModelSelect2(
+    url='users:user-autocomplete',
+    attrs={'data-placeholder': 'Search User...', 'class': 'form-control form-control-sm'},
+)
+DealFilterWidget = autocomplete.ModelSelect2(
+    url='sales_pipeline:deal-autocomplete',
+    attrs={'data-placeholder': 'Search deal...', 'class': 'form-control form-control-sm'},
+)
+
+
+# Filter-form layouts, shared across requests (crispy only reads them while rendering)
+DEAL_FILTER_LAYOUT = Layout(
+    Row(
+        Column(Field('name'), css_class='form-group col-md-6 mb-2'),
+        Column(Field('account'), css_class='form-group col-md-6 mb-2'),
+    ),
+    Row(
+        Column(Field('stage'), css_class='form-group col-md-4 mb-2'),
+        Column(
+            Field('assigned_to'),
+            css_class='form-group col-md-4 mb-2',
+        ),
+        Column(
+            Field('close_date'),
+            css_class='form-group col-md-4 mb-2',
+        ),
+    ),
+)
+
 
 class DealFilter(django_filters.FilterSet):
     name = django_filters.CharFilter(
@@ -23,15 +64,9 @@ class DealFilter(django_filters.FilterSet):
         ),
     )
     account = django_filters.ModelChoiceFilter(
-        queryset=Account.objects.all(),
+        queryset=Account.objects.only('name'),
         label='Account',
-        widget=autocomplete.ModelSelect2(
-            url='crm_entities:account-autocomplete',
-            attrs={
-                'data-placeholder': 'Search Account...',
-                'class': 'form-control form-control-sm',
-            },
-        ),
+        widget=AccountFilterWidget,
     )
     stage = django_filters.ChoiceFilter(
         choices=Deal.StageChoices.choices,
@@ -42,12 +77,9 @@ class DealFilter(django_filters.FilterSet):
         ),
     )
     assigned_to = django_filters.ModelChoiceFilter(
-        queryset=CustomUser.objects.filter(is_active=True).order_by('username'),
+        queryset=ASSIGNABLE_USERS,
         label='Assigned To',
-        empty_label='-- User --',
-        widget=forms.Select(
-            attrs={'class': 'form-select form-select-sm'}
-        ),
+        widget=UserFilterWidget,
     )
     close_date = DateFromToRangeFilter(
         field_name='close_date',
@@ -70,26 +102,35 @@ class DealFilter(django_filters.FilterSet):
         self.helper.form_method = 'get'
         self.helper.form_tag = False
         self.helper.disable_csrf = True
-        self.helper.layout = Layout(
-            Row(
-                Column(Field('name'), css_class='form-group col-md-6 mb-2'),
-                Column(Field('account'), css_class='form-group col-md-6 mb-2'),
-            ),
-            Row(
-                Column(Field('stage'), css_class='form-group col-md-4 mb-2'),
-                Column(
-                    Field('assigned_to'),
-                    css_class='form-group col-md-4 mb-2',
-                ),
-                Column(
-                    Field('close_date'),
-                    css_class='form-group col-md-4 mb-2',
-                ),
-            ),
-        )
+        self.helper.layout = DEAL_FILTER_LAYOUT
         self.form.helper = self.helper
 
 
+QUOTE_FILTER_LAYOUT = Layout(
+    Row(
+        Column(
+            Field('quote_id'),
+            css_class='form-group col-md-6 mb-2',
+        ),
+        Column(Field('account'), css_class='form-group col-md-6 mb-2'),
+    ),
+    Row(
+        Column(Field('deal'), css_class='form-group col-md-6 mb-2'),
+        Column(
+            Field('assigned_to'),
+            css_class='form-group col-md-6 mb-2',
+        ),
+    ),
+    Row(
+        Column(Field('status'), css_class='form-group col-md-6 mb-2'),
+        Column(
+            Field('presented_date'),
+            css_class='form-group col-md-6 mb-2',
+        ),
+    ),
+)
+
+
 class QuoteFilter(django_filters.FilterSet):
     quote_id = django_filters.CharFilter(
         lookup_expr='icontains',
@@ -102,26 +143,15 @@ class QuoteFilter(django_filters.FilterSet):
         ),
     )
     account = django_filters.ModelChoiceFilter(
-        queryset=Account.objects.all(),
+        queryset=Account.objects.only('name'),
         label='Account',
-        widget=autocomplete.ModelSelect2(
-            url='crm_entities:account-autocomplete',
-            attrs={
-                'data-placeholder': 'Search Account...',
-                'class': 'form-control form-control-sm',
-            },
-        ),
+        widget=AccountFilterWidget,
     )
     deal = django_filters.ModelChoiceFilter(
-        queryset=Deal.objects.all(),
+        # Deal.__str__ shows deal_id, name and the account name
+        queryset=Deal.objects.select_related('account').only('deal_id', 'name', 'account', 'account__name'),
         label='Deal',
-        widget=autocomplete.ModelSelect2(
-            url='sales_pipeline:deal-autocomplete',
-            attrs={
-                'data-placeholder': 'Search deal...',
-                'class': 'form-control form-control-sm',
-            },
-        ),
+        widget=DealFilterWidget,
     )
     status = django_filters.ChoiceFilter(
         choices=Quote.StatusChoices.choices,
@@ -132,12 +162,9 @@ class QuoteFilter(django_filters.FilterSet):
         ),
     )
     assigned_to = django_filters.ModelChoiceFilter(
-        queryset=CustomUser.objects.filter(is_active=True).order_by('username'),
+        queryset=ASSIGNABLE_USERS,
         label='Assigned To',
-        empty_label='-- User --',
-        widget=forms.Select(
-            attrs={'class': 'form-select form-select-sm'}
-        ),
+        widget=UserFilterWidget,
     )
     presented_date = DateFromToRangeFilter(
         field_name='presented_date',
@@ -167,27 +194,5 @@ class QuoteFilter(django_filters.FilterSet):
         self.helper.form_method = 'get'
         self.helper.form_tag = False
         self.helper.disable_csrf = True
-        self.helper.layout = Layout(
-            Row(
-                Column(
-                    Field('quote_id'),
-                    css_class='form-group col-md-6 mb-2',
-                ),
-                Column(Field('account'), css_class='form-group col-md-6 mb-2'),
-            ),
-            Row(
-                Column(Field('deal'), css_class='form-group col-md-6 mb-2'),
-                Column(
-                    Field('assigned_to'),
-                    css_class='form-group col-md-6 mb-2',
-                ),
-            ),
-            Row(
-                Column(Field('status'), css_class='form-group col-md-6 mb-2'),
-                Column(
-                    Field('presented_date'),
-                    css_class='form-group col-md-6 mb-2',
-                ),
-            ),
-        )
-        self.form.helper = self.helper
\ No newline at end of file
+        self.helper.layout = QUOTE_FILTER_LAYOUT
+        self.form.helper = self.helper
@@ -27,6 +27,33 @@ DealAutoCompleteWidget = autocomplete.ModelSelect2(
 )
 
 
+# Built once at import and shared by every form instance; nothing mutates them after.
+DEAL_FORM_LAYOUT = Layout(
+    Row(
+        Column(Field('name'), css_class='col-md-6 mb-3'),
+        Column(Field('account'), css_class='col-md-6 mb-3'),
+    ),
+    Row(
+        Column(
+            Field('primary_contact'),
+            css_class='col-md-6 mb-3',
+        ),
+        Column(Field('assigned_to'), css_class='col-md-6 mb-3'),
+    ),
+    Row(
+        Column(Field('stage'), css_class='col-md-12 mb-3'),
+    ),
+    Row(
+        Column(Field('amount'), css_class='col-md-6 mb-3'),
+        Column(Field('currency'), css_class='col-md-6 mb-3'),
+    ),
+    Row(
+        Column(Field('close_date'), css_class='col-md-6 mb-3'),
+    ),
+    Field('description'),
+)
+
+
 class DealForm(forms.ModelForm):
     close_date = forms.DateField(
         widget=forms.DateInput(
@@ -78,30 +105,34 @@ class DealForm(forms.ModelForm):
         self.helper = FormHelper()
         self.helper.form_method = 'post'
         self.helper.form_tag = False
-        self.helper.layout = Layout(
-            Row(
-                Column(Field('name'), css_class='col-md-6 mb-3'),
-                Column(Field('account'), css_class='col-md-6 mb-3'),
-            ),
-            Row(
-                Column(
-                    Field('primary_contact'),
-                    css_class='col-md-6 mb-3',
-                ),
-                Column(Field('assigned_to'), css_class='col-md-6 mb-3'),
-            ),
-            Row(
-                Column(Field('stage'), css_class='col-md-12 mb-3'),
-            ),
-            Row(
-                Column(Field('amount'), css_class='col-md-6 mb-3'),
-                Column(Field('currency'), css_class='col-md-6 mb-3'),
-            ),
-            Row(
-                Column(Field('close_date'), css_class='col-md-6 mb-3'),
-            ),
-            Field('description'),
-        )
+        self.helper.layout = DEAL_FORM_LAYOUT
+
+
+QUOTE_FORM_LAYOUT = Layout(
+    Row(
+        Column(Field('deal'), css_class='col-md-6 mb-3'),
+        Column(Field('contact'), css_class='col-md-6 mb-3'),
+    ),
+    Row(
+        Column(Field('status'), css_class='col-md-4 mb-3'),
+        Column(
+            Field('presented_date'),
+            css_class='col-md-4 mb-3',
+        ),
+        Column(
+            Field('validity_days'),
+            css_class='col-md-4 mb-3',
+        ),
+    ),
+    Row(
+        Column(
+            Field('total_amount'),
+            css_class='col-md-6 mb-3',
+        ),
+        Column(Field('assigned_to'), css_class='col-md-6 mb-3'),
+    ),
+    Field('notes'),
+)
 
 
 class QuoteForm(forms.ModelForm):
@@ -154,31 +185,4 @@ class QuoteForm(forms.ModelForm):
         self.helper = FormHelper()
         self.helper.form_method = 'post'
         self.helper.form_tag = False
-        quote_id_display = None
-        if self.instance and self.instance.pk and self.instance.quote_id:
-            quote_id_display = Field('instance.quote_id', type='hidden')
-        self.helper.layout = Layout(
-            Row(
-                Column(Field('deal'), css_class='col-md-6 mb-3'),
-                Column(Field('contact'), css_class='col-md-6 mb-3'),
-            ),
-            Row(
-                Column(Field('status'), css_class='col-md-4 mb-3'),
-                Column(
-                    Field('presented_date'),
-                    css_class='col-md-4 mb-3',
-                ),
-                Column(
-                    Field('validity_days'),
-                    css_class='col-md-4 mb-3',
-                ),
-            ),
-            Row(
-                Column(
-                    Field('total_amount'),
-                    css_class='col-md-6 mb-3',
-                ),
-                Column(Field('assigned_to'), css_class='col-md-6 mb-3'),
-            ),
-            Field('notes'),
-        )
\ No newline at end of file
+        self.helper.layout = QUOTE_FORM_LAYOUT
@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sales_pipeline', '0007_alter_deal_deal_id_alter_quote_quote_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IdCounter',
+            fields=[
+                ('prefix', models.CharField(max_length=4, primary_key=True, serialize=False)),
+                ('next_val', models.PositiveIntegerField()),
+            ],
+        ),
+    ]
@@ -0,0 +1,31 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sales_pipeline', '0008_idcounter'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='deal',
+            name='close_date',
+            field=models.DateField(db_index=True, help_text='Expected or actual closing date'),
+        ),
+        migrations.AlterField(
+            model_name='deal',
+            name='stage',
+            field=models.CharField(choices=[('PROSPECTING', 'Prospecting'), ('QUALIFICATION', 'Qualification'), ('PROPOSAL', 'Proposal/Quote Sent'), ('NEGOTIATION', 'Negotiation'), ('CLOSED_WON', 'Closed Won'), ('CLOSED_LOST', 'Closed Lost')], db_index=True, default='PROSPECTING', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='quote',
+            name='presented_date',
+            field=models.DateField(blank=True, db_index=True, help_text='Date the quote was presented to the client', null=True),
+        ),
+        migrations.AlterField(
+            model_name='quote',
+            name='status',
+            field=models.CharField(choices=[('DRAFT', 'Draft'), ('PRESENTED', 'Presented'), ('ACCEPTED', 'Accepted'), ('REJECTED', 'Rejected')], db_index=True, default='DRAFT', max_length=20),
+        ),
+    ]
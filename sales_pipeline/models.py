@@ -1,9 +1,8 @@
 from datetime import timedelta
-import re
 
 from django.conf import settings
-from django.db import models
-from django.db.models import Max
+from django.db import connection, models, transaction
+from django.db.models import F
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
@@ -12,6 +11,83 @@ from crm_entities.models import Account, Contact
 AUTH_USER_MODEL = settings.AUTH_USER_MODEL
 
 
+class IdCounter(models.Model):
+    """Next sequence number for a yearly ID prefix such as 'D25-' or 'Q25-'"""
+    prefix = models.CharField(max_length=4, primary_key=True)
+    next_val = models.PositiveIntegerField()
+
+    def __str__(self):
+        return f"{self.prefix}{self.next_val:05d}"
+
+
+def _last_issued_number(model, field, prefix):
+    """Numeric suffix of the highest existing `field` value with this prefix, or 0"""
+    # ORDER BY ... LIMIT 1 can be read off the unique index rather than aggregated
+    last = model.objects.filter(
+        **{f'{field}__startswith': prefix}
+    ).order_by(f'-{field}').values_list(field, flat=True).first()
+    # The filter already matched the prefix; the rest should be the zero-padded number
+    suffix = last[len(prefix):] if last else ''
+    return int(suffix) if suffix.isdigit() else 0
+
+
+def _year_prefix(letter):
+    """ID prefix for the current year, e.g. 'D25-'"""
+    return f"{letter}{timezone.now():%y}-"
+
+
+def _claim_counter_block(prefix, count):
+    """
+    PostgreSQL fast path: bumps an existing counter row and reads back the first
+    number of the claimed block in one UPDATE ... RETURNING, which also holds the
+    row lock until commit. Returns None on other backends or if the row is missing.
+    """
+    if connection.vendor != 'postgresql':
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {IdCounter._meta.db_table} SET next_val = next_val + %s "
+            "WHERE prefix = %s RETURNING next_val - %s",
+            [count, prefix, count],
+        )
+        row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def _allocate_sequential_ids(model, field, prefix, count=1):
+    """
+    Allocates `count` consecutive `<prefix>NNNNN` IDs. Must run inside the caller's
+    transaction: the prefix's counter row stays locked until it commits, so
+    concurrent saves queue on it instead of reading the same MAX(). A prefix's
+    counter is seeded from the existing IDs the first time it is used.
+    """
+    first = _claim_counter_block(prefix, count)
+    if first is None:
+        counter, _ = IdCounter.objects.select_for_update().get_or_create(
+            prefix=prefix,
+            defaults={'next_val': lambda: _last_issued_number(model, field, prefix) + 1},
+        )
+        IdCounter.objects.filter(prefix=prefix).update(next_val=F('next_val') + count)
+        first = counter.next_val
+    return [f"{prefix}{n:05d}" for n in range(first, first + count)]
+
+
+def _next_sequential_id(model, field, prefix):
+    return _allocate_sequential_ids(model, field, prefix)[0]
+
+
+class DealQuerySet(models.QuerySet):
+    def for_list(self):
+        """Joins the relations the deal list renders for every row"""
+        return self.select_related('account', 'assigned_to', 'primary_contact')
+
+
+class QuoteQuerySet(models.QuerySet):
+    def for_list(self):
+        """Joins the relations the quote list renders (deal's __str__ shows its account)"""
+        return self.select_related('account', 'deal__account', 'assigned_to', 'contact')
+
+
 class Deal(models.Model):
     """Represents a potential sale or Opportunity"""
     class StageChoices(models.TextChoices):
@@ -62,6 +138,7 @@ class Deal(models.Model):
         max_length=20,
         choices=StageChoices.choices,
         default=StageChoices.PROSPECTING,
+        db_index=True,
     )
     amount = models.DecimalField(
         max_digits=12,
@@ -74,7 +151,8 @@ class Deal(models.Model):
         help_text=_("Currency code (e.g., PHP, USD)"),
     )
     close_date = models.DateField(
-        help_text=_("Expected or actual closing date")
+        db_index=True,
+        help_text=_("Expected or actual closing date"),
     )
     probability = models.IntegerField(
         default=10,
@@ -99,6 +177,8 @@ class Deal(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = DealQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("Deal / Opportunity")
         verbose_name_plural = _("Deals / Opportunities")
@@ -116,28 +196,23 @@ class Deal(models.Model):
     def save(self, *args, **kwargs):
         self.probability = self.STAGE_PROBABILITY_MAP.get(self.stage, 0)
 
-        if not self.deal_id:
-            now = timezone.now()
-            year_str = now.strftime('%y')
-            prefix = f"D{year_str}-"
-            try:
-                last_deal = Deal.objects.filter(
-                    deal_id__startswith=prefix
-                ).aggregate(max_id=Max('deal_id'))
-                if last_deal and last_deal.get('max_id'):
-                    match = re.match(rf"D\d\d-(\d+)", last_deal['max_id'])
-                    if match:
-                        last_num = int(match.group(1))
-                        new_num = last_num + 1
-                    else:
-                        new_num = 1
-                else:
-                    new_num = 1
-                self.deal_id = f"{prefix}{new_num:05d}"
-            except Exception as e:
-                print(f"Error generating deal_id: {e}")
-
-        super().save(*args, **kwargs)
+        # One transaction, so the ID counter stays locked until the row is in
+        with transaction.atomic():
+            if not self.deal_id:
+                self.deal_id = _next_sequential_id(Deal, 'deal_id', _year_prefix('D'))
+            super().save(*args, **kwargs)
+
+    @classmethod
+    def allocate_ids(cls, count):
+        """
+        Reserves `count` deal IDs in one counter update, for rows inserted with
+        bulk_create (which skips save()). Called inside the inserting transaction,
+        the counter stays locked until it commits; called outside one, the IDs are
+        reserved in a transaction of their own (and skipped if the insert fails).
+        """
+        # savepoint=False: joins the caller's transaction as-is, or opens one for the lock
+        with transaction.atomic(savepoint=False):
+            return _allocate_sequential_ids(cls, 'deal_id', _year_prefix('D'), count)
 
 
 class Quote(models.Model):
@@ -185,6 +260,7 @@ class Quote(models.Model):
     presented_date = models.DateField(
         null=True,
         blank=True,
+        db_index=True,
         help_text=_("Date the quote was presented to the client"),
     )
     validity_days = models.PositiveIntegerField(
@@ -195,6 +271,7 @@ class Quote(models.Model):
         max_length=20,
         choices=StatusChoices.choices,
         default=StatusChoices.DRAFT,
+        db_index=True,
     )
     total_amount = models.DecimalField(
         max_digits=12,
@@ -229,6 +306,8 @@ class Quote(models.Model):
         blank=True,
     )
 
+    objects = QuoteQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("Quote")
         verbose_name_plural = _("Quotes")
@@ -239,38 +318,31 @@ class Quote(models.Model):
 
     @property
     def expiry_date(self):
+        # validity_days is a PositiveIntegerField, so no int() coercion is needed
         if self.presented_date and self.validity_days is not None:
-            try:
-                return self.presented_date + timedelta(
-                    days=int(self.validity_days)
-                )
-            except (TypeError, ValueError):
-                return None
+            return self.presented_date + timedelta(days=self.validity_days)
         return None
 
     def save(self, *args, **kwargs):
-        if self.deal and self.deal.account:
-            self.account = self.deal.account
-
-        if not self.quote_id:
-            now = timezone.now()
-            year_str = now.strftime('%y')
-            prefix = f"Q{year_str}-"
-            try:
-                last_quote = Quote.objects.filter(
-                    quote_id__startswith=prefix
-                ).aggregate(max_id=Max('quote_id'))
-                if last_quote and last_quote.get('max_id'):
-                    match = re.match(rf"Q\d\d-(\d+)", last_quote['max_id'])
-                    if match:
-                        last_num = int(match.group(1))
-                        new_num = last_num + 1
-                    else:
-                        new_num = 1
-                else:
-                    new_num = 1
-                self.quote_id = f"{prefix}{new_num:05d}"
-            except Exception as e:
-                print(f"Error generating quote_id: {e}")
-
-        super().save(*args, **kwargs)
\ No newline at end of file
+        # Copy the FK id; dereferencing deal.account would SELECT the Account row
+        if self.deal_id:
+            if Quote.deal.is_cached(self):
+                account_id = self.deal.account_id
+            else:
+                # Only the id is needed, not the whole Deal
+                account_id = Deal.objects.filter(
+                    pk=self.deal_id
+                ).values_list('account_id', flat=True).first()
+            if account_id:
+                self.account_id = account_id
+
+        with transaction.atomic():
+            if not self.quote_id:
+                self.quote_id = _next_sequential_id(Quote, 'quote_id', _year_prefix('Q'))
+            super().save(*args, **kwargs)
+
+    @classmethod
+    def allocate_ids(cls, count):
+        """Like Deal.allocate_ids, for quotes"""
+        with transaction.atomic(savepoint=False):
+            return _allocate_sequential_ids(cls, 'quote_id', _year_prefix('Q'), count)
\ No newline at end of file
@@ -1,5 +1,6 @@
 # sales_pipeline/tests/test_models.py
 
+from django.db import transaction
 from django.test import TestCase
 from django.utils import timezone # Import timezone
 from datetime import date, timedelta
@@ -12,7 +13,6 @@ from users.models import CustomUser # Import User model
 # --- End Imports ---
 
 from django.core.exceptions import ValidationError
-from ..models import Deal, Quote
 
 class QuoteModelTest(TestCase):
     @classmethod
@@ -101,4 +101,38 @@ class DealModelTest(TestCase):
         with self.assertRaises(ValidationError) as cm:
             deal.full_clean()
         self.assertIn('close_date', cm.exception.message_dict)
-        
\ No newline at end of file
+
+    def test_deal_ids_continue_from_existing_numbers(self):
+        prefix = f"D{timezone.now():%y}-"
+        deal_data = {
+            'account': self.account,
+            'stage': 'PROSPECTING',
+            'amount': 1000,
+            'close_date': timezone.now().date(),
+            'assigned_to': self.user
+        }
+        Deal.objects.create(deal_id=f"{prefix}00041", name='Imported Deal', **deal_data)
+        first = Deal.objects.create(name='Next Deal', **deal_data)
+        second = Deal.objects.create(name='Following Deal', **deal_data)
+        self.assertEqual(first.deal_id, f"{prefix}00042")
+        self.assertEqual(second.deal_id, f"{prefix}00043")
+        
+
+    def test_allocate_ids_reserves_a_block_for_bulk_create(self):
+        prefix = f"D{timezone.now():%y}-"
+        deal_data = {
+            'account': self.account,
+            'stage': 'PROSPECTING',
+            'amount': 1000,
+            'close_date': timezone.now().date(),
+            'assigned_to': self.user
+        }
+        with transaction.atomic():
+            ids = Deal.allocate_ids(3)
+            Deal.objects.bulk_create([
+                Deal(deal_id=deal_id, name=f'Bulk Deal {i}', **deal_data)
+                for i, deal_id in enumerate(ids)
+            ])
+        self.assertEqual(ids, [f"{prefix}00001", f"{prefix}00002", f"{prefix}00003"])
+        # A later save() continues after the reserved block
+        self.assertEqual(Deal.objects.create(name='Next Deal', **deal_data).deal_id, f"{prefix}00004")
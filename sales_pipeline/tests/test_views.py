@@ -1,3 +1,4 @@
+from django.db import transaction
 from django.test import TestCase
 from django.urls import reverse
 from django.utils import timezone
@@ -11,35 +12,28 @@ from django.db.models import Q
 
 # Import models needed for setup and testing
 from users.models import CustomUser
+from users.tests._factories import fast_user
 from sales_territories.models import Territory
 from crm_entities.models import Account, Contact
 from ..models import Deal, Quote
 
 
+def _bulk_create_deals(deals):
+    """ bulk_create for deals, filling in the deal_id and probability Deal.save() would set """
+    # Same transaction as the insert, so the ID counter stays locked until the rows are in
+    with transaction.atomic():
+        for deal, deal_id in zip(deals, Deal.allocate_ids(len(deals))):
+            deal.deal_id = deal_id
+            deal.probability = Deal.STAGE_PROBABILITY_MAP[deal.stage]
+        return Deal.objects.bulk_create(deals)
+
+
 # Helper function
-def create_user(
-    username,
-    password="password123",
-    role=CustomUser.Roles.SALES,
-    territory=None,
-    is_superuser=False
-):
+def create_user(username, role=CustomUser.Roles.SALES, territory=None, is_superuser=False):
     """ Creates a user with specified role/territory """
-    if is_superuser:
-        return CustomUser.objects.create_superuser(
-            username=username,
-            password=password,
-            email=f"{username}@example.com",
-            role=CustomUser.Roles.ADMIN
-        )
-    else:
-        return CustomUser.objects.create_user(
-            username=username,
-            password=password,
-            role=role,
-            territory=territory,
-            email=f"{username}@example.com"
-        )
+    user = fast_user(username, role=role, territory=territory, is_superuser=is_superuser)
+    user.save()
+    return user
 
 
 # BaseSalesPipelineView Tests
@@ -78,95 +72,56 @@ class DealListViewPermissionTest(TestCase):
 
     @classmethod
     def setUpTestData(cls):
-        cls.admin_user = create_user('deal_list_admin_v2', is_superuser=True)
-        cls.manager_user = create_user(
-            'deal_list_manager_v2',
-            role=CustomUser.Roles.MANAGER
-        )
-        cls.t1 = Territory.objects.create(name="Deal Test Territory 1 v2")
-        cls.t2 = Territory.objects.create(name="Deal Test Territory 2 v2")
-        cls.sales_user1 = create_user(
-            'deal_list_sales1_v2',
-            role=CustomUser.Roles.SALES,
-            territory=cls.t1
-        )
-        cls.sales_user2 = create_user(
-            'deal_list_sales2_v2',
-            role=CustomUser.Roles.SALES,
-            territory=cls.t2
-        )
-        cls.empty_sales_user = create_user(
-            'deal_list_empty_sales',
-            role=CustomUser.Roles.SALES,
-            territory=cls.t2
-        )
+        cls.t1, cls.t2 = Territory.objects.bulk_create([
+            Territory(name="Deal Test Territory 1 v2"),
+            Territory(name="Deal Test Territory 2 v2"),
+        ])
+        (
+            cls.admin_user, cls.manager_user, cls.sales_user1,
+            cls.sales_user2, cls.empty_sales_user,
+        ) = CustomUser.objects.bulk_create([
+            fast_user('deal_list_admin_v2', is_superuser=True),
+            fast_user('deal_list_manager_v2', role=CustomUser.Roles.MANAGER),
+            fast_user('deal_list_sales1_v2', role=CustomUser.Roles.SALES, territory=cls.t1),
+            fast_user('deal_list_sales2_v2', role=CustomUser.Roles.SALES, territory=cls.t2),
+            fast_user('deal_list_empty_sales', role=CustomUser.Roles.SALES, territory=cls.t2),
+        ])
         cls.manager_user.managed_territories.add(cls.t1)
 
-        cls.acc_t1_s1 = Account.objects.create(
-            name="Deal Acc 1 (T1/S1)",
-            territory=cls.t1,
-            assigned_to=cls.sales_user1
-        )
-        cls.acc_t2_s2 = Account.objects.create(
-            name="Deal Acc 2 (T2/S2)",
-            territory=cls.t2,
-            assigned_to=cls.sales_user2
-        )
-        cls.acc_t1_mgr = Account.objects.create(
-            name="Deal Acc Mgr (T1/Mgr)",
-            territory=cls.t1,
-            assigned_to=cls.manager_user
-        )
-        cls.acc_admin = Account.objects.create(
-            name="Deal Acc Admin (No T)",
-            assigned_to=cls.admin_user
-        )
-
-        cls.deal1 = Deal.objects.create(
-            name="Admin Deal",
-            account=cls.acc_admin,
-            stage=Deal.StageChoices.PROSPECTING,
-            amount=1000,
-            close_date=date.today(),
-            assigned_to=cls.admin_user
-        )
-        cls.deal2 = Deal.objects.create(
-            name="Manager Deal",
-            account=cls.acc_t1_mgr,
-            stage=Deal.StageChoices.QUALIFICATION,
-            amount=2000,
-            close_date=date.today(),
-            assigned_to=cls.manager_user
-        )
-        cls.deal3 = Deal.objects.create(
-            name="Sales1 Deal 1",
-            account=cls.acc_t1_s1,
-            stage=Deal.StageChoices.PROPOSAL,
-            amount=3000,
-            close_date=date.today(),
-            assigned_to=cls.sales_user1
-        )
-        cls.deal4 = Deal.objects.create(
-            name="Sales1 Deal 2",
-            account=cls.acc_t1_mgr,
-            stage=Deal.StageChoices.NEGOTIATION,
-            amount=4000,
-            close_date=date.today(),
-            assigned_to=cls.sales_user1
-        )
-        cls.deal5 = Deal.objects.create(
-            name="Sales2 Deal",
-            account=cls.acc_t2_s2,
-            stage=Deal.StageChoices.PROSPECTING,
-            amount=5000,
-            close_date=date.today(),
-            assigned_to=cls.sales_user2
-        )
+        cls.acc_t1_s1, cls.acc_t2_s2, cls.acc_t1_mgr, cls.acc_admin = Account.objects.bulk_create([
+            Account(name="Deal Acc 1 (T1/S1)", territory=cls.t1, assigned_to=cls.sales_user1),
+            Account(name="Deal Acc 2 (T2/S2)", territory=cls.t2, assigned_to=cls.sales_user2),
+            Account(name="Deal Acc Mgr (T1/Mgr)", territory=cls.t1, assigned_to=cls.manager_user),
+            Account(name="Deal Acc Admin (No T)", assigned_to=cls.admin_user),
+        ])
+
+        cls.deal1, cls.deal2, cls.deal3, cls.deal4, cls.deal5 = _bulk_create_deals([
+            Deal(
+                name="Admin Deal", account=cls.acc_admin, stage=Deal.StageChoices.PROSPECTING,
+                amount=1000, close_date=date.today(), assigned_to=cls.admin_user
+            ),
+            Deal(
+                name="Manager Deal", account=cls.acc_t1_mgr, stage=Deal.StageChoices.QUALIFICATION,
+                amount=2000, close_date=date.today(), assigned_to=cls.manager_user
+            ),
+            Deal(
+                name="Sales1 Deal 1", account=cls.acc_t1_s1, stage=Deal.StageChoices.PROPOSAL,
+                amount=3000, close_date=date.today(), assigned_to=cls.sales_user1
+            ),
+            Deal(
+                name="Sales1 Deal 2", account=cls.acc_t1_mgr, stage=Deal.StageChoices.NEGOTIATION,
+                amount=4000, close_date=date.today(), assigned_to=cls.sales_user1
+            ),
+            Deal(
+                name="Sales2 Deal", account=cls.acc_t2_s2, stage=Deal.StageChoices.PROSPECTING,
+                amount=5000, close_date=date.today(), assigned_to=cls.sales_user2
+            ),
+        ])
 
         cls.deal_list_url = reverse('sales_pipeline:deal-list')
 
     def test_url_and_template(self):
-        self.client.login(username='deal_list_admin_v2', password='password123')
+        self.client.force_login(self.admin_user)
         response = self.client.get(self.deal_list_url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'sales_pipeline/deal_list.html')
@@ -177,13 +132,13 @@ class DealListViewPermissionTest(TestCase):
         self.assertRedirects(response, f'{login_url}?next={self.deal_list_url}')
 
     def test_admin_sees_all_deals(self):
-        self.client.login(username='deal_list_admin_v2', password='password123')
+        self.client.force_login(self.admin_user)
         response = self.client.get(self.deal_list_url)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.context['deals']), 5)
 
     def test_sales_user_sees_only_own_deals(self):
-        self.client.login(username='deal_list_sales1_v2', password='password123')
+        self.client.force_login(self.sales_user1)
         response = self.client.get(self.deal_list_url)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.context['deals']), 2)
@@ -192,7 +147,7 @@ class DealListViewPermissionTest(TestCase):
         self.assertIn(self.deal4.name, deal_names)
 
     def test_manager_sees_own_team_and_territory_deals(self):
-        self.client.login(username='deal_list_manager_v2', password='password123')
+        self.client.force_login(self.manager_user)
         response = self.client.get(self.deal_list_url)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.context['deals']), 3)
@@ -204,14 +159,14 @@ class DealListViewPermissionTest(TestCase):
         self.assertNotIn(self.deal5.name, deal_names)
 
     def test_invalid_sort_param(self):
-        self.client.login(username='deal_list_admin_v2', password='password123')
+        self.client.force_login(self.admin_user)
         response = self.client.get(self.deal_list_url, {'sort': 'invalid_field'})
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.context['sort_by'], 'deal_id')
         self.assertEqual(response.context['direction'], 'desc')
 
     def test_empty_queryset(self):
-        self.client.login(username='deal_list_empty_sales', password='password123')
+        self.client.force_login(self.empty_sales_user)
         response = self.client.get(self.deal_list_url)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.context['deals']), 0)
@@ -222,65 +177,41 @@ class QuoteListViewPermissionTest(TestCase):
 
     @classmethod
     def setUpTestData(cls):
-        cls.admin_user = create_user('quote_list_admin', is_superuser=True)
-        cls.manager_user = create_user('quote_list_manager', role=CustomUser.Roles.MANAGER)
         cls.t1 = Territory.objects.create(name="Quote Test Territory 1")
-        cls.sales_user1 = create_user(
-            'quote_list_sales1',
-            role=CustomUser.Roles.SALES,
-            territory=cls.t1
-        )
-        cls.sales_user2 = create_user(
-            'quote_list_sales2',
-            role=CustomUser.Roles.SALES
-        )
-        cls.empty_sales_user = create_user(
-            'quote_list_empty_sales',
-            role=CustomUser.Roles.SALES,
-            territory=cls.t1
-        )
+        (
+            cls.admin_user, cls.manager_user, cls.sales_user1,
+            cls.sales_user2, cls.empty_sales_user,
+        ) = CustomUser.objects.bulk_create([
+            fast_user('quote_list_admin', is_superuser=True),
+            fast_user('quote_list_manager', role=CustomUser.Roles.MANAGER),
+            fast_user('quote_list_sales1', role=CustomUser.Roles.SALES, territory=cls.t1),
+            fast_user('quote_list_sales2', role=CustomUser.Roles.SALES),
+            fast_user('quote_list_empty_sales', role=CustomUser.Roles.SALES, territory=cls.t1),
+        ])
         cls.manager_user.managed_territories.add(cls.t1)
 
-        cls.acc1 = Account.objects.create(
-            name="Quote Acc 1 (T1)",
-            territory=cls.t1,
-            assigned_to=cls.sales_user1
-        )
-        cls.acc2 = Account.objects.create(
-            name="Quote Acc 2 (Other)",
-            assigned_to=cls.sales_user2
-        )
-        cls.acc_mgr = Account.objects.create(
-            name="Quote Acc Mgr",
-            territory=cls.t1,
-            assigned_to=cls.manager_user
-        )
-
-        cls.deal1 = Deal.objects.create(
-            name="Deal for Quote 1",
-            account=cls.acc1,
-            assigned_to=cls.sales_user1,
-            stage=Deal.StageChoices.PROPOSAL,
-            amount=100,
-            close_date=date.today()
-        )
-        cls.deal2 = Deal.objects.create(
-            name="Deal for Quote 2",
-            account=cls.acc2,
-            assigned_to=cls.sales_user2,
-            stage=Deal.StageChoices.PROPOSAL,
-            amount=100,
-            close_date=date.today()
-        )
-        cls.deal_mgr = Deal.objects.create(
-            name="Deal for Quote Mgr",
-            account=cls.acc_mgr,
-            assigned_to=cls.manager_user,
-            stage=Deal.StageChoices.PROPOSAL,
-            amount=100,
-            close_date=date.today()
-        )
-
+        cls.acc1, cls.acc2, cls.acc_mgr = Account.objects.bulk_create([
+            Account(name="Quote Acc 1 (T1)", territory=cls.t1, assigned_to=cls.sales_user1),
+            Account(name="Quote Acc 2 (Other)", assigned_to=cls.sales_user2),
+            Account(name="Quote Acc Mgr", territory=cls.t1, assigned_to=cls.manager_user),
+        ])
+
+        cls.deal1, cls.deal2, cls.deal_mgr = _bulk_create_deals([
+            Deal(
+                name="Deal for Quote 1", account=cls.acc1, assigned_to=cls.sales_user1,
+                stage=Deal.StageChoices.PROPOSAL, amount=100, close_date=date.today()
+            ),
+            Deal(
+                name="Deal for Quote 2", account=cls.acc2, assigned_to=cls.sales_user2,
+                stage=Deal.StageChoices.PROPOSAL, amount=100, close_date=date.today()
+            ),
+            Deal(
+                name="Deal for Quote Mgr", account=cls.acc_mgr, assigned_to=cls.manager_user,
+                stage=Deal.StageChoices.PROPOSAL, amount=100, close_date=date.today()
+            ),
+        ])
+
+        # Quotes go through save(), which copies each deal's account
         cls.quote1 = Quote.objects.create(
             deal=cls.deal1,
             status=Quote.StatusChoices.DRAFT,
@@ -300,7 +231,7 @@ class QuoteListViewPermissionTest(TestCase):
         cls.quote_list_url = reverse('sales_pipeline:quote-list')
 
     def test_url_and_template(self):
-        self.client.login(username='quote_list_admin', password='password123')
+        self.client.force_login(self.admin_user)
         response = self.client.get(self.quote_list_url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'sales_pipeline/quote_list.html')
@@ -311,20 +242,20 @@ class QuoteListViewPermissionTest(TestCase):
         self.assertRedirects(response, f'{login_url}?next={self.quote_list_url}')
 
     def test_admin_sees_all_quotes(self):
-        self.client.login(username='quote_list_admin', password='password123')
+        self.client.force_login(self.admin_user)
         response = self.client.get(self.quote_list_url)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.context['quotes']), 3)
 
     def test_sales_user_sees_only_own_quotes(self):
-        self.client.login(username='quote_list_sales1', password='password123')
+        self.client.force_login(self.sales_user1)
         response = self.client.get(self.quote_list_url)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.context['quotes']), 1)
         self.assertEqual(response.context['quotes'][0], self.quote1)
 
     def test_manager_sees_own_team_and_territory_quotes(self):
-        self.client.login(username='quote_list_manager', password='password123')
+        self.client.force_login(self.manager_user)
         response = self.client.get(self.quote_list_url)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.context['quotes']), 2)
@@ -333,14 +264,14 @@ class QuoteListViewPermissionTest(TestCase):
         self.assertIn(self.quote1.pk, quote_ids)
 
     def test_invalid_sort_param(self):
-        self.client.login(username='quote_list_admin', password='password123')
+        self.client.force_login(self.admin_user)
         response = self.client.get(self.quote_list_url, {'sort': 'invalid_field'})
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.context['sort_by'], 'quote_id')
         self.assertEqual(response.context['direction'], 'desc')
 
     def test_empty_queryset(self):
-        self.client.login(username='quote_list_empty_sales', password='password123')
+        self.client.force_login(self.empty_sales_user)
         response = self.client.get(self.quote_list_url)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.context['quotes']), 0)
@@ -388,13 +319,13 @@ class DealDetailViewTest(TestCase):
         self.assertRedirects(response, f'{login_url}?next={self.deal1_detail_url}')
 
     def test_detail_view_accessible_by_owner(self):
-        self.client.login(username='deal_detail_owner', password='password123')
+        self.client.force_login(self.owner_user)
         response = self.client.get(self.deal1_detail_url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'sales_pipeline/deal_detail.html')
 
     def test_detail_view_contains_deal_details(self):
-        self.client.login(username='deal_detail_owner', password='password123')
+        self.client.force_login(self.owner_user)
         response = self.client.get(self.deal1_detail_url)
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, self.deal1.name)
@@ -402,12 +333,12 @@ class DealDetailViewTest(TestCase):
         self.assertEqual(response.context['deal'], self.deal1)
 
     def test_detail_view_permission_denied_for_other_user(self):
-        self.client.login(username='deal_detail_other', password='password123')
+        self.client.force_login(self.other_user)
         response = self.client.get(self.deal1_detail_url)
         self.assertEqual(response.status_code, 404)
 
     def test_detail_view_accessible_by_admin(self):
-        self.client.login(username='deal_detail_admin', password='password123')
+        self.client.force_login(self.admin_user)
         response = self.client.get(self.deal1_detail_url)
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, self.deal1.name)
@@ -469,13 +400,13 @@ class QuoteDetailViewTest(TestCase):
         self.assertRedirects(response, f'{login_url}?next={self.quote1_detail_url}')
 
     def test_detail_view_accessible_by_owner(self):
-        self.client.login(username='quote_detail_sales1', password='password123')
+        self.client.force_login(self.sales_user1)
         response = self.client.get(self.quote1_detail_url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'sales_pipeline/quote_detail.html')
 
     def test_detail_view_contains_quote_details(self):
-        self.client.login(username='quote_detail_sales1', password='password123')
+        self.client.force_login(self.sales_user1)
         response = self.client.get(self.quote1_detail_url)
         self.assertEqual(response.status_code, 200)
         self.assertIsNotNone(self.quote1.quote_id)
@@ -484,19 +415,19 @@ class QuoteDetailViewTest(TestCase):
         self.assertEqual(response.context['quote'], self.quote1)
 
     def test_detail_view_permission_denied_for_other_user(self):
-        self.client.login(username='quote_detail_other', password='password123')
+        self.client.force_login(self.sales_user2)
         response = self.client.get(self.quote1_detail_url)
         self.assertEqual(response.status_code, 404)
 
     def test_detail_view_accessible_by_admin(self):
-        self.client.login(username='quote_detail_admin', password='password123')
+        self.client.force_login(self.admin_user)
         response = self.client.get(self.quote1_detail_url)
         self.assertEqual(response.status_code, 200)
         self.assertIsNotNone(self.quote1.quote_id)
         self.assertContains(response, self.quote1.quote_id)
 
     def test_detail_view_accessible_by_manager(self):
-        self.client.login(username='quote_detail_manager', password='password123')
+        self.client.force_login(self.manager_user)
         response = self.client.get(self.quote1_detail_url)
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, self.quote1.quote_id)
@@ -520,11 +451,11 @@ class DealCreateViewTest(TestCase):
             account=cls.test_account,
             assigned_to=cls.test_user
         )
+        cls.create_url = reverse('sales_pipeline:deal-create')
+        cls.list_url = reverse('sales_pipeline:deal-list')
 
     def setUp(self):
-        self.client.login(username='deal_create_user', password='password123')
-        self.create_url = reverse('sales_pipeline:deal-create')
-        self.list_url = reverse('sales_pipeline:deal-list')
+        self.client.force_login(self.test_user)
 
     def test_create_view_get_page_authenticated(self):
         response = self.client.get(self.create_url)
@@ -634,11 +565,11 @@ class QuoteCreateViewTest(TestCase):
             account=cls.test_account,
             assigned_to=cls.test_user
         )
+        cls.create_url = reverse('sales_pipeline:quote-create')
+        cls.list_url = reverse('sales_pipeline:quote-list')
 
     def setUp(self):
-        self.client.login(username='quote_create_user', password='password123')
-        self.create_url = reverse('sales_pipeline:quote-create')
-        self.list_url = reverse('sales_pipeline:quote-list')
+        self.client.force_login(self.test_user)
 
     def test_create_view_get_page_authenticated(self):
         response = self.client.get(self.create_url)
@@ -778,7 +709,7 @@ class DealUpdateViewTest(TestCase):
         cls.list_url = reverse('sales_pipeline:deal-list')
 
     def test_update_view_get_page_as_owner(self):
-        self.client.login(username='deal_update_owner', password='password123')
+        self.client.force_login(self.owner_user)
         response = self.client.get(self.update_url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'sales_pipeline/deal_form.html')
@@ -786,12 +717,12 @@ class DealUpdateViewTest(TestCase):
         self.assertContains(response, 'Update Deal:')
 
     def test_update_view_get_permission_denied_for_other_user(self):
-        self.client.login(username='deal_update_other', password='password123')
+        self.client.force_login(self.other_user)
         response = self.client.get(self.update_url)
         self.assertEqual(response.status_code, 404)
 
     def test_update_deal_success_post_as_owner(self):
-        self.client.login(username='deal_update_owner', password='password123')
+        self.client.force_login(self.owner_user)
         updated_name = "Updated Deal Name by Owner"
         updated_stage = Deal.StageChoices.PROPOSAL
         updated_amount = Decimal('9999.99')
@@ -817,7 +748,7 @@ class DealUpdateViewTest(TestCase):
         self.assertEqual(self.deal_to_update.probability, expected_probability)
 
     def test_update_deal_permission_denied_post_other_user(self):
-        self.client.login(username='deal_update_other', password='password123')
+        self.client.force_login(self.other_user)
         original_name = self.deal_to_update.name
         deal_data = {
             'name': 'Attempted Update Deal',
@@ -888,7 +819,7 @@ class QuoteUpdateViewTest(TestCase):
         cls.list_url = reverse('sales_pipeline:quote-list')
 
     def test_update_view_get_page_as_owner(self):
-        self.client.login(username='quote_update_owner_v2', password='password123')
+        self.client.force_login(self.owner_user)
         response = self.client.get(self.update_url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'sales_pipeline/quote_form.html')
@@ -900,12 +831,12 @@ class QuoteUpdateViewTest(TestCase):
         self.assertContains(response, self.quote_to_update.quote_id)
 
     def test_update_view_get_permission_denied_for_other_user(self):
-        self.client.login(username='quote_update_other_v2', password='password123')
+        self.client.force_login(self.other_user)
         response = self.client.get(self.update_url)
         self.assertEqual(response.status_code, 404)
 
     def test_update_quote_success_post_as_owner(self):
-        self.client.login(username='quote_update_owner_v2', password='password123')
+        self.client.force_login(self.owner_user)
         updated_status = Quote.StatusChoices.PRESENTED
         updated_amount = Decimal('550.00')
         original_account = self.quote_to_update.account
@@ -932,7 +863,7 @@ class QuoteUpdateViewTest(TestCase):
         self.assertNotEqual(self.quote_to_update.account, original_account)
 
     def test_update_quote_missing_required_field(self):
-        self.client.login(username='quote_update_owner_v2', password='password123')
+        self.client.force_login(self.owner_user)
         initial_status = self.quote_to_update.status
         quote_data = {
             'contact': '',
@@ -950,7 +881,7 @@ class QuoteUpdateViewTest(TestCase):
         self.assertTemplateUsed(response, 'sales_pipeline/quote_form.html')
 
     def test_update_quote_invalid_deal_id(self):
-        self.client.login(username='quote_update_owner_v2', password='password123')
+        self.client.force_login(self.owner_user)
         initial_status = self.quote_to_update.status
         quote_data = {
             'deal': 9999,  # Non-existent deal ID
@@ -971,7 +902,7 @@ class QuoteUpdateViewTest(TestCase):
         self.assertTemplateUsed(response, 'sales_pipeline/quote_form.html')
 
     def test_update_quote_deal_no_account(self):
-        self.client.login(username='quote_update_owner_v2', password='password123')
+        self.client.force_login(self.owner_user)
         initial_status = self.quote_to_update.status
         quote_data = {
             'deal': self.other_deal.pk,
@@ -1035,14 +966,14 @@ class DealDeleteViewTest(TestCase):
         self.assertRedirects(response, f'{login_url}?next={self.delete_url}')
 
     def test_delete_view_get_page_as_owner(self):
-        self.client.login(username='deal_delete_owner', password='password123')
+        self.client.force_login(self.owner_user)
         response = self.client.get(self.delete_url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'sales_pipeline/deal_confirm_delete.html')
         self.assertContains(response, self.deal_to_delete.name)
 
     def test_delete_deal_success_post_as_owner(self):
-        self.client.login(username='deal_delete_owner', password='password123')
+        self.client.force_login(self.owner_user)
         initial_deal_count = Deal.objects.count()
         response = self.client.post(self.delete_url)
         self.assertRedirects(response, self.list_url)
@@ -1050,12 +981,12 @@ class DealDeleteViewTest(TestCase):
         self.assertFalse(Deal.objects.filter(pk=self.deal_to_delete.pk).exists())
 
     def test_delete_view_permission_denied_for_other_user(self):
-        self.client.login(username='deal_delete_other', password='password123')
+        self.client.force_login(self.other_user)
         response = self.client.get(self.delete_url)
         self.assertEqual(response.status_code, 404)
 
     def test_delete_deal_accessible_by_admin(self):
-        self.client.login(username='deal_delete_admin', password='password123')
+        self.client.force_login(self.admin_user)
         initial_deal_count = Deal.objects.count()
         response = self.client.post(self.delete_url)
         self.assertRedirects(response, self.list_url)
@@ -1119,14 +1050,14 @@ class QuoteDeleteViewTest(TestCase):
         self.assertRedirects(response, f'{login_url}?next={self.delete_url}')
 
     def test_delete_view_get_page_as_owner(self):
-        self.client.login(username='quote_delete_owner', password='password123')
+        self.client.force_login(self.owner_user)
         response = self.client.get(self.delete_url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'sales_pipeline/quote_confirm_delete.html')
         self.assertContains(response, self.quote_to_delete.quote_id)
 
     def test_delete_quote_success_post_as_owner(self):
-        self.client.login(username='quote_delete_owner', password='password123')
+        self.client.force_login(self.owner_user)
         initial_quote_count = Quote.objects.count()
         response = self.client.post(self.delete_url)
         self.assertRedirects(response, self.list_url)
@@ -1134,12 +1065,12 @@ class QuoteDeleteViewTest(TestCase):
         self.assertFalse(Quote.objects.filter(pk=self.quote_to_delete.pk).exists())
 
     def test_delete_view_permission_denied_for_other_user(self):
-        self.client.login(username='quote_delete_other', password='password123')
+        self.client.force_login(self.other_user)
         response = self.client.get(self.delete_url)
         self.assertEqual(response.status_code, 404)
 
     def test_delete_quote_accessible_by_admin(self):
-        self.client.login(username='quote_delete_admin', password='password123')
+        self.client.force_login(self.admin_user)
         initial_quote_count = Quote.objects.count()
         response = self.client.post(self.delete_url)
         self.assertRedirects(response, self.list_url)
@@ -1147,7 +1078,7 @@ class QuoteDeleteViewTest(TestCase):
         self.assertFalse(Quote.objects.filter(pk=self.quote_to_delete.pk).exists())
 
     def test_delete_quote_accessible_by_manager(self):
-        self.client.login(username='quote_delete_manager', password='password123')
+        self.client.force_login(self.manager_user)
         initial_quote_count = Quote.objects.count()
         response = self.client.post(self.delete_url)
         self.assertRedirects(response, self.list_url)
@@ -1207,7 +1138,7 @@ class DealAutocompleteTest(TestCase):
         self.assertRedirects(response, f'{login_url}?next={self.autocomplete_url}')
 
     def test_sales_user_sees_own_deals(self):
-        self.client.login(username='deal_autocomplete_sales', password='password123')
+        self.client.force_login(self.sales_user)
         response = self.client.get(self.autocomplete_url, {'q': 'Test'})
         self.assertEqual(response.status_code, 200)
         results = response.json()['results']
@@ -1215,10 +1146,7 @@ class DealAutocompleteTest(TestCase):
         self.assertEqual(results[0]['text'], str(self.deal1))
 
     def test_manager_sees_team_deals(self):
-        self.client.login(
-            username='deal_autocomplete_manager',
-            password='password123'
-        )
+        self.client.force_login(self.manager_user)
         response = self.client.get(self.autocomplete_url, {'q': 'Test'})
         self.assertEqual(response.status_code, 200)
         results = response.json()['results']
@@ -1228,7 +1156,7 @@ class DealAutocompleteTest(TestCase):
         self.assertIn(str(self.deal2), deal_names)
 
     def test_admin_sees_all_deals(self):
-        self.client.login(username='deal_autocomplete_admin', password='password123')
+        self.client.force_login(self.admin_user)
         response = self.client.get(self.autocomplete_url, {'q': 'Test'})
         self.assertEqual(response.status_code, 200)
         results = response.json()['results']
@@ -1269,12 +1197,12 @@ class DealExportViewTest(TestCase):
         self.assertRedirects(response, f'{login_url}?next={self.export_url}')
 
     def test_export_view_forbidden_for_non_admin(self):
-        self.client.login(username='deal_export_sales', password='password123')
+        self.client.force_login(self.sales_user)
         response = self.client.get(self.export_url)
         self.assertEqual(response.status_code, 403)
 
     def test_export_view_success_for_admin(self):
-        self.client.login(username='deal_export_admin', password='password123')
+        self.client.force_login(self.admin_user)
         response = self.client.get(self.export_url)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(
@@ -1287,7 +1215,7 @@ class DealExportViewTest(TestCase):
         )
 
         # Parse the Excel file
-        workbook = openpyxl.load_workbook(io.BytesIO(response.content))
+        workbook = openpyxl.load_workbook(io.BytesIO(b''.join(response.streaming_content)))
         worksheet = workbook['Deals']
         # Check headers (row 1)
         headers = [cell.value for cell in worksheet[1]]
@@ -1342,12 +1270,12 @@ class QuoteExportViewTest(TestCase):
         self.assertRedirects(response, f'{login_url}?next={self.export_url}')
 
     def test_export_view_forbidden_for_non_admin(self):
-        self.client.login(username='quote_export_sales', password='password123')
+        self.client.force_login(self.sales_user)
         response = self.client.get(self.export_url)
         self.assertEqual(response.status_code, 403)
 
     def test_export_view_success_for_admin(self):
-        self.client.login(username='quote_export_admin', password='password123')
+        self.client.force_login(self.admin_user)
         response = self.client.get(self.export_url)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(
@@ -1360,7 +1288,7 @@ class QuoteExportViewTest(TestCase):
         )
 
         # Parse the Excel file
-        workbook = openpyxl.load_workbook(io.BytesIO(response.content))
+        workbook = openpyxl.load_workbook(io.BytesIO(b''.join(response.streaming_content)))
         worksheet = workbook['Quotes']
         # Check headers (row 1)
         headers = [cell.value for cell in worksheet[1]]
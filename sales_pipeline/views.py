@@ -6,15 +6,17 @@ from django.views.generic import (
 )
 from django.db.models import Q
 from django.contrib import messages
-from django.http import HttpResponse, HttpResponseForbidden
-from django.utils.timezone import localtime
+from django.http import HttpResponseForbidden
+from django.utils import timezone
 from dal import autocomplete
-import openpyxl
 
 # Import models needed
 from .models import Deal, Quote
 from .forms import DealForm, QuoteForm
 from .filters import DealFilter, QuoteFilter
+from core.exports import (
+    EXPORT_CHUNK_SIZE, EXPORT_DATETIME_FORMAT, user_name_lookup, xlsx_export_response,
+)
 from users.models import CustomUser
 from crm_entities.models import Account, Contact
 
@@ -69,7 +71,7 @@ class DealListView(BaseSalesPipelineView, ListView):
     direction_applied = 'desc'
 
     def get_queryset(self):
-        base_queryset = Deal.objects.all()
+        base_queryset = Deal.objects.for_list()
         queryset = self._filter_queryset_by_role(self.request.user, base_queryset)
 
         filter_params = self.request.GET.copy()
@@ -104,10 +106,7 @@ class DealListView(BaseSalesPipelineView, ListView):
             f'-{self.sort_by_applied}' if self.direction_applied == 'desc'
             else self.sort_by_applied
         )
-        queryset = queryset.order_by(sort_by_final).select_related(
-            'account', 'assigned_to', 'primary_contact'
-        )
-        return queryset
+        return queryset.order_by(sort_by_final)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -213,7 +212,7 @@ class QuoteListView(BaseSalesPipelineView, ListView):
     direction_applied = 'desc'
 
     def get_queryset(self):
-        base_queryset = Quote.objects.all()
+        base_queryset = Quote.objects.for_list()
         queryset = self._filter_queryset_by_role(self.request.user, base_queryset)
 
         filter_params = self.request.GET.copy()
@@ -246,10 +245,7 @@ class QuoteListView(BaseSalesPipelineView, ListView):
             f'-{self.sort_by_applied}' if self.direction_applied == 'desc'
             else self.sort_by_applied
         )
-        queryset = queryset.order_by(sort_by_final).select_related(
-            'account', 'deal', 'assigned_to', 'contact'
-        )
-        return queryset
+        return queryset.order_by(sort_by_final)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -275,7 +271,7 @@ class QuoteDetailView(BaseSalesPipelineView, DetailView):
     def get_queryset(self):
         user = self.request.user
         queryset = super().get_queryset().select_related(
-            'account', 'deal', 'contact', 'assigned_to', 'created_by'
+            'account', 'deal__account', 'contact', 'assigned_to', 'created_by'
         )
         return self._filter_queryset_by_role(user, queryset)
 
@@ -405,7 +401,10 @@ class DealAutocomplete(LoginRequiredMixin, autocomplete.Select2QuerySetView):
                 Q(deal_id__icontains=self.q) |
                 Q(account__name__icontains=self.q)
             ).distinct()
-        return qs.order_by('name')
+        # The label (Deal.__str__) reads account.name; join it instead of a query per result
+        return qs.select_related('account').only(
+            'deal_id', 'name', 'account', 'account__name',
+        ).order_by('name')
 
     def get_result_label(self, item):
         return str(item)
@@ -438,55 +437,50 @@ def deal_export_view(request):
     )
     queryset = queryset.order_by(sort_by_final).select_related(
         'account', 'primary_contact', 'assigned_to', 'created_by'
+    ).only(
+        # Just the columns written below
+        'deal_id', 'name', 'stage', 'amount', 'currency', 'close_date',
+        'probability', 'description', 'created_at', 'updated_at',
+        'account', 'account__name',
+        'primary_contact', 'primary_contact__first_name', 'primary_contact__last_name',
+        'assigned_to', 'assigned_to__first_name', 'assigned_to__last_name', 'assigned_to__username',
+        'created_by', 'created_by__first_name', 'created_by__last_name', 'created_by__username',
     )
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "Deals"
     headers = [
         "Deal ID", "Name", "Account", "Primary Contact", "Stage",
         "Amount", "Currency", "Close Date", "Probability (%)",
         "Description", "Assigned To", "Created By", "Created At",
         "Updated At"
     ]
-    ws.append(headers)
-    for deal in queryset:
-        account_name = deal.account.name if deal.account else ""
-        contact_name = (
-            deal.primary_contact.full_name if deal.primary_contact else ""
-        )
-        assigned_to_name = (
-            deal.assigned_to.get_full_name() or deal.assigned_to.username
-            if deal.assigned_to else ""
-        )
-        created_by_name = (
-            deal.created_by.get_full_name() or deal.created_by.username
-            if deal.created_by else ""
-        )
-        created_at_formatted = (
-            localtime(deal.created_at).strftime('%Y-%m-%d %H:%M:%S')
-            if deal.created_at else ""
-        )
-        updated_at_formatted = (
-            localtime(deal.updated_at).strftime('%Y-%m-%d %H:%M:%S')
-            if deal.updated_at else ""
-        )
-        row = [
-            deal.deal_id or "", deal.name or "", account_name,
-            contact_name, deal.get_stage_display(), deal.amount,
-            deal.currency or "", deal.close_date, deal.probability,
-            deal.description or "", assigned_to_name, created_by_name,
-            created_at_formatted, updated_at_formatted
-        ]
-        ws.append(row)
-    response = HttpResponse(
-        content_type=(
-            'application/vnd.openxmlformats-officedocument.'
-            'spreadsheetml.sheet'
-        )
-    )
-    response['Content-Disposition'] = 'attachment; filename="deals_export.xlsx"'
-    wb.save(response)
-    return response
+    tz = timezone.get_current_timezone()
+    name_of = user_name_lookup()
+
+    def rows():
+        for deal in queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            account_name = deal.account.name if deal.account else ""
+            contact_name = (
+                deal.primary_contact.full_name if deal.primary_contact else ""
+            )
+            assigned_to_name = name_of(deal.assigned_to)
+            created_by_name = name_of(deal.created_by)
+            created_at_formatted = (
+                deal.created_at.astimezone(tz).strftime(EXPORT_DATETIME_FORMAT)
+                if deal.created_at else ""
+            )
+            updated_at_formatted = (
+                deal.updated_at.astimezone(tz).strftime(EXPORT_DATETIME_FORMAT)
+                if deal.updated_at else ""
+            )
+            row = [
+                deal.deal_id or "", deal.name or "", account_name,
+                contact_name, deal.get_stage_display(), deal.amount,
+                deal.currency or "", deal.close_date, deal.probability,
+                deal.description or "", assigned_to_name, created_by_name,
+                created_at_formatted, updated_at_formatted
+            ]
+            yield row
+
+    return xlsx_export_response("Deals", headers, rows(), 'deals_export.xlsx', date_columns=(7,))
 
 
 @login_required
@@ -515,56 +509,51 @@ def quote_export_view(request):
     )
     queryset = queryset.order_by(sort_by_final).select_related(
         'account', 'deal', 'contact', 'assigned_to', 'created_by'
+    ).only(
+        # Just the columns written below
+        'quote_id', 'status', 'total_amount', 'presented_date', 'validity_days',
+        'notes', 'created_at', 'updated_at',
+        'account', 'account__name', 'deal', 'deal__deal_id',
+        'contact', 'contact__first_name', 'contact__last_name',
+        'assigned_to', 'assigned_to__first_name', 'assigned_to__last_name', 'assigned_to__username',
+        'created_by', 'created_by__first_name', 'created_by__last_name', 'created_by__username',
     )
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "Quotes"
     headers = [
         "Quote ID", "Account", "Deal ID", "Contact", "Status",
         "Total Amount", "Presented Date", "Validity (Days)",
         "Expiry Date", "Notes", "Assigned To", "Created By",
         "Created At", "Updated At"
     ]
-    ws.append(headers)
-    for quote in queryset:
-        account_name = quote.account.name if quote.account else ""
-        deal_id_str = (
-            quote.deal.deal_id if quote.deal and quote.deal.deal_id
-            else (quote.deal.pk if quote.deal else "")
-        )
-        contact_name = quote.contact.full_name if quote.contact else ""
-        assigned_to_name = (
-            quote.assigned_to.get_full_name() or quote.assigned_to.username
-            if quote.assigned_to else ""
-        )
-        created_by_name = (
-            quote.created_by.get_full_name() or quote.created_by.username
-            if quote.created_by else ""
-        )
-        created_at_formatted = (
-            localtime(quote.created_at).strftime('%Y-%m-%d %H:%M:%S')
-            if quote.created_at else ""
-        )
-        updated_at_formatted = (
-            localtime(quote.updated_at).strftime('%Y-%m-%d %H:%M:%S')
-            if quote.updated_at else ""
-        )
-        expiry_date_val = quote.expiry_date
-        row = [
-            quote.quote_id or "", account_name, deal_id_str,
-            contact_name, quote.get_status_display(),
-            quote.total_amount, quote.presented_date,
-            quote.validity_days, expiry_date_val, quote.notes or "",
-            assigned_to_name, created_by_name, created_at_formatted,
-            updated_at_formatted
-        ]
-        ws.append(row)
-    response = HttpResponse(
-        content_type=(
-            'application/vnd.openxmlformats-officedocument.'
-            'spreadsheetml.sheet'
-        )
-    )
-    response['Content-Disposition'] = 'attachment; filename="quotes_export.xlsx"'
-    wb.save(response)
-    return response
\ No newline at end of file
+    tz = timezone.get_current_timezone()
+    name_of = user_name_lookup()
+
+    def rows():
+        for quote in queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            account_name = quote.account.name if quote.account else ""
+            deal_id_str = (
+                quote.deal.deal_id if quote.deal and quote.deal.deal_id
+                else (quote.deal.pk if quote.deal else "")
+            )
+            contact_name = quote.contact.full_name if quote.contact else ""
+            assigned_to_name = name_of(quote.assigned_to)
+            created_by_name = name_of(quote.created_by)
+            created_at_formatted = (
+                quote.created_at.astimezone(tz).strftime(EXPORT_DATETIME_FORMAT)
+                if quote.created_at else ""
+            )
+            updated_at_formatted = (
+                quote.updated_at.astimezone(tz).strftime(EXPORT_DATETIME_FORMAT)
+                if quote.updated_at else ""
+            )
+            expiry_date_val = quote.expiry_date
+            row = [
+                quote.quote_id or "", account_name, deal_id_str,
+                contact_name, quote.get_status_display(),
+                quote.total_amount, quote.presented_date,
+                quote.validity_days, expiry_date_val, quote.notes or "",
+                assigned_to_name, created_by_name, created_at_formatted,
+                updated_at_formatted
+            ]
+            yield row
+
+    return xlsx_export_response("Quotes", headers, rows(), 'quotes_export.xlsx', date_columns=(6, 8))
@@ -1,6 +1,7 @@
 # users/models.py
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _ # For translations later if needed
 
 class CustomUser(AbstractUser):
@@ -44,14 +45,15 @@ class CustomUser(AbstractUser):
         return self.get_full_name() or self.username
 
     # Add properties for easy role checking later in templates/views (optional but helpful)
-    @property
+    # Cached per instance: request.user is consulted by every view, scope and template check
+    @cached_property
     def is_admin_role(self):
         return self.role == self.Roles.ADMIN
 
-    @property
+    @cached_property
     def is_manager_role(self):
         return self.role == self.Roles.MANAGER
 
-    @property
+    @cached_property
     def is_sales_role(self):
         return self.role == self.Roles.SALES
\ No newline at end of file
@@ -0,0 +1,22 @@
+# users/tests/_factories.py
+
+from django.contrib.auth.hashers import make_password
+
+from users.models import CustomUser
+
+
+# Hash the shared test password once per test process instead of once per user
+HASHED_PASSWORD = make_password('password123')
+
+
+def fast_user(username, role=CustomUser.Roles.SALES, territory=None, is_superuser=False):
+    """ Builds an unsaved user with the pre-hashed password (for bulk_create) """
+    if is_superuser:
+        # Superuser must have is_staff=True and is_superuser=True
+        return CustomUser(
+            username=username, password=HASHED_PASSWORD, email=f"{username}@example.com",
+            role=CustomUser.Roles.ADMIN, is_staff=True, is_superuser=True
+        )
+    return CustomUser(
+        username=username, password=HASHED_PASSWORD, role=role, territory=territory, email=f"{username}@example.com"
+    )